@@ -40,6 +40,9 @@ DEFAULT_TUTORIAL_EXCLUDE_PATTERNS = {
     "legacy/*", ".git/*", ".github/*", ".next/*", ".vscode/*", "obj/*", "bin/*", "node_modules/*", "*.log"
 }
 
+# Server JSON block printed by the generated MCP server's container logs
+_MCP_SERVER_JSON_RE = re.compile(r'=== BEGIN MCP SERVER JSON ===\s*([\s\S]*?)\s*=== END MCP SERVER JSON ===')
+
 
 def parse_cli_args():
     """Parse command line arguments for both agent and tutorial modes."""
@@ -222,7 +225,7 @@ def run_repo_analysis_agent(args):
                     
                     # If container is running, get logs
                     logs = subprocess.check_output(["docker", "logs", container_id], text=True)
-                    match = re.search(r'=== BEGIN MCP SERVER JSON ===\s*([\s\S]*?)\s*=== END MCP SERVER JSON ===', logs, re.DOTALL)
+                    match = _MCP_SERVER_JSON_RE.search(logs)
                     if match:
                         print("\nMCP Server JSON details:")
                         server_json_str = match.group(1)
@@ -342,7 +345,8 @@ def run_repo_analysis_agent(args):
                 use_web=shared_data.get("use_web", True),
                 use_llm=shared_data.get("use_llm", True),
                 setup_llm_first=(not llm_configured_successfully),
-                threshold=shared_data.get("relevance_threshold", 0.5)
+                threshold=shared_data.get("relevance_threshold", 0.5),
+                early_stop_urls=shared_data.get("early_stop_urls", 25)
             )
             shared_data.update(final_results)
         elif args.query: # Non-interactive, query provided
@@ -663,7 +667,7 @@ def run_tutorial_generation(args):
                             logs = subprocess.check_output(["docker", "logs", container_id], text=True)
                             
                             # Extract JSON details from logs with improved regex
-                            match = re.search(r'=== BEGIN MCP SERVER JSON ===\s*([\s\S]*?)\s*=== END MCP SERVER JSON ===', logs, re.DOTALL)
+                            match = _MCP_SERVER_JSON_RE.search(logs)
                             if match:
                                 print("\nMCP Server JSON details:")
                                 server_json_str = match.group(1)
@@ -843,7 +847,7 @@ def main():
                 logs = subprocess.check_output(["docker", "logs", container_id], text=True)
                 
                 # Extract JSON details from logs with improved regex
-                match = re.search(r'=== BEGIN MCP SERVER JSON ===\s*([\s\S]*?)\s*=== END MCP SERVER JSON ===', logs, re.DOTALL)
+                match = _MCP_SERVER_JSON_RE.search(logs)
                 if match:
                     print("\nMCP Server JSON details:")
                     server_json_str = match.group(1)
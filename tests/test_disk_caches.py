@@ -0,0 +1,173 @@
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.sqlite_cache import SharedCache
+from utils.search_cache import SearchCache
+from utils.llm_cache import DiskLLMCache
+from utils.scrape_cache import ScrapeCache
+
+class DiskCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def row_count(self, path, table):
+        with sqlite3.connect(path) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def corrupt(self, path, table, column, value):
+        with sqlite3.connect(path) as conn:
+            conn.execute(f"UPDATE {table} SET {column} = ?", (value,))
+
+class TestSearchCache(DiskCacheTestCase):
+    def test_hit_and_miss(self):
+        cache = SearchCache(self.path("search.db"))
+        results = [{"title": "PocketFlow", "url": "https://github.com/the-pocket/PocketFlow"}]
+        cache.set("web", "pocketflow", 10, results)
+
+        self.assertEqual(cache.get("web", "pocketflow"), (10, results))
+        self.assertIsNone(cache.get("yt", "pocketflow"))
+        self.assertIsNone(cache.get("web", "other"))
+
+    def test_persists_across_instances(self):
+        SearchCache(self.path("search.db")).set("web", "q", 5, [{"url": "u"}])
+        self.assertEqual(SearchCache(self.path("search.db")).get("web", "q"), (5, [{"url": "u"}]))
+
+    def test_expired_entries_are_missed(self):
+        cache = SearchCache(self.path("search.db"), ttl=0.01)
+        cache.set("web", "q", 5, [{"url": "u"}])
+        time.sleep(0.05)
+        self.assertIsNone(cache.get("web", "q"))
+
+    def test_corrupt_row_is_a_miss(self):
+        cache = SearchCache(self.path("search.db"))
+        cache.set("web", "q", 5, [{"url": "u"}])
+        self.corrupt(self.path("search.db"), "searches", "results", "{not json")
+
+        self.assertIsNone(cache.get("web", "q"))
+
+    def test_unencodable_results_are_not_stored(self):
+        cache = SearchCache(self.path("search.db"))
+        cache.set("web", "q", 5, [{"url": object()}])
+        self.assertIsNone(cache.get("web", "q"))
+
+    def test_clear(self):
+        cache = SearchCache(self.path("search.db"))
+        cache.set("web", "q", 5, [])
+        cache.clear()
+        self.assertIsNone(cache.get("web", "q"))
+
+    def test_expired_entries_are_purged_on_open(self):
+        SearchCache(self.path("search.db"), ttl=0.01).set("web", "q", 5, [{"url": "u"}])
+        time.sleep(0.05)
+
+        SearchCache(self.path("search.db"))
+        self.assertEqual(self.row_count(self.path("search.db"), "searches"), 0)
+
+    def test_corrupt_row_is_deleted(self):
+        cache = SearchCache(self.path("search.db"))
+        cache.set("web", "q", 5, [{"url": "u"}])
+        self.corrupt(self.path("search.db"), "searches", "results", "{not json")
+
+        cache.get("web", "q")
+        self.assertEqual(self.row_count(self.path("search.db"), "searches"), 0)
+
+class TestDiskLLMCache(DiskCacheTestCase):
+    def test_hit_and_expiry(self):
+        cache = DiskLLMCache(self.path("llm.db"))
+        cache.set("key", "response")
+        self.assertEqual(cache.get("key"), "response")
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(DiskLLMCache(self.path("llm.db")).get("key"), "response")
+
+        short = DiskLLMCache(self.path("short.db"), ttl=0.01)
+        short.set("key", "response")
+        time.sleep(0.05)
+        self.assertIsNone(short.get("key"))
+
+    def test_clear(self):
+        cache = DiskLLMCache(self.path("llm.db"))
+        cache.set("key", "response")
+        cache.clear()
+        self.assertIsNone(cache.get("key"))
+
+    def test_opens_database_with_original_schema(self):
+        conn = sqlite3.connect(self.path("old.db"))
+        conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, response TEXT NOT NULL)")
+        conn.execute("INSERT INTO responses VALUES (?, ?, ?)", ("key", time.time() + 60, "old response"))
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(DiskLLMCache(self.path("old.db")).get("key"), "old response")
+
+class TestScrapeCache(DiskCacheTestCase):
+    def test_hit_with_validators(self):
+        cache = ScrapeCache(self.path("scrape.db"))
+        page = {"title": "Page", "content": "text", "github_urls": ["https://github.com/a/b"]}
+        cache.set("https://example.com", page, etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+        entry = cache.get("https://example.com")
+        self.assertEqual(entry["page_data"], page)
+        self.assertTrue(entry["fresh"])
+        self.assertEqual(cache.conditional_headers(entry), {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+        })
+        self.assertIsNone(cache.get("https://example.org"))
+
+    def test_stale_entry_is_kept_for_revalidation(self):
+        cache = ScrapeCache(self.path("scrape.db"), fresh_seconds=0.01)
+        cache.set("https://example.com", {"content": "text"})
+        time.sleep(0.05)
+        self.assertFalse(cache.get("https://example.com")["fresh"])
+
+        cache.touch("https://example.com")
+        self.assertTrue(ScrapeCache(self.path("scrape.db"), fresh_seconds=60).get("https://example.com")["fresh"])
+
+    def test_corrupt_content_is_a_miss_and_deleted(self):
+        cache = ScrapeCache(self.path("scrape.db"))
+        cache.set("https://example.com", {"content": "text"})
+        self.corrupt(self.path("scrape.db"), "pages", "content", b"zgarbage")
+
+        self.assertIsNone(cache.get("https://example.com"))
+        self.assertEqual(self.row_count(self.path("scrape.db"), "pages"), 0)
+
+    def test_unencodable_page_is_not_stored(self):
+        cache = ScrapeCache(self.path("scrape.db"))
+        cache.set("https://example.com", {"content": object()})
+        self.assertIsNone(cache.get("https://example.com"))
+
+class TestSharedCache(DiskCacheTestCase):
+    def test_env_var_relocates_and_disables(self):
+        with mock.patch.dict(os.environ, {"POCKETFLOW_TEST_CACHE": self.path("shared.db")}):
+            shared = SharedCache(SearchCache, "POCKETFLOW_TEST_CACHE", self.path("default.db"))
+            cache = shared.get()
+            self.assertEqual(cache.path, self.path("shared.db"))
+            self.assertIs(shared.get(), cache)
+
+        with mock.patch.dict(os.environ, {"POCKETFLOW_TEST_CACHE": ""}):
+            self.assertIsNone(SharedCache(SearchCache, "POCKETFLOW_TEST_CACHE", self.path("default.db")).get())
+
+    def test_unopenable_cache_is_disabled(self):
+        blocker = self.path("file")
+        Path(blocker).write_text("not a directory")
+        shared = SharedCache(SearchCache, "POCKETFLOW_TEST_CACHE", os.path.join(blocker, "cache.db"))
+        with mock.patch.dict(os.environ):
+            os.environ.pop("POCKETFLOW_TEST_CACHE", None)
+            self.assertIsNone(shared.get())
+
+if __name__ == '__main__':
+    unittest.main()
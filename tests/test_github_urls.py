@@ -0,0 +1,109 @@
+import re
+import sys
+import random
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import github
+from utils.github import GitHubUrlExtractor, extract_github_urls, extract_github_urls_bulk
+
+TEXTS = [
+    "See https://github.com/the-pocket/PocketFlow for details.",
+    "Two repos: github.com/a/b and https://www.github.com/c/d.git/tree/main",
+    "",
+    "Café démo https://github.com/user/repo-é and github.com/x/y",
+    "Ideographic\u3000space github.com/owner/name\u3000github.com/next/repo",
+    "No-break\u00a0space github.com/owner/nbsp\u00a0more",
+    "Vertical\vtab github.com/owner/vt\vgithub.com/after/vt",
+    "Parenthesized (https://github.com/paren/repo) text",
+    "Duplicate github.com/a/b github.com/a/b/issues",
+    "github.com/only-user and github.com/ not a repo",
+]
+
+def fake_hyperscan_starts(data):
+    """Byte offsets of every candidate a Hyperscan scan could report."""
+    text = data.decode('utf-8')
+    starts = {len(text[:match.start()].encode('utf-8')) for match in re.finditer(github._GITHUB_URL_PATTERN, text)}
+    for literal in (b"http", b"www.", b"github.com"):
+        starts.update(match.start() for match in re.finditer(re.escape(literal), data))
+    return sorted(starts)
+
+class TestExtractGithubUrlsBulk(unittest.TestCase):
+    def assertMatchesPerText(self, texts):
+        self.assertEqual(extract_github_urls_bulk(texts), [extract_github_urls(text) for text in texts])
+
+    def test_empty(self):
+        self.assertEqual(extract_github_urls_bulk([]), [])
+
+    def test_re_path(self):
+        with mock.patch.object(github, "_HS_DATABASE", None), \
+             mock.patch.object(github, "RE2_AVAILABLE", False):
+            self.assertMatchesPerText(TEXTS)
+            for text in TEXTS:
+                self.assertMatchesPerText([text])
+
+    def test_hyperscan_offset_conversion(self):
+        # Exercise the byte-to-character offset mapping without Hyperscan itself
+        with mock.patch.object(github, "_HS_DATABASE", object()), \
+             mock.patch.object(github, "_hyperscan_starts", fake_hyperscan_starts):
+            self.assertMatchesPerText(TEXTS)
+            self.assertMatchesPerText(["ascii github.com/a/b", "ascii github.com/c/d"])
+
+    @unittest.skipUnless(github.HYPERSCAN_AVAILABLE, "hyperscan not installed")
+    def test_hyperscan_path(self):
+        self.assertIsNotNone(github._HS_DATABASE)
+        self.assertMatchesPerText(TEXTS)
+
+    @unittest.skipUnless(github.RE2_AVAILABLE, "re2 not installed")
+    def test_re2_path(self):
+        with mock.patch.object(github, "_HS_DATABASE", None):
+            self.assertMatchesPerText(TEXTS)
+
+class TestGitHubUrlExtractor(unittest.TestCase):
+    def extract(self, data, chunk_sizes):
+        extractor = GitHubUrlExtractor()
+        position = 0
+        for size in chunk_sizes:
+            extractor.feed(data[position:position + size])
+            position += size
+        extractor.feed(data[position:])
+        return extractor.close()
+
+    def assertSplitsMatch(self, text):
+        expected = extract_github_urls(text)
+        data = text.encode('utf-8')
+        for split in range(len(data) + 1):
+            self.assertEqual(self.extract(data, [split]), expected, f"split at byte {split}")
+
+    def test_single_chunk(self):
+        for text in TEXTS:
+            self.assertEqual(self.extract(text.encode('utf-8'), []), extract_github_urls(text))
+
+    def test_urls_split_at_every_boundary(self):
+        self.assertSplitsMatch(" ".join(TEXTS))
+
+    def test_long_repository_name(self):
+        self.assertSplitsMatch("start github.com/owner/" + "r" * 150 + " end")
+
+    def test_trailing_path_containing_marker(self):
+        self.assertSplitsMatch("github.com/a/b/blob/github.com/c/d tail github.com/e/f")
+
+    def test_one_byte_chunks(self):
+        text = " ".join(TEXTS)
+        data = text.encode('utf-8')
+        self.assertEqual(self.extract(data, [1] * len(data)), extract_github_urls(text))
+
+    def test_randomized_chunking(self):
+        rng = random.Random(1234)
+        pieces = ["github.com/", "https://", "www.", "a", "b-c", "/", ".git", "_",
+                  " ", ")", "(", "é", "\u3000", "\n", "x.y", "github", ".com"]
+        for _ in range(300):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+            data = text.encode('utf-8')
+            sizes = [rng.randint(1, 8) for _ in range(rng.randint(0, 10))]
+            self.assertEqual(self.extract(data, sizes), extract_github_urls(text), repr(text))
+
+if __name__ == '__main__':
+    unittest.main()
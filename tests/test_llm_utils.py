@@ -0,0 +1,117 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import llm, llm_cache
+from utils.llm import LLMHTTPError, extract_yaml_block
+
+class TestExtractYamlBlock(unittest.TestCase):
+    def test_yaml_fence(self):
+        text = "Intro\n```python\nx = 1\n```\n```yaml\nkey: value\n```\nOutro"
+        self.assertEqual(extract_yaml_block(text), "key: value")
+
+    def test_any_fence(self):
+        self.assertEqual(extract_yaml_block("```\nkey: value\n```"), "key: value")
+
+    def test_unterminated_fence(self):
+        self.assertEqual(extract_yaml_block("```yaml\nkey: value\n"), "key: value")
+
+    def test_no_fence(self):
+        self.assertEqual(extract_yaml_block("key: value"), "key: value")
+
+class TestIterSseData(unittest.TestCase):
+    def events(self, chunks):
+        return list(llm._iter_sse_data(iter(chunks)))
+
+    def test_events_split_across_chunks(self):
+        stream = b'data: {"a": 1}\n\ndata: {"b": 2}\n\ndata: [DONE]\n\n'
+        expected = [b'{"a": 1}', b'{"b": 2}', b"[DONE]"]
+        for split in range(len(stream) + 1):
+            self.assertEqual(self.events([stream[:split], stream[split:]]), expected)
+        self.assertEqual(self.events([bytes([byte]) for byte in stream]), expected)
+
+    def test_crlf_line_endings(self):
+        self.assertEqual(self.events([b"data: one\r\n\r\ndata:two\r\n\r\n"]), [b"one", b"two"])
+
+    def test_multi_line_data_and_skipped_fields(self):
+        stream = b": keep-alive\nevent: message\nid: 1\ndata: first\ndata: second\n\n"
+        self.assertEqual(self.events([stream]), [b"first\nsecond"])
+
+    def test_unterminated_event_is_flushed(self):
+        self.assertEqual(self.events([b"data: one\n\ndata: last\n"]), [b"one", b"last"])
+
+class NamedError(Exception):
+    pass
+
+class RateLimitError(Exception):
+    pass
+
+class GoogleStyleError(Exception):
+    def __init__(self, code):
+        super().__init__(f"code {code}")
+        self.code = code
+
+class TestRetryWithBackoff(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(llm.time, "sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_failing(self, errors, can_retry=lambda: True):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return "ok"
+
+        return llm._retry_with_backoff(fn, can_retry), len(calls)
+
+    def test_transient_errors_are_retried(self):
+        errors = [LLMHTTPError("busy", 503), RateLimitError(), GoogleStyleError(429)]
+        self.assertEqual(self.run_failing(errors), ("ok", 4))
+        self.assertEqual(self.sleep.call_count, 3)
+
+    def test_permanent_errors_are_raised(self):
+        for error in (LLMHTTPError("bad request", 400), NamedError(), GoogleStyleError("INVALID")):
+            with self.assertRaises(type(error)):
+                self.run_failing([error])
+        self.sleep.assert_not_called()
+
+    def test_gives_up_after_max_attempts(self):
+        errors = [LLMHTTPError("busy", 503)] * llm._RETRY_MAX_ATTEMPTS
+        with self.assertRaises(LLMHTTPError):
+            self.run_failing(errors)
+        self.assertEqual(self.sleep.call_count, llm._RETRY_MAX_ATTEMPTS - 1)
+
+    def test_no_retry_once_unsafe(self):
+        with self.assertRaises(LLMHTTPError):
+            self.run_failing([LLMHTTPError("busy", 503)], can_retry=lambda: False)
+
+class TestCachedCallLlm(unittest.TestCase):
+    def setUp(self):
+        llm_cache._LLM_CACHE.clear()
+        self.addCleanup(llm_cache._LLM_CACHE.clear)
+        patcher = mock.patch.object(llm_cache, "get_disk_cache", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_key_includes_generation_options(self):
+        with mock.patch.object(llm_cache, "complete_llm", return_value=("answer", False)) as complete:
+            llm_cache.cached_call_llm("prompt", model="m", max_tokens=100)
+            llm_cache.cached_call_llm("prompt", model="m", max_tokens=100)
+            llm_cache.cached_call_llm("prompt", model="m", max_tokens=200)
+            llm_cache.cached_call_llm("prompt", model="m", max_tokens=100, api_key="other")
+        self.assertEqual(complete.call_count, 2)
+
+    def test_truncated_response_is_not_cached(self):
+        with mock.patch.object(llm_cache, "complete_llm", return_value=("cut off", True)) as complete:
+            self.assertEqual(llm_cache.cached_call_llm("prompt", model="m"), "cut off")
+            llm_cache.cached_call_llm("prompt", model="m")
+        self.assertEqual(complete.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
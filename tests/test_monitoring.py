@@ -0,0 +1,64 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import monitoring
+from utils.monitoring import get_counter, get_all_counters, increment_counter, reset_counter, reset_all_counters
+
+class TestCounters(unittest.TestCase):
+    def setUp(self):
+        reset_all_counters()
+
+    def test_counts_from_threads_are_merged(self):
+        def work():
+            for _ in range(1000):
+                increment_counter("test_hits")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        increment_counter("test_hits", tags={"kind": "tagged"})
+
+        self.assertEqual(get_counter("test_hits"), 4001)
+
+    def test_reset_counter(self):
+        increment_counter("test_a", 3)
+        increment_counter("test_b", 2)
+        reset_counter("test_a")
+        increment_counter("test_a")
+
+        self.assertEqual(get_counter("test_a"), 1)
+        self.assertEqual(get_counter("test_b"), 2)
+
+    def test_reset_leaves_live_shards_to_their_threads(self):
+        # Shards are updated without the lock, so a reset must not write to them
+        counted = threading.Event()
+        reset_done = threading.Event()
+
+        def work():
+            increment_counter("test_live", 5)
+            counted.set()
+            reset_done.wait()
+            increment_counter("test_live")
+
+        worker = threading.Thread(target=work)
+        worker.start()
+        self.addCleanup(reset_done.set)
+        counted.wait()
+        shards = [dict(shard) for shard in monitoring._shards.values()]
+        reset_counter("test_live")
+        reset_all_counters()
+        self.assertEqual([dict(shard) for shard in monitoring._shards.values()], shards)
+        self.assertEqual(get_counter("test_live"), 0)
+
+        reset_done.set()
+        worker.join()
+        self.assertEqual(get_counter("test_live"), 1)
+        self.assertTrue(all(value == 0 for name, value in get_all_counters().items() if name != "test_live"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import search
+from utils.search_cache import SearchCache
+from utils.monitoring import get_counter, reset_all_counters
+
+def make_results(count):
+    return [{"title": f"Result {i}", "url": f"https://example.com/{i}", "snippet": "text"} for i in range(count)]
+
+class SearchCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.disk_cache = SearchCache(str(Path(self.directory) / "search.db"))
+        patcher = mock.patch.object(search, "get_search_cache", return_value=self.disk_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        search._SEARCH_CACHE.clear()
+        self.addCleanup(search._SEARCH_CACHE.clear)
+        reset_all_counters()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+class TestCachedSearch(SearchCacheTestCase):
+    def test_key_ignores_case_whitespace_and_quotes(self):
+        self.assertEqual(search._search_cache_key("web", '  "PocketFlow   Agents" '),
+                         search._search_cache_key("web", "pocketflow agents"))
+
+    def test_smaller_request_is_served_a_prefix(self):
+        key = search._search_cache_key("web", "query")
+        search._store_search(key, 10, make_results(10))
+
+        self.assertEqual(search._cached_search(key, 3), make_results(3))
+        self.assertEqual(get_counter("search_cache_hits"), 1)
+
+    def test_larger_request_misses(self):
+        key = search._search_cache_key("web", "query")
+        search._store_search(key, 10, make_results(10))
+
+        self.assertIsNone(search._cached_search(key, 20))
+        self.assertEqual(get_counter("search_cache_misses"), 1)
+
+    def test_short_list_answers_larger_request(self):
+        # Fewer results than asked for: there is nothing more to find
+        key = search._search_cache_key("web", "query")
+        search._store_search(key, 10, make_results(4))
+
+        self.assertEqual(search._cached_search(key, 20), make_results(4))
+
+    def test_results_are_private_copies(self):
+        key = search._search_cache_key("web", "query")
+        results = make_results(2)
+        search._store_search(key, 10, results)
+        results[0]["title"] = "changed by caller"
+
+        served = search._cached_search(key, 2)
+        self.assertEqual(served, make_results(2))
+        served[1]["title"] = "changed again"
+        self.assertEqual(search._cached_search(key, 2), make_results(2))
+
+    def test_disk_hit_is_promoted_to_memory(self):
+        key = search._search_cache_key("web", "query")
+        self.disk_cache.set(*key, 10, make_results(5))
+
+        self.assertEqual(search._cached_search(key, 5), make_results(5))
+        self.disk_cache.clear()
+        self.assertEqual(search._cached_search(key, 5), make_results(5))
+
+    def test_works_without_disk_cache(self):
+        key = search._search_cache_key("web", "query")
+        with mock.patch.object(search, "get_search_cache", return_value=None):
+            search._store_search(key, 10, make_results(3))
+            self.assertEqual(search._cached_search(key, 3), make_results(3))
+
+    def test_empty_results_are_not_stored(self):
+        key = search._search_cache_key("web", "query")
+        search._store_search(key, 10, [])
+        self.assertIsNone(search._cached_search(key, 1))
+        self.assertIsNone(self.disk_cache.get(*key))
+
+class TestSearchWebCaching(SearchCacheTestCase):
+    def engine_results(self, failing=()):
+        def run_engine(engine_name, query):
+            if engine_name in failing:
+                raise RuntimeError(f"{engine_name} unavailable")
+            return [{"title": f"{engine_name} hit", "url": f"https://{engine_name}.example.com/",
+                     "description": "text"}]
+        return run_engine
+
+    def search(self, run_engine):
+        with mock.patch.object(search, "SEARCH_ENGINES_AVAILABLE", "class"), \
+             mock.patch.object(search, "_run_engine_class", side_effect=run_engine) as engine:
+            results = search.search_web("query", max_results=5)
+        return results, engine.call_count
+
+    def test_short_list_is_cached_when_every_engine_answers(self):
+        results, calls = self.search(self.engine_results())
+        self.assertEqual(len(results), 3)
+        self.assertEqual(calls, 3)
+
+        cached, calls = self.search(self.engine_results())
+        self.assertEqual(cached, results)
+        self.assertEqual(calls, 0)
+
+    def test_short_list_is_not_cached_when_an_engine_fails(self):
+        results, _ = self.search(self.engine_results(failing={"bing"}))
+        self.assertEqual(len(results), 2)
+
+        _, calls = self.search(self.engine_results())
+        self.assertEqual(calls, 3)
+
+if __name__ == '__main__':
+    unittest.main()
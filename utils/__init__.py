@@ -4,7 +4,8 @@ This package provides utilities for LLM integration, search, GitHub API,
 data processing, MCP server integration, and monitoring.
 """
 
-from .llm import call_llm, stream_llm, setup_llm_provider
+from .llm import (call_llm, complete_llm, stream_llm, setup_llm_provider, call_llm_future,
+                  call_llm_async, gather_llm)
 from .search import search_web, search_youtube, check_content_relevance
 from .github import extract_github_urls, check_repository_complexity_and_size, analyze_repository
 from .data_processing import format_for_mcp, generate_implementation_guides_from_analysis, format_repository_list, get_user_selection
@@ -13,7 +14,8 @@ from .monitoring import log_execution_time, configure_logging, increment_counter
 
 __all__ = [
     # LLM integration
-    'call_llm', 'stream_llm', 'setup_llm_provider',
+    'call_llm', 'complete_llm', 'stream_llm', 'setup_llm_provider', 'call_llm_future',
+    'call_llm_async', 'gather_llm',
     
     # Search utilities
     'search_web', 'search_youtube', 'check_content_relevance',
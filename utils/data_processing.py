@@ -6,7 +6,7 @@ import json
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 
-from .llm import call_llm
+from .llm import call_llm, extract_yaml_block, load_yaml
 from .monitoring import log_execution_time
 
 def format_for_mcp(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -98,7 +98,9 @@ def generate_implementation_guides_from_analysis(analysis: Dict[str, Any],
             elif isinstance(file_ref, str):
                 file_references.append(f"- `{file_ref}`")
         
-        # Generate implementation guide using LLM
+        # Generate implementation guide using LLM (joined outside the f-string,
+        # which cannot contain a backslash before Python 3.12)
+        file_list = "\n".join(file_references)
         prompt = f"""
 Create an implementation guide for "{feature_name}" feature based on the repository {repo_name}.
 
@@ -107,7 +109,7 @@ Implementation Score: {feature_details.get('implementation_score', 'N/A')}
 Adaptation Needed: {feature_details.get('adaptation_needed', 'N/A')}
 
 MATCHING FILES:
-{'\n'.join(file_references)}
+{file_list}
 
 USER'S TECH STACK:
 {', '.join(tech_stack)}
@@ -125,19 +127,10 @@ Format your response in YAML with these exact sections.
         response = call_llm(prompt, max_tokens=2000)
         
         # Extract YAML from response
-        yaml_content = ""
-        in_yaml = False
-        
-        for line in response.split('\n'):
-            if line.strip() == '```yaml' or line.strip() == '```':
-                in_yaml = not in_yaml
-                continue
-            if in_yaml:
-                yaml_content += line + '\n'
+        yaml_content = extract_yaml_block(response)
         
         try:
-            import yaml
-            guide_content = yaml.safe_load(yaml_content)
+            guide_content = load_yaml(yaml_content)
             guides[feature_name] = guide_content
         except Exception as e:
             print(f"Error parsing guide for {feature_name}: {str(e)}")
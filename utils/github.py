@@ -4,14 +4,79 @@ GitHub utilities for Repository Analysis to MCP Server system.
 
 import os
 import re
+import logging
 import json
+import copy
+import codecs
 import base64
 import tempfile
 import subprocess
+import threading
+from bisect import bisect_right
+from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 from urllib.parse import urlparse
 
 from .monitoring import log_execution_time
+from .llm_cache import LRUCache
+from .http import get_session
+
+logger = logging.getLogger(__name__)
+
+# Pattern for GitHub repository URLs
+# Matches:
+# - https://github.com/username/repo
+# - http://github.com/username/repo
+# - github.com/username/repo
+_GITHUB_URL_PATTERN = r'(?:https?://)?(?:www\.)?github\.com/([a-zA-Z0-9\-_]+)/([a-zA-Z0-9\-\._]+)(?:/[^\s)]*)?'
+
+# Compiled once at import and shared by every extractor
+GITHUB_URL_RE = re.compile(_GITHUB_URL_PATTERN)
+
+# Check if requests is installed for GitHub API calls
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# Check if Hyperscan is installed for DFA-based bulk URL scanning
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Check if pyre2 is installed as the linear-time fallback for bulk scanning
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Hyperscan only locates candidate starts; the stdlib pattern then extracts
+# the groups from each start, so both paths normalize URLs identically
+_HS_DATABASE = None
+_HS_SCRATCH = threading.local()
+if HYPERSCAN_AVAILABLE:
+    try:
+        _HS_DATABASE = hyperscan.Database()
+        _HS_DATABASE.compile(
+            expressions=[br'(?:https?://)?(?:www\.)?github\.com/[a-zA-Z0-9\-_]+/[a-zA-Z0-9\-\._]'],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST]
+        )
+    except Exception as e:
+        logger.warning("Hyperscan database compilation failed, using regex fallback: %s", e)
+        _HS_DATABASE = None
+
+# Separates texts in the joined bulk buffer; cannot occur inside a URL match
+_BULK_SEPARATOR = "\n\x00\n"
+
+# Whitespace to the re module but not to re2, whose \s is only [\t\n\f\r ];
+# the trailing path of a match would run past it under re2
+_RE2_UNSAFE_WHITESPACE = re.compile(r'[^\S\t\n\f\r ]')
 
 # Module-level token store
 _GITHUB_TOKEN_STORE = {
@@ -36,6 +101,11 @@ def get_github_token() -> Optional[str]:
     """
     return _GITHUB_TOKEN_STORE.get("token")
 
+def _github_headers() -> Dict[str, str]:
+    """API request headers, authenticated with the session token when one is set."""
+    token = get_github_token()
+    return {"Authorization": f"token {token}"} if token else {}
+
 def extract_github_urls(content: Union[str, Dict[str, Any]]) -> List[str]:
     """
     Extracts GitHub repository URLs from text or structured content.
@@ -55,37 +125,224 @@ def extract_github_urls(content: Union[str, Dict[str, Any]]) -> List[str]:
     else:
         text = content
     
-    # Pattern for GitHub repository URLs
-    # Matches:
-    # - https://github.com/username/repo
-    # - http://github.com/username/repo
-    # - github.com/username/repo
-    pattern = r'(?:https?://)?(?:www\.)?github\.com/([a-zA-Z0-9\-_]+)/([a-zA-Z0-9\-\._]+)(?:/[^\s)]*)?'
-    
-    # Find all matches
-    matches = re.findall(pattern, text)
+    # Iterate matches lazily rather than building an intermediate list,
+    # normalizing and deduplicating as they come
+    return _normalize_matches(GITHUB_URL_RE.finditer(text))
+
+def _normalize_matches(matches: Any) -> List[str]:
+    """
+    Normalize and deduplicate GitHub URL regex matches, in match order.
     
-    # Normalize and deduplicate URLs
+    Args:
+        matches: Iterable of match objects for _GITHUB_URL_PATTERN
+        
+    Returns:
+        List of GitHub repository URLs
+    """
     urls = []
     seen = set()
-    
-    for username, repo in matches:
-        # Clean repo name (remove .git extension if present)
-        repo = repo.replace(".git", "")
-        
-        # Normalize URL
-        url = f"https://github.com/{username}/{repo}"
-        
+    for match in matches:
+        username, repo = match.groups()
+        # Clean repo name (remove .git extension if present) and normalize the URL
+        url = f"https://github.com/{username}/{repo.replace('.git', '')}"
         if url not in seen:
             urls.append(url)
             seen.add(url)
-    
     return urls
 
+def _hyperscan_starts(data: bytes) -> List[int]:
+    """
+    Find the start offsets of candidate GitHub URLs with Hyperscan.
+    
+    Args:
+        data: UTF-8 encoded buffer to scan
+        
+    Returns:
+        Sorted, distinct start offsets (in bytes)
+    """
+    scratch = getattr(_HS_SCRATCH, "scratch", None)
+    if scratch is None:
+        # Scratch space is per thread; scraping workers scan concurrently
+        scratch = _HS_SCRATCH.scratch = hyperscan.Scratch(_HS_DATABASE)
+    
+    starts = set()
+    
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        starts.add(start)
+    
+    _HS_DATABASE.scan(data, match_event_handler=on_match, scratch=scratch)
+    return sorted(starts)
+
+def extract_github_urls_bulk(texts: List[str]) -> List[List[str]]:
+    """
+    Extract GitHub repository URLs from many texts in one scan.
+    
+    The texts are joined with a separator and scanned once: with Hyperscan
+    (DFA, SIMD literal prefilter) when installed, else with re2, else with the
+    standard re module. Results match extract_github_urls for each text.
+    
+    Args:
+        texts: Text contents, e.g. page contents or video comments
+        
+    Returns:
+        One list of GitHub repository URLs per input text, in the same order
+    """
+    if not texts:
+        return []
+    
+    joined = _BULK_SEPARATOR.join(texts)
+    
+    # Offsets at which each text begins in the joined buffer
+    offsets = []
+    position = 0
+    for text in texts:
+        offsets.append(position)
+        position += len(text) + len(_BULK_SEPARATOR)
+    
+    if _HS_DATABASE is not None:
+        data = joined.encode('utf-8')
+        byte_starts = _hyperscan_starts(data)
+        
+        # Hyperscan reports byte offsets; convert them to character offsets
+        # incrementally (every match starts on an ASCII character)
+        if len(data) == len(joined):
+            char_starts = byte_starts
+        else:
+            char_starts = []
+            byte_pos = char_pos = 0
+            for start in byte_starts:
+                char_pos += len(data[byte_pos:start].decode('utf-8'))
+                byte_pos = start
+                char_starts.append(char_pos)
+        
+        # Re-anchor the stdlib pattern at each candidate to extract the groups
+        matches = []
+        end = 0
+        for start in char_starts:
+            if start < end:
+                continue  # Inside the previous match, as with finditer
+            match = GITHUB_URL_RE.match(joined, start)
+            if match:
+                matches.append(match)
+                end = match.end()
+    elif RE2_AVAILABLE and not _RE2_UNSAFE_WHITESPACE.search(joined):
+        matches = re2.compile(_GITHUB_URL_PATTERN).finditer(joined)
+    else:
+        matches = GITHUB_URL_RE.finditer(joined)
+    
+    # Group matches back to the text they fall in
+    grouped: List[List[Any]] = [[] for _ in texts]
+    for match in matches:
+        grouped[bisect_right(offsets, match.start()) - 1].append(match)
+    
+    return [_normalize_matches(group) for group in grouped]
+
+class GitHubUrlExtractor:
+    """
+    Incrementally extract GitHub repository URLs from a byte stream.
+    
+    Chunks are fed as they arrive from the network and decoded as UTF-8. Each
+    chunk is scanned with the same pattern as extract_github_urls; a match
+    that may still grow, or a candidate cut off by the end of the chunk, is
+    carried into the next one, so the URLs found are exactly those of
+    extract_github_urls on the whole decoded stream.
+    """
+    
+    # Shared with extract_github_urls, so both normalize URLs the same way
+    _PATTERN = GITHUB_URL_RE
+    # A candidate cut off by the end of the buffer; a later chunk may complete it
+    _PARTIAL = re.compile(r'github\.com(?:/[a-zA-Z0-9\-_]*(?:/[a-zA-Z0-9\-\._]*)?)?\Z')
+    # Ends the optional trailing path of a match
+    _PATH_END = re.compile(r'[\s)]')
+    _MARKER = 'github.com'
+    
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._tail = ''
+        self._in_path = False
+        self._seen = set()
+        self.urls: List[str] = []
+    
+    def feed(self, chunk: bytes) -> None:
+        """
+        Scan the next chunk of the stream.
+        
+        Args:
+            chunk: Raw bytes that follow the previously fed chunk
+        """
+        self._tail = self._scan(self._tail + self._decoder.decode(chunk), final=False)
+    
+    def close(self) -> List[str]:
+        """
+        Scan whatever is left of the stream.
+        
+        Returns:
+            All GitHub repository URLs found, in stream order
+        """
+        self._scan(self._tail + self._decoder.decode(b'', final=True), final=True)
+        self._tail = ''
+        return self.urls
+    
+    def _scan(self, buffer: str, final: bool) -> str:
+        """
+        Record the settled matches in buffer.
+        
+        Args:
+            buffer: Carried text followed by the newly decoded text
+            final: Whether the stream ends with this buffer
+            
+        Returns:
+            Text to carry into the next chunk
+        """
+        pos = 0
+        if self._in_path:
+            # Still inside the previous match's trailing path, which finditer
+            # would have consumed
+            path_end = self._PATH_END.search(buffer)
+            if path_end is None:
+                return ''
+            self._in_path = False
+            pos = path_end.start()
+        
+        if buffer.find(self._MARKER, pos) != -1:
+            for match in self._PATTERN.finditer(buffer, pos):
+                if not final and match.end(2) == len(buffer):
+                    # The repository name may continue in the next chunk
+                    return buffer[match.start():]
+                self._record(match)
+                pos = match.end()
+                if not final and pos == len(buffer) and pos > match.end(2):
+                    # The trailing path may continue in the next chunk
+                    self._in_path = True
+                    return ''
+        
+        if final:
+            return ''
+        # Keep anything that could still become a match: a cut-off candidate,
+        # or a marker split across the chunk boundary
+        carry_from = len(buffer) - len(self._MARKER) + 1
+        partial = self._PARTIAL.search(buffer, pos)
+        if partial:
+            carry_from = min(carry_from, partial.start())
+        return buffer[max(pos, carry_from):]
+    
+    def _record(self, match: Any) -> None:
+        """Normalize a match like extract_github_urls and keep it if new."""
+        username, repo = match.groups()
+        url = f"https://github.com/{username}/{repo.replace('.git', '')}"
+        if url not in self._seen:
+            self._seen.add(url)
+            self.urls.append(url)
+
+# Repository metrics keyed on (lowercased URL, min_stars); the same repository
+# is often assessed for several sources, queries or feature lists
+_REPO_METRICS_CACHE = LRUCache(maxsize=1024, ttl=3600.0)
+
 @log_execution_time("repo_quality_check")
 def check_repository_complexity_and_size(repo_url: str, min_stars: int = 10) -> Dict[str, Any]:
     """
     Evaluates repository quality, complexity metrics, and code size.
+    Successful lookups are cached per repository for an hour.
     
     Args:
         repo_url: GitHub repository URL
@@ -94,6 +351,18 @@ def check_repository_complexity_and_size(repo_url: str, min_stars: int = 10) ->
     Returns:
         Repository quality and size metrics
     """
+    cache_key = (repo_url.rstrip('/').lower(), min_stars)
+    cached = _REPO_METRICS_CACHE.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    
+    metrics = _check_repository_complexity_and_size(repo_url, min_stars)
+    if "error" not in metrics:
+        _REPO_METRICS_CACHE.set(cache_key, copy.deepcopy(metrics))
+    return metrics
+
+def _check_repository_complexity_and_size(repo_url: str, min_stars: int) -> Dict[str, Any]:
+    """Uncached implementation of check_repository_complexity_and_size."""
     # Ensure GitHub token is available
     ensure_github_token()
     
@@ -106,22 +375,14 @@ def check_repository_complexity_and_size(repo_url: str, min_stars: int = 10) ->
     
     username, repo_name = path_parts[0], path_parts[1]
     
-    try:
-        import requests
-    except ImportError:
+    if not REQUESTS_AVAILABLE:
         raise ImportError("Please install requests: pip install requests")
     
-    # Get GitHub token from session store
-    github_token = get_github_token()
-    
-    # Set up headers with token if available
-    headers = {}
-    if github_token:
-        headers["Authorization"] = f"token {github_token}"
+    headers = _github_headers()
     
     # Get repository metadata
     api_url = f"https://api.github.com/repos/{username}/{repo_name}"
-    response = requests.get(api_url, headers=headers)
+    response = get_session().get(api_url, headers=headers)
     
     if response.status_code != 200:
         return {
@@ -140,12 +401,12 @@ def check_repository_complexity_and_size(repo_url: str, min_stars: int = 10) ->
     
     # Get languages
     languages_url = f"https://api.github.com/repos/{username}/{repo_name}/languages"
-    lang_response = requests.get(languages_url, headers=headers)
+    lang_response = get_session().get(languages_url, headers=headers)
     languages = lang_response.json() if lang_response.status_code == 200 else {}
     
     # Get file structure for LOC estimation
     contents_url = f"https://api.github.com/repos/{username}/{repo_name}/git/trees/master?recursive=1"
-    contents_response = requests.get(contents_url, headers=headers)
+    contents_response = get_session().get(contents_url, headers=headers)
     
     file_count = 0
     if contents_response.status_code == 200:
@@ -170,7 +431,6 @@ def check_repository_complexity_and_size(repo_url: str, min_stars: int = 10) ->
         size_score = 1
     
     # Recent activity score
-    from datetime import datetime
     last_update_date = datetime.strptime(last_update, "%Y-%m-%dT%H:%M:%SZ")
     days_since_update = (datetime.now() - last_update_date).days
     
@@ -230,22 +490,14 @@ def analyze_repository(repo_url: str) -> Dict[str, Any]:
     
     username, repo_name = path_parts[0], path_parts[1]
     
-    try:
-        import requests
-    except ImportError:
+    if not REQUESTS_AVAILABLE:
         raise ImportError("Please install requests: pip install requests")
     
-    # Get GitHub token from session store
-    github_token = get_github_token()
-    
-    # Set up headers with token if available
-    headers = {}
-    if github_token:
-        headers["Authorization"] = f"token {github_token}"
+    headers = _github_headers()
     
     # Get repository metadata
     api_url = f"https://api.github.com/repos/{username}/{repo_name}"
-    response = requests.get(api_url, headers=headers)
+    response = get_session().get(api_url, headers=headers)
     
     if response.status_code != 200:
         return {
@@ -256,7 +508,7 @@ def analyze_repository(repo_url: str) -> Dict[str, Any]:
     
     # Get README content
     readme_url = f"https://api.github.com/repos/{username}/{repo_name}/readme"
-    readme_response = requests.get(readme_url, headers=headers)
+    readme_response = get_session().get(readme_url, headers=headers)
     
     readme_content = ""
     if readme_response.status_code == 200:
@@ -267,7 +519,7 @@ def analyze_repository(repo_url: str) -> Dict[str, Any]:
     
     # Get file structure
     contents_url = f"https://api.github.com/repos/{username}/{repo_name}/git/trees/master?recursive=1"
-    contents_response = requests.get(contents_url, headers=headers)
+    contents_response = get_session().get(contents_url, headers=headers)
     
     file_structure = {}
     if contents_response.status_code == 200:
@@ -293,7 +545,7 @@ def analyze_repository(repo_url: str) -> Dict[str, Any]:
     
     # Get language breakdown
     languages_url = f"https://api.github.com/repos/{username}/{repo_name}/languages"
-    lang_response = requests.get(languages_url, headers=headers)
+    lang_response = get_session().get(languages_url, headers=headers)
     languages = lang_response.json() if lang_response.status_code == 200 else {}
     
     # Get key files
@@ -315,7 +567,7 @@ def analyze_repository(repo_url: str) -> Dict[str, Any]:
     
     for file in key_files:
         file_url = f"https://api.github.com/repos/{username}/{repo_name}/contents/{file}"
-        file_response = requests.get(file_url, headers=headers)
+        file_response = get_session().get(file_url, headers=headers)
         
         if file_response.status_code == 200:
             file_data = file_response.json()
@@ -403,22 +655,14 @@ def analyze_repository_metadata(repo_url: str) -> Dict[str, Any]:
     
     username, repo_name = path_parts[0], path_parts[1]
     
-    try:
-        import requests
-    except ImportError:
+    if not REQUESTS_AVAILABLE:
         raise ImportError("Please install requests: pip install requests")
     
-    # Get GitHub token from session store
-    github_token = get_github_token()
-    
-    # Set up headers with token if available
-    headers = {}
-    if github_token:
-        headers["Authorization"] = f"token {github_token}"
+    headers = _github_headers()
     
     # Get repository metadata
     api_url = f"https://api.github.com/repos/{username}/{repo_name}"
-    response = requests.get(api_url, headers=headers)
+    response = get_session().get(api_url, headers=headers)
     
     if response.status_code != 200:
         return {
@@ -437,7 +681,7 @@ def analyze_repository_metadata(repo_url: str) -> Dict[str, Any]:
     
     # Get file structure to analyze content
     contents_url = f"https://api.github.com/repos/{username}/{repo_name}/git/trees/master?recursive=1"
-    contents_response = requests.get(contents_url, headers=headers)
+    contents_response = get_session().get(contents_url, headers=headers)
     
     file_count = 0
     has_images = False
@@ -464,7 +708,7 @@ def analyze_repository_metadata(repo_url: str) -> Dict[str, Any]:
     
     # Get languages
     languages_url = f"https://api.github.com/repos/{username}/{repo_name}/languages"
-    lang_response = requests.get(languages_url, headers=headers)
+    lang_response = get_session().get(languages_url, headers=headers)
     languages = lang_response.json() if lang_response.status_code == 200 else {}
     
     # Evaluate maintenance status based on:
@@ -472,7 +716,6 @@ def analyze_repository_metadata(repo_url: str) -> Dict[str, Any]:
     # 2. Ratio of open issues to stars
     # 3. Recent commits
     
-    from datetime import datetime
     last_update_date = datetime.strptime(last_update, "%Y-%m-%dT%H:%M:%SZ")
     days_since_update = (datetime.now() - last_update_date).days
     
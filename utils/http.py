@@ -0,0 +1,67 @@
+"""
+Shared HTTP sessions for Repository Analysis to MCP Server system.
+
+Keep-alive connection pools are reused across calls, so repeated requests to
+the same host (GitHub, LLM provider APIs, scraped sites) skip the TCP and TLS
+handshakes.
+"""
+
+import threading
+from typing import Dict, Optional
+
+# Check if requests is installed
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+def create_session(pool_connections: int = 32, pool_maxsize: int = 64,
+                   retries: int = 2, backoff_factor: float = 0.3,
+                   headers: Optional[Dict[str, str]] = None) -> "requests.Session":
+    """
+    Create a requests session with a large keep-alive pool.
+
+    Only connection-level failures are retried here; callers decide how to
+    handle HTTP error statuses.
+
+    Args:
+        pool_connections: Number of per-host pools to keep
+        pool_maxsize: Connections kept alive per host
+        retries: Retries of connection-level failures
+        backoff_factor: Backoff factor between those retries
+        headers: Default headers sent with every request
+
+    Returns:
+        Configured requests.Session
+    """
+    if not REQUESTS_AVAILABLE:
+        raise ImportError("Please install requests: pip install requests")
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                          max_retries=Retry(total=retries, backoff_factor=backoff_factor))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session() -> "requests.Session":
+    """
+    Get the process-wide session, creating it on first use.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = create_session()
+    return _SESSION
@@ -4,12 +4,329 @@ LLM integration utilities for Repository Analysis to MCP Server system.
 
 import os
 import json
+import time
+import asyncio
 import yaml
+import random
+import threading
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
-from typing import Dict, List, Any, Optional, Callable, Union, Tuple
+from typing import Dict, List, Any, Optional, Callable, Union, Tuple, Iterator
 
-# Global configuration storage
-_CURRENT_CONFIG = {}
+from .monitoring import increment_counter
+from .http import get_session
+
+# Provider SDKs are optional; each is checked when its provider is used
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None
+
+try:
+    from anthropic import Anthropic
+except ImportError:
+    Anthropic = None
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+# Check if httpx is installed for pooled HTTP/streaming requests
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 support in httpx needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Prefer orjson for decoding streamed events (both accept raw bytes), fall back to the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Parse YAML with the libyaml C extension when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Environment variables holding each provider's API key
+_API_KEY_ENV_VARS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "google": "GOOGLE_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY"
+}
+
+# Cheap endpoints used to open pooled connections ahead of the first call.
+# Google is absent: the genai SDK opens its own connections, so warming a
+# pool it never uses would only add startup requests
+_PREWARM_URLS = {
+    "openai": "https://api.openai.com/v1/models",
+    "anthropic": "https://api.anthropic.com/v1/models",
+    "openrouter": "https://openrouter.ai/api/v1/models"
+}
+
+# Retry policy for transient provider failures
+_RETRY_MAX_ATTEMPTS = 5
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 60.0
+_RETRY_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+# Matched by class name so optional SDKs need not be imported
+_TRANSIENT_ERROR_NAMES = {
+    "RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError",
+    "ConnectError", "ConnectTimeout", "ReadTimeout", "RemoteProtocolError",
+    "ConnectionError", "Timeout", "ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded",
+    "TooManyRequests"
+}
+
+class LLMHTTPError(ValueError):
+    """Raised when a raw HTTP provider request returns a non-200 status."""
+    
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+@dataclass(frozen=True)
+class LLMConfig:
+    """Immutable provider/model selection shared by call_llm and stream_llm."""
+    __slots__ = ("provider", "api_key", "model")
+    provider: str
+    api_key: str
+    model: str
+    
+    def __repr__(self) -> str:
+        # Keep the API key out of logs and tracebacks
+        return f"LLMConfig(provider={self.provider!r}, model={self.model!r})"
+
+# Global configuration storage, replaced wholesale (never mutated) on change
+_CURRENT_CONFIG: Optional[LLMConfig] = None
+
+def get_current_config() -> Optional[LLMConfig]:
+    """
+    Get the active LLM configuration.
+    
+    Returns:
+        The current LLMConfig, or None if no provider has been set up yet
+    """
+    return _CURRENT_CONFIG
+
+# Worker pool for LLM calls scheduled ahead of when their results are needed
+_LLM_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_LLM_EXECUTOR_LOCK = threading.Lock()
+_LLM_EXECUTOR_WORKERS = 8
+
+# Shared keep-alive HTTP client, created on first use
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+def _get_http_client() -> "httpx.Client":
+    """
+    Get the shared pooled HTTP client, creating it on first use.
+    
+    Returns:
+        A keep-alive httpx client (HTTP/2 when h2 is installed)
+    """
+    global _HTTP_CLIENT
+    
+    if not HTTPX_AVAILABLE:
+        raise ImportError("httpx is required for this provider. Install with: pip install httpx")
+    
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                _HTTP_CLIENT = httpx.Client(
+                    http2=H2_AVAILABLE,
+                    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                    timeout=httpx.Timeout(60, connect=10)
+                )
+    return _HTTP_CLIENT
+
+def _require_requests() -> None:
+    """Raise a clear error when the requests package is missing."""
+    if requests is None:
+        raise RuntimeError("requests package is not installed. Please install it with 'pip install requests'")
+
+def _sdk_http_kwargs() -> Dict[str, Any]:
+    """
+    Keyword arguments for the OpenAI/Anthropic SDK clients.
+    
+    The clients share the pooled HTTP client, and their built-in retries are
+    turned off so _retry_with_backoff is the only retry layer (otherwise every
+    attempt of ours would itself be retried by the SDK).
+    
+    Returns:
+        ``max_retries=0``, plus ``http_client`` when httpx is available
+    """
+    kwargs: Dict[str, Any] = {"max_retries": 0}
+    if HTTPX_AVAILABLE:
+        kwargs["http_client"] = _get_http_client()
+    return kwargs
+
+@lru_cache(maxsize=8)
+def _get_openai_client(api_key: str):
+    """
+    Get a cached OpenAI client for the API key.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        OpenAI client sharing the pooled HTTP connection
+    """
+    if OpenAI is None:
+        raise RuntimeError("OpenAI package is not installed. Please install it with 'pip install openai'")
+    return OpenAI(api_key=api_key, **_sdk_http_kwargs())
+
+@lru_cache(maxsize=8)
+def _get_anthropic_client(api_key: str):
+    """
+    Get a cached Anthropic client for the API key.
+    
+    Args:
+        api_key: Anthropic API key
+        
+    Returns:
+        Anthropic client sharing the pooled HTTP connection
+    """
+    if Anthropic is None:
+        raise RuntimeError("Anthropic package is not installed. Please install it with 'pip install anthropic'")
+    return Anthropic(api_key=api_key, **_sdk_http_kwargs())
+
+def _prewarm_connections(provider: str, connections: int = 4) -> None:
+    """
+    Open pooled connections to the provider in the background.
+    
+    The TCP/TLS handshakes overlap with the user's think time instead of
+    delaying the first real LLM call. Failures are ignored.
+    
+    Args:
+        provider: The LLM provider name
+        connections: Number of parallel connections to open
+    """
+    url = _PREWARM_URLS.get(provider)
+    if not url:
+        return
+    
+    # Warm the pool the provider's calls actually use: the SDK clients share
+    # the httpx client, OpenRouter goes through the requests session
+    if provider == "openrouter":
+        if requests is None:
+            return
+        head = get_session().head
+    elif HTTPX_AVAILABLE:
+        head = _get_http_client().head
+    else:
+        return
+    
+    def _head():
+        try:
+            head(url)
+        except Exception:
+            pass  # Pre-warming is best effort
+    
+    for _ in range(connections):
+        threading.Thread(target=_head, daemon=True).start()
+
+def _build_messages(prompt: str, static_prefix: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Build chat messages, placing the static (cacheable) prefix first.
+    
+    OpenAI and OpenRouter apply automatic prefix caching, so keeping the shared
+    instructions in a leading system message lets repeat calls reuse them.
+    
+    Args:
+        prompt: The variable part of the prompt
+        static_prefix: Optional static context shared across calls
+        
+    Returns:
+        List of chat messages
+    """
+    if static_prefix:
+        return [
+            {"role": "system", "content": static_prefix},
+            {"role": "user", "content": prompt}
+        ]
+    return [{"role": "user", "content": prompt}]
+
+def _anthropic_system(static_prefix: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the Anthropic ``system`` kwarg marking the static prefix as cacheable.
+    
+    Args:
+        static_prefix: Optional static context shared across calls
+        
+    Returns:
+        Keyword arguments to pass to ``messages.create``
+    """
+    if not static_prefix:
+        return {}
+    return {
+        "system": [{
+            "type": "text",
+            "text": static_prefix,
+            "cache_control": {"type": "ephemeral"}
+        }]
+    }
+
+def _is_transient_error(error: Exception) -> bool:
+    """
+    Check whether a provider error is worth retrying (rate limits, timeouts, 5xx).
+    
+    Args:
+        error: The exception raised by the provider call
+        
+    Returns:
+        True if the call may succeed when retried
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        # google-api-core errors carry the HTTP status as an int code
+        code = getattr(error, "code", None)
+        status = code if isinstance(code, int) else None
+    if status in _RETRY_STATUS_CODES:
+        return True
+    return type(error).__name__ in _TRANSIENT_ERROR_NAMES
+
+def _retry_with_backoff(fn: Callable[[], str], can_retry: Callable[[], bool] = lambda: True) -> str:
+    """
+    Run a provider call, retrying transient failures with exponential backoff and full jitter.
+    
+    Args:
+        fn: Zero-argument function performing the call
+        can_retry: Returns False once retrying is no longer safe (e.g. tokens already streamed)
+        
+    Returns:
+        The result of fn
+    """
+    for attempt in range(_RETRY_MAX_ATTEMPTS):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == _RETRY_MAX_ATTEMPTS - 1 or not _is_transient_error(e) or not can_retry():
+                raise
+            delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+            increment_counter("llm_retries")
+            time.sleep(delay)
 
 def choose_provider() -> str:
     """
@@ -50,14 +367,7 @@ def get_api_key(provider: str) -> str:
     Returns:
         The API key
     """
-    env_var_map = {
-        "openai": "OPENAI_API_KEY",
-        "anthropic": "ANTHROPIC_API_KEY",
-        "google": "GOOGLE_API_KEY",
-        "openrouter": "OPENROUTER_API_KEY"
-    }
-    
-    env_var = env_var_map.get(provider)
+    env_var = _API_KEY_ENV_VARS.get(provider)
     if not env_var:
         raise ValueError(f"Unknown provider: {provider}")
     
@@ -84,14 +394,12 @@ def verify_api_key(provider: str, api_key: str) -> bool:
     """
     try:
         if provider == "openai":
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = _get_openai_client(api_key)
             # Simple API call to verify the key
             client.models.list()
             
         elif provider == "anthropic":
-            from anthropic import Anthropic
-            client = Anthropic(api_key=api_key)
+            client = _get_anthropic_client(api_key)
             # Simple API call to verify the key
             client.messages.create(
                 model="claude-3-haiku-20240307",
@@ -100,19 +408,18 @@ def verify_api_key(provider: str, api_key: str) -> bool:
             )
             
         elif provider == "google":
-            try:
-                import google.generativeai as genai
+            if genai is not None:
                 genai.configure(api_key=api_key)
                 # Simple API call to verify the key
                 genai.list_models()
-            except ImportError:
+            else:
                 # If Google Generative AI package is not available, make a simple HTTP request
-                import requests
+                _require_requests()
                 headers = {
                     "Content-Type": "application/json",
                     "Authorization": f"Bearer {api_key}"
                 }
-                response = requests.get(
+                response = get_session().get(
                     "https://generativelanguage.googleapis.com/v1/models",
                     headers=headers
                 )
@@ -120,12 +427,12 @@ def verify_api_key(provider: str, api_key: str) -> bool:
                     raise ValueError(f"API key validation failed with status code: {response.status_code}")
                 
         elif provider == "openrouter":
-            import requests
+            _require_requests()
             headers = {
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json"
             }
-            response = requests.get("https://openrouter.ai/api/v1/models", headers=headers)
+            response = get_session().get("https://openrouter.ai/api/v1/models", headers=headers)
             if response.status_code != 200:
                 raise ValueError(f"API key validation failed with status code: {response.status_code}")
             
@@ -151,8 +458,7 @@ def list_available_models(provider: str, api_key: str) -> List[Dict[str, Any]]:
     """
     try:
         if provider == "openai":
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = _get_openai_client(api_key)
             models = client.models.list()
             # Return all available models without filtering
             return [
@@ -184,7 +490,8 @@ def list_available_models(provider: str, api_key: str) -> List[Dict[str, Any]]:
             ]
             
             try:
-                import google.generativeai as genai
+                if genai is None:
+                    raise ImportError("google-generativeai is not installed")
                 genai.configure(api_key=api_key)
                 
                 # Get available models from Google Generative AI
@@ -216,12 +523,12 @@ def list_available_models(provider: str, api_key: str) -> List[Dict[str, Any]]:
                 return fallback_models
                 
         elif provider == "openrouter":
-            import requests
+            _require_requests()
             headers = {
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json"
             }
-            response = requests.get("https://openrouter.ai/api/v1/models", headers=headers)
+            response = get_session().get("https://openrouter.ai/api/v1/models", headers=headers)
             if response.status_code != 200:
                 raise ValueError(f"Failed to fetch models from OpenRouter: {response.status_code}")
                 
@@ -261,6 +568,37 @@ def list_available_models(provider: str, api_key: str) -> List[Dict[str, Any]]:
         
         return fallback_models.get(provider, [])
 
+def extract_yaml_block(text: str) -> str:
+    """
+    Get the YAML payload of an LLM response.
+    
+    Args:
+        text: LLM response text
+        
+    Returns:
+        The contents of the first ```yaml fence, else of the first fence of
+        any kind, else the whole response
+    """
+    # partition stops at the first marker; an unterminated fence runs to the end
+    for opening in ("```yaml", "```"):
+        _, found, rest = text.partition(opening)
+        if found:
+            block, _, _ = rest.partition("```")
+            return block.strip()
+    return text
+
+def load_yaml(text: str) -> Any:
+    """
+    Parse YAML from an LLM response with the fastest available safe loader.
+    
+    Args:
+        text: YAML text
+        
+    Returns:
+        The parsed document
+    """
+    return yaml.load(text, Loader=_YamlLoader)
+
 def extract_keywords_and_techstack(query: str, model: Optional[str] = None, provider: Optional[str] = None) -> Dict[str, Any]:
     """
     Extracts relevant keywords, tech stack, and context from user queries.
@@ -308,15 +646,10 @@ context: A brief description of the overall goal
     
     try:
         # Extract YAML part from response
-        yaml_str = result
-        if "```yaml" in result:
-            yaml_str = result.split("```yaml")[1].split("```")[0].strip()
-        elif "```" in result:
-            yaml_str = result.split("```")[1].split("```")[0].strip()
+        yaml_str = extract_yaml_block(result)
         
         # Parse YAML
-        import yaml
-        parsed_data = yaml.safe_load(yaml_str)
+        parsed_data = load_yaml(yaml_str)
         
         # Ensure all required fields exist
         parsed_data["original_query"] = query
@@ -418,15 +751,10 @@ implementation_guide:
     
     try:
         # Extract YAML part from response
-        yaml_str = result
-        if "```yaml" in result:
-            yaml_str = result.split("```yaml")[1].split("```")[0].strip()
-        elif "```" in result:
-            yaml_str = result.split("```")[1].split("```")[0].strip()
+        yaml_str = extract_yaml_block(result)
         
         # Parse YAML
-        import yaml
-        analysis = yaml.safe_load(yaml_str)
+        analysis = load_yaml(yaml_str)
         
         # Add the original query and repository data for reference
         analysis["keywords"] = keywords
@@ -558,6 +886,9 @@ def setup_llm_provider() -> Tuple[str, str, str]:
     model = choose_model(models)
     print(f"\nSelected model: {model}")
     
+    # Warm up connections before the first real call
+    _prewarm_connections(provider)
+    
     # Return the selected provider, API key, and model
     return provider, api_key, model
 
@@ -605,63 +936,50 @@ def setup_llm_provider_with_params(provider=None, model=None, api_key=None) -> T
     print(f"Using model: {model}")
     
     # Update configuration
-    _CURRENT_CONFIG = {
-        "provider": provider,
-        "api_key": api_key,
-        "model": model
-    }
+    _CURRENT_CONFIG = LLMConfig(provider, api_key, model)
+    
+    # Warm up connections before the first real call
+    _prewarm_connections(provider)
     
     return provider, api_key, model
 
-def call_llm(prompt: str, model: Optional[str] = None, 
-             provider: Optional[str] = None, api_key: Optional[str] = None,
-             temperature: float = 0.7, max_tokens: Optional[int] = None) -> str:
+def _resolve_config(provider: Optional[str], api_key: Optional[str],
+                    model: Optional[str]) -> Tuple[str, str, str]:
     """
-    Call an LLM with the given prompt.
+    Fill in missing call parameters from the current configuration.
     
     Args:
-        prompt: The prompt to send to the LLM
-        model: The model to use (if None, will use a default or last configured model)
-        provider: The provider to use (if None, will use a default or last configured provider)
-        api_key: The API key to use (if None, will use a default or last configured API key)
-        temperature: Controls randomness (lower is more deterministic)
-        max_tokens: Maximum number of tokens to generate
+        provider: Explicit provider, or None
+        api_key: Explicit API key, or None
+        model: Explicit model, or None
         
     Returns:
-        The LLM's response text
+        Tuple of (provider, api_key, model)
     """
     global _CURRENT_CONFIG
+    config = _CURRENT_CONFIG
     
     # Use configured values if not provided
     if not provider and not model and not api_key:
-        if not _CURRENT_CONFIG:
+        if config is None:
             # If no configuration exists, prompt the user to set one up
             try:
                 provider, api_key, model = setup_llm_provider()
-                _CURRENT_CONFIG = {
-                    "provider": provider,
-                    "api_key": api_key,
-                    "model": model
-                }
+                _CURRENT_CONFIG = LLMConfig(provider, api_key, model)
             except Exception as e:
                 raise RuntimeError(f"Failed to set up LLM provider: {str(e)}")
         else:
-            provider = _CURRENT_CONFIG["provider"]
-            api_key = _CURRENT_CONFIG["api_key"]
-            model = _CURRENT_CONFIG["model"]
+            return config.provider, config.api_key, config.model
     else:
         # If any parameter was explicitly provided, use it
-        provider = provider or _CURRENT_CONFIG.get("provider")
-        api_key = api_key or _CURRENT_CONFIG.get("api_key")
-        model = model or _CURRENT_CONFIG.get("model")
+        if config is not None:
+            provider = provider or config.provider
+            api_key = api_key or config.api_key
+            model = model or config.model
         
         # Update the current configuration
         if provider and api_key and model:
-            _CURRENT_CONFIG = {
-                "provider": provider,
-                "api_key": api_key,
-                "model": model
-            }
+            _CURRENT_CONFIG = LLMConfig(provider, api_key, model)
     
     # Validate we have all required parameters
     if not provider:
@@ -671,18 +989,84 @@ def call_llm(prompt: str, model: Optional[str] = None,
     if not model:
         raise ValueError("Model is required")
     
+    return provider, api_key, model
+
+def call_llm(prompt: str, model: Optional[str] = None, 
+             provider: Optional[str] = None, api_key: Optional[str] = None,
+             temperature: float = 0.7, max_tokens: Optional[int] = None,
+             static_prefix: Optional[str] = None,
+             response_format: Optional[Dict[str, str]] = None) -> str:
+    """
+    Call an LLM with the given prompt.
+    
+    Args:
+        prompt: The prompt to send to the LLM
+        model: The model to use (if None, will use a default or last configured model)
+        provider: The provider to use (if None, will use a default or last configured provider)
+        api_key: The API key to use (if None, will use a default or last configured API key)
+        temperature: Controls randomness (lower is more deterministic)
+        max_tokens: Maximum number of tokens to generate
+        static_prefix: Static context shared across calls, sent first so the
+            provider can cache it (Anthropic cache_control, OpenAI prefix caching)
+        response_format: Structured output mode, e.g. {"type": "json_object"}
+            to force a single JSON object (OpenAI, OpenRouter, Google; ignored
+            by Anthropic, so callers must still tolerate surrounding text)
+        
+    Returns:
+        The LLM's response text
+    """
+    return complete_llm(prompt, model=model, provider=provider, api_key=api_key,
+                        temperature=temperature, max_tokens=max_tokens,
+                        static_prefix=static_prefix, response_format=response_format)[0]
+
+def _google_hit_token_limit(response: Any) -> bool:
+    """Check whether a Gemini response stopped at max_output_tokens."""
     try:
+        reason = response.candidates[0].finish_reason
+    except (AttributeError, IndexError, TypeError):
+        return False
+    return getattr(reason, "name", str(reason)).upper().endswith("MAX_TOKENS")
+
+def complete_llm(prompt: str, model: Optional[str] = None, 
+                 provider: Optional[str] = None, api_key: Optional[str] = None,
+                 temperature: float = 0.7, max_tokens: Optional[int] = None,
+                 static_prefix: Optional[str] = None,
+                 response_format: Optional[Dict[str, str]] = None) -> Tuple[str, bool]:
+    """
+    Call an LLM like call_llm, also reporting whether the reply was cut off.
+    
+    Args:
+        prompt: The prompt to send to the LLM
+        model: The model to use (if None, will use a default or last configured model)
+        provider: The provider to use (if None, will use a default or last configured provider)
+        api_key: The API key to use (if None, will use a default or last configured API key)
+        temperature: Controls randomness (lower is more deterministic)
+        max_tokens: Maximum number of tokens to generate
+        static_prefix: Static context shared across calls, sent first so the
+            provider can cache it (Anthropic cache_control, OpenAI prefix caching)
+        response_format: Structured output mode, e.g. {"type": "json_object"}
+            to force a single JSON object (OpenAI, OpenRouter, Google; ignored
+            by Anthropic, so callers must still tolerate surrounding text)
+        
+    Returns:
+        Tuple of (response text, whether generation stopped at the token limit)
+    """
+    provider, api_key, model = _resolve_config(provider, api_key, model)
+    json_mode = bool(response_format) and response_format.get("type") == "json_object"
+    
+    def _call() -> Tuple[str, bool]:
         if provider == "openai":
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = _get_openai_client(api_key)
             # Build parameters for OpenAI call, omit max_tokens if not provided
             create_kwargs = {
                 "model": model,
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": _build_messages(prompt, static_prefix),
                 "temperature": temperature
             }
             if max_tokens is not None:
                 create_kwargs["max_tokens"] = max_tokens
+            if response_format:
+                create_kwargs["response_format"] = response_format
             try:
                 response = client.chat.completions.create(**create_kwargs)
             except Exception as e:
@@ -693,35 +1077,45 @@ def call_llm(prompt: str, model: Optional[str] = None,
                     response = client.chat.completions.create(**create_kwargs)
                 else:
                     raise
-            return response.choices[0].message.content
+            choice = response.choices[0]
+            return choice.message.content, choice.finish_reason == "length"
             
         elif provider == "anthropic":
-            from anthropic import Anthropic
-            client = Anthropic(api_key=api_key)
+            client = _get_anthropic_client(api_key)
             response = client.messages.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=temperature,
-                max_tokens=max_tokens or 4096
+                max_tokens=max_tokens or 4096,
+                **_anthropic_system(static_prefix)
             )
-            return response.content[0].text
+            return response.content[0].text, response.stop_reason == "max_tokens"
             
         elif provider == "google":
             try:
-                import google.generativeai as genai
+                if genai is None:
+                    raise ImportError("google-generativeai is not installed")
                 genai.configure(api_key=api_key)
                 
                 try:
+                    generation_config = {
+                        "temperature": temperature,
+                        "max_output_tokens": max_tokens,
+                    }
+                    if json_mode:
+                        generation_config["response_mime_type"] = "application/json"
                     model_obj = genai.GenerativeModel(
                         model_name=model,
-                        generation_config={
-                            "temperature": temperature,
-                            "max_output_tokens": max_tokens,
-                        }
+                        generation_config=generation_config
                     )
-                    response = model_obj.generate_content(prompt)
-                    return response.text
+                    # Gemini caches implicitly on a shared leading prefix
+                    contents = f"{static_prefix}\n\n{prompt}" if static_prefix else prompt
+                    response = model_obj.generate_content(contents)
+                    return response.text, _google_hit_token_limit(response)
                 except Exception as api_error:
+                    # Leave transient errors unwrapped so _retry_with_backoff can classify them
+                    if _is_transient_error(api_error):
+                        raise
                     error_message = str(api_error)
                     if "Invalid API key" in error_message:
                         raise ValueError(f"Invalid Google API key: {error_message}")
@@ -732,46 +1126,223 @@ def call_llm(prompt: str, model: Optional[str] = None,
             except ImportError:
                 raise ImportError("Google Generative AI package is not installed or not accessible. Please install it with 'pip install google-generativeai'")
             except Exception as e:
+                if _is_transient_error(e):
+                    raise
                 raise RuntimeError(f"Unexpected error with Google Gemini: {str(e)}")
                 
         elif provider == "openrouter":
-            import requests
+            _require_requests()
             headers = {
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json"
             }
             data = {
                 "model": model,
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": _build_messages(prompt, static_prefix),
                 "temperature": temperature
             }
             if max_tokens:
                 data["max_tokens"] = max_tokens
+            if response_format:
+                data["response_format"] = response_format
                 
-            response = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers=headers,
-                json=data
-            )
+            response = get_session().post(OPENROUTER_CHAT_URL, headers=headers, json=data)
             if response.status_code != 200:
-                raise ValueError(f"OpenRouter API request failed with status code: {response.status_code}")
+                raise LLMHTTPError(f"OpenRouter API request failed with status code: {response.status_code}",
+                                   response.status_code)
                 
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
+            choice = response.json()["choices"][0]
+            return choice["message"]["content"], choice.get("finish_reason") == "length"
             
         else:
             raise ValueError(f"Unknown provider: {provider}")
-            
+    
+    try:
+        return _retry_with_backoff(_call)
     except Exception as e:
         raise RuntimeError(f"LLM call failed: {str(e)}")
 
+def _stream_openai(prompt: str, model: str, api_key: str, temperature: float,
+                   max_tokens: Optional[int], callback_fn: Callable[[str], None],
+                   static_prefix: Optional[str]) -> str:
+    """Stream a completion from OpenAI."""
+    chunks: List[str] = []
+    stream = _get_openai_client(api_key).chat.completions.create(
+        model=model,
+        messages=_build_messages(prompt, static_prefix),
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            content = chunk.choices[0].delta.content
+            callback_fn(content)
+            chunks.append(content)
+    
+    return "".join(chunks)
+
+def _stream_anthropic(prompt: str, model: str, api_key: str, temperature: float,
+                      max_tokens: Optional[int], callback_fn: Callable[[str], None],
+                      static_prefix: Optional[str]) -> str:
+    """Stream a completion from Anthropic."""
+    chunks: List[str] = []
+    stream = _get_anthropic_client(api_key).messages.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature,
+        max_tokens=max_tokens or 4096,
+        stream=True,
+        **_anthropic_system(static_prefix)
+    )
+    
+    for chunk in stream:
+        # Only content_block_delta events carry text
+        text = getattr(getattr(chunk, "delta", None), "text", None)
+        if text:
+            callback_fn(text)
+            chunks.append(text)
+    
+    return "".join(chunks)
+
+def _stream_google(prompt: str, model: str, api_key: str, temperature: float,
+                   max_tokens: Optional[int], callback_fn: Callable[[str], None],
+                   static_prefix: Optional[str]) -> str:
+    """Stream a completion from Google Gemini."""
+    if genai is None:
+        raise RuntimeError("Google Generative AI package is not installed. Please install it with 'pip install google-generativeai'")
+    
+    chunks: List[str] = []
+    genai.configure(api_key=api_key)
+    
+    model_obj = genai.GenerativeModel(
+        model_name=model,
+        generation_config={
+            "temperature": temperature,
+            "max_output_tokens": max_tokens
+        }
+    )
+    
+    # Gemini caches implicitly on a shared leading prefix
+    contents = f"{static_prefix}\n\n{prompt}" if static_prefix else prompt
+    response = model_obj.generate_content(
+        contents,
+        stream=True
+    )
+    
+    for chunk in response:
+        if hasattr(chunk, 'text') and chunk.text:
+            callback_fn(chunk.text)
+            chunks.append(chunk.text)
+    
+    return "".join(chunks)
+
+def _iter_sse_data(byte_chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    Parse a server-sent event stream at the byte level.
+    
+    Raw chunks are appended to a single buffer and split on line endings
+    without decoding; the data lines of each event are yielded as bytes once
+    the blank line terminating the event arrives. Comment lines and other
+    fields are skipped.
+    
+    Args:
+        byte_chunks: Iterator over raw response body chunks
+        
+    Returns:
+        Iterator over the data payload of each event
+    """
+    buffer = bytearray()
+    data_lines: List[bytes] = []
+    
+    for chunk in byte_chunks:
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end == -1:
+                break
+            line = bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+            
+            if not line:
+                # Blank line dispatches the pending event
+                if data_lines:
+                    yield data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+                    data_lines = []
+            elif line.startswith(b"data:"):
+                data_lines.append(line[6:] if line.startswith(b"data: ") else line[5:])
+        del buffer[:start]
+    
+    # Flush an event left unterminated at end of stream
+    if data_lines:
+        yield b"\n".join(data_lines)
+
+def _stream_openrouter(prompt: str, model: str, api_key: str, temperature: float,
+                       max_tokens: Optional[int], callback_fn: Callable[[str], None],
+                       static_prefix: Optional[str]) -> str:
+    """Stream a completion from OpenRouter over the shared keep-alive client."""
+    # OpenRouter doesn't support streaming directly in the Python API,
+    # so we handle the SSE stream ourselves
+    chunks: List[str] = []
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Accept": "text/event-stream"
+    }
+    
+    data = {
+        "model": model,
+        "messages": _build_messages(prompt, static_prefix),
+        "temperature": temperature,
+        "stream": True
+    }
+    
+    if max_tokens:
+        data["max_tokens"] = max_tokens
+        
+    with _get_http_client().stream("POST", OPENROUTER_CHAT_URL, headers=headers, json=data) as response:
+        if response.status_code != 200:
+            raise LLMHTTPError(f"OpenRouter API request failed with status code: {response.status_code}",
+                               response.status_code)
+            
+        for payload in _iter_sse_data(response.iter_bytes(8192)):
+            if payload == b"[DONE]":
+                break
+            try:
+                json_data = _json_loads(payload)
+                content = json_data['choices'][0]['delta'].get('content', '')
+                if content:
+                    callback_fn(content)
+                    chunks.append(content)
+            except ValueError:
+                pass  # Ignore invalid JSON
+    
+    return "".join(chunks)
+
+# Provider name -> streaming implementation
+_STREAM_HANDLERS: Dict[str, Callable[..., str]] = {
+    "openai": _stream_openai,
+    "anthropic": _stream_anthropic,
+    "google": _stream_google,
+    "openrouter": _stream_openrouter
+}
+
 def stream_llm(prompt: str, callback_fn: Callable[[str], None], 
                model: Optional[str] = None, provider: Optional[str] = None, 
                api_key: Optional[str] = None, temperature: float = 0.7,
-               max_tokens: Optional[int] = None) -> str:
+               max_tokens: Optional[int] = None,
+               static_prefix: Optional[str] = None,
+               flush_interval_ms: float = 16.0,
+               flush_min_chars: int = 32) -> str:
     """
     Stream from an LLM with the given prompt, calling callback_fn with each chunk.
     
+    Chunks are buffered and delivered to callback_fn once at least
+    flush_min_chars have accumulated or flush_interval_ms has elapsed since
+    the last delivery, so fast models do not pay callback overhead per token.
+    
     Args:
         prompt: The prompt to send to the LLM
         callback_fn: Function to call with each chunk of the response
@@ -780,168 +1351,153 @@ def stream_llm(prompt: str, callback_fn: Callable[[str], None],
         api_key: The API key to use (if None, will use a default or last configured API key)
         temperature: Controls randomness (lower is more deterministic)
         max_tokens: Maximum number of tokens to generate
+        static_prefix: Static context shared across calls, sent first so the
+            provider can cache it (Anthropic cache_control, OpenAI prefix caching)
+        flush_interval_ms: Maximum time to hold buffered chunks before delivering them
+        flush_min_chars: Buffered characters that trigger an immediate delivery
+            (1 or less delivers every chunk as it arrives)
         
     Returns:
         The full LLM response text
     """
-    global _CURRENT_CONFIG
+    provider, api_key, model = _resolve_config(provider, api_key, model)
     
-    # Use configured values if not provided
-    if not provider and not model and not api_key:
-        if not _CURRENT_CONFIG:
-            # If no configuration exists, prompt the user to set one up
-            try:
-                provider, api_key, model = setup_llm_provider()
-                _CURRENT_CONFIG = {
-                    "provider": provider,
-                    "api_key": api_key,
-                    "model": model
-                }
-            except Exception as e:
-                raise RuntimeError(f"Failed to set up LLM provider: {str(e)}")
-        else:
-            provider = _CURRENT_CONFIG["provider"]
-            api_key = _CURRENT_CONFIG["api_key"]
-            model = _CURRENT_CONFIG["model"]
-    else:
-        # If any parameter was explicitly provided, use it
-        provider = provider or _CURRENT_CONFIG.get("provider")
-        api_key = api_key or _CURRENT_CONFIG.get("api_key")
-        model = model or _CURRENT_CONFIG.get("model")
-        
-        # Update the current configuration
-        if provider and api_key and model:
-            _CURRENT_CONFIG = {
-                "provider": provider,
-                "api_key": api_key,
-                "model": model
-            }
+    handler = _STREAM_HANDLERS.get(provider)
     
-    # Validate we have all required parameters
-    if not provider:
-        raise ValueError("Provider is required")
-    if not api_key:
-        raise ValueError("API key is required")
-    if not model:
-        raise ValueError("Model is required")
+    # Only retry while nothing has been streamed, to avoid duplicated partial output
+    streamed = False
+    pending: List[str] = []
+    pending_chars = 0
+    flush_interval = flush_interval_ms / 1000
+    last_flush = time.perf_counter()
+    
+    def _flush() -> None:
+        nonlocal pending_chars, last_flush
+        if pending:
+            text = pending[0] if len(pending) == 1 else "".join(pending)
+            pending.clear()
+            pending_chars = 0
+            callback_fn(text)
+        last_flush = time.perf_counter()
     
-    full_response = ""
+    def _buffered_callback(content: str) -> None:
+        nonlocal streamed, pending_chars
+        streamed = True
+        pending.append(content)
+        pending_chars += len(content)
+        if pending_chars >= flush_min_chars or time.perf_counter() - last_flush >= flush_interval:
+            _flush()
     
     try:
-        if provider == "openai":
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
-            stream = client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=True
-            )
-            
-            for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    callback_fn(content)
-                    full_response += content
-                    
-        elif provider == "anthropic":
-            from anthropic import Anthropic
-            client = Anthropic(api_key=api_key)
-            stream = client.messages.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=temperature,
-                max_tokens=max_tokens or 4096,
-                stream=True
-            )
-            
-            for chunk in stream:
-                if chunk.delta.text:
-                    callback_fn(chunk.delta.text)
-                    full_response += chunk.delta.text
-                    
-        elif provider == "google":
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=api_key)
-                
-                model_obj = genai.GenerativeModel(
-                    model_name=model,
-                    generation_config={
-                        "temperature": temperature,
-                        "max_output_tokens": max_tokens
-                    }
-                )
-                
-                response = model_obj.generate_content(
-                    prompt,
-                    stream=True
-                )
-                
-                for chunk in response:
-                    if hasattr(chunk, 'text') and chunk.text:
-                        callback_fn(chunk.text)
-                        full_response += chunk.text
-                        
-            except ImportError:
-                raise RuntimeError("Google Generative AI package is not installed. Please install it with 'pip install google-generativeai'")
-                
-        elif provider == "openrouter":
-            # OpenRouter doesn't support streaming directly in the Python API,
-            # So we'll use the requests library and handle the SSE stream ourselves
-            import requests
-            import json
-            
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "Accept": "text/event-stream"
-            }
-            
-            data = {
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": temperature,
-                "stream": True
-            }
-            
-            if max_tokens:
-                data["max_tokens"] = max_tokens
-                
-            response = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers=headers,
-                json=data,
-                stream=True
-            )
-            
-            if response.status_code != 200:
-                raise ValueError(f"OpenRouter API request failed with status code: {response.status_code}")
-                
-            for line in response.iter_lines():
-                if line:
-                    line = line.decode('utf-8')
-                    if line.startswith('data: '):
-                        data = line[6:]  # Remove the 'data: ' prefix
-                        if data == "[DONE]":
-                            break
-                        try:
-                            json_data = json.loads(data)
-                            content = json_data['choices'][0]['delta'].get('content', '')
-                            if content:
-                                callback_fn(content)
-                                full_response += content
-                        except json.JSONDecodeError:
-                            pass  # Ignore invalid JSON
-                            
-        else:
+        if handler is None:
             raise ValueError(f"Unknown provider: {provider}")
-            
+        return _retry_with_backoff(
+            lambda: handler(prompt, model, api_key, temperature, max_tokens, _buffered_callback, static_prefix),
+            can_retry=lambda: not streamed
+        )
     except Exception as e:
         raise RuntimeError(f"LLM streaming failed: {str(e)}")
+    finally:
+        # Deliver whatever is still buffered, including partial output on failure
+        _flush()
+
+def _get_llm_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared executor used for concurrent LLM calls, creating it on first use.
+    
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    global _LLM_EXECUTOR
+    if _LLM_EXECUTOR is None:
+        with _LLM_EXECUTOR_LOCK:
+            if _LLM_EXECUTOR is None:
+                _LLM_EXECUTOR = ThreadPoolExecutor(max_workers=_LLM_EXECUTOR_WORKERS,
+                                                   thread_name_prefix="llm")
+    return _LLM_EXECUTOR
+
+def call_llm_future(prompt: str, model: Optional[str] = None,
+                    provider: Optional[str] = None, api_key: Optional[str] = None,
+                    **kwargs) -> "Future[str]":
+    """
+    Start an LLM call in the background and return a future for its result.
+    
+    Independent calls can be started together and their results collected
+    only when needed, so they run concurrently while dependent calls still
+    wait on the futures they consume. Configuration is resolved in the
+    calling thread so any interactive setup happens before scheduling.
+    
+    Args:
+        prompt: The prompt to send to the LLM
+        model: The model to use (if None, uses the configured model)
+        provider: The provider to use (if None, uses the configured provider)
+        api_key: The API key to use (if None, uses the configured API key)
+        **kwargs: Remaining call_llm arguments (temperature, max_tokens, static_prefix,
+            response_format)
         
-    return full_response
+    Returns:
+        concurrent.futures.Future resolving to the response text
+    """
+    provider, api_key, model = _resolve_config(provider, api_key, model)
+    return _get_llm_executor().submit(call_llm, prompt, model=model, provider=provider,
+                                      api_key=api_key, **kwargs)
+
+async def call_llm_async(prompt: str, model: Optional[str] = None,
+                         provider: Optional[str] = None, api_key: Optional[str] = None,
+                         **kwargs) -> str:
+    """
+    Awaitable version of call_llm for AsyncNode implementations.
+    
+    The call runs on the shared LLM executor, so the event loop stays free
+    and other nodes' calls progress while this one is in flight. Wrap it in
+    asyncio.create_task() to start it early and await the result later.
+    
+    Args:
+        prompt: The prompt to send to the LLM
+        model: The model to use (if None, uses the configured model)
+        provider: The provider to use (if None, uses the configured provider)
+        api_key: The API key to use (if None, uses the configured API key)
+        **kwargs: Remaining call_llm arguments (temperature, max_tokens, static_prefix,
+            response_format)
+        
+    Returns:
+        The LLM's response text
+    """
+    return await asyncio.wrap_future(call_llm_future(prompt, model=model, provider=provider,
+                                                     api_key=api_key, **kwargs))
+
+async def gather_llm(prompts: List[str], model: Optional[str] = None,
+                     provider: Optional[str] = None, api_key: Optional[str] = None,
+                     max_concurrency: int = _LLM_EXECUTOR_WORKERS,
+                     **kwargs) -> List[Union[str, Exception]]:
+    """
+    Send several independent prompts concurrently and collect their responses.
+    
+    Configuration is resolved once for the whole fan-out, and at most
+    max_concurrency of these calls occupy the shared LLM executor at a time so
+    one large fan-out cannot starve other callers. A failed call does not
+    cancel the others; its exception is returned in its place.
+    
+    Args:
+        prompts: Prompts to send
+        model: The model to use (if None, uses the configured model)
+        provider: The provider to use (if None, uses the configured provider)
+        api_key: The API key to use (if None, uses the configured API key)
+        max_concurrency: Maximum number of these calls in flight at once
+        **kwargs: Remaining call_llm arguments (temperature, max_tokens, static_prefix,
+            response_format)
+        
+    Returns:
+        Response text, or the exception raised, for each prompt in order
+    """
+    provider, api_key, model = _resolve_config(provider, api_key, model)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def bounded_call(prompt: str) -> str:
+        async with semaphore:
+            return await call_llm_async(prompt, model=model, provider=provider, api_key=api_key, **kwargs)
+    
+    return await asyncio.gather(*(bounded_call(prompt) for prompt in prompts), return_exceptions=True)
 
 if __name__ == "__main__":
     # Test the functions
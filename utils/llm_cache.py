@@ -0,0 +1,230 @@
+"""
+Two-tier cache for LLM responses: an in-process LRU + TTL cache in front of
+an on-disk SQLite cache that survives between runs.
+"""
+
+import os
+import time
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from .llm import complete_llm, get_current_config
+from .sqlite_cache import SQLiteCache, SharedCache
+
+class LRUCache:
+    """
+    Least-recently-used cache whose entries also expire after a fixed TTL.
+    
+    All operations are O(1) and guarded by a lock, so the cache can be
+    shared by concurrent scraping workers.
+    """
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+            ttl: Seconds an entry stays valid after it was stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value, refreshing its recency.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+# Process-wide cache of LLM responses
+_LLM_CACHE = LRUCache(maxsize=512, ttl=3600.0)
+
+# Default on-disk location, overridable with POCKETFLOW_LLM_CACHE
+DEFAULT_DISK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pocketflow", "llm_cache.sqlite3")
+
+# Responses are reused from disk for a week
+DEFAULT_DISK_TTL = 7 * 86400
+
+class DiskLLMCache(SQLiteCache):
+    """
+    SQLite-backed cache of LLM responses keyed by prompt_key.
+    """
+    
+    label = "LLM cache"
+    table = "responses"
+    key_columns = ("key",)
+    columns = "response TEXT NOT NULL"
+    
+    def __init__(self, path: str = DEFAULT_DISK_CACHE_PATH, ttl: float = DEFAULT_DISK_TTL):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            path: SQLite database file
+            ttl: Seconds a response stays valid after it was stored
+        """
+        super().__init__(path, ttl)
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from prompt_key
+        
+        Returns:
+            The cached response, or None if missing, expired or unreadable
+        """
+        return self._get((key,), "response", lambda row: row[0], key)
+    
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key from prompt_key
+            response: LLM response text
+        """
+        self._put((key,), lambda: {"response": response}, key)
+
+_DISK_CACHE = SharedCache(DiskLLMCache, "POCKETFLOW_LLM_CACHE", DEFAULT_DISK_CACHE_PATH)
+
+def get_disk_cache() -> Optional[DiskLLMCache]:
+    """
+    Get the shared on-disk LLM cache, opening it on first use.
+    
+    Set POCKETFLOW_LLM_CACHE to a file path to relocate the cache, or to an
+    empty string to disable it.
+    
+    Returns:
+        Shared DiskLLMCache, or None if disabled or it could not be opened
+    """
+    return _DISK_CACHE.get()
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Collapse whitespace so prompts differing only in indentation or line breaks share a key.
+    
+    Args:
+        prompt: Prompt text
+    
+    Returns:
+        Normalized prompt text
+    """
+    return " ".join(prompt.split())
+
+def prompt_key(prompt: str, temperature: float, model: str = "", options: str = "") -> str:
+    """
+    Build a stable cache key for a prompt, sampling temperature, model and
+    remaining generation options.
+    
+    Args:
+        prompt: Prompt text
+        temperature: Sampling temperature
+        model: Provider and model the prompt is sent to
+        options: Other arguments that shape the response, from _generation_options
+    
+    Returns:
+        Hex digest identifying the request
+    """
+    text = f"{model}|{temperature}|{options}|{normalize_prompt(prompt)}"
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+# call_llm arguments that choose where a request goes rather than what comes back
+_ROUTING_KWARGS = frozenset({"model", "provider", "api_key"})
+
+def _generation_options(kwargs: dict) -> str:
+    """Serialize the call_llm arguments that shape the response (max_tokens, response_format, ...)."""
+    options = {name: value for name, value in kwargs.items()
+               if name not in _ROUTING_KWARGS and value is not None}
+    return json.dumps(options, sort_keys=True, default=str) if options else ""
+
+def _model_label(kwargs: dict) -> str:
+    """Identify the provider and model a call_llm request will use."""
+    config = get_current_config()
+    provider = kwargs.get("provider") or (config.provider if config else "")
+    model = kwargs.get("model") or (config.model if config else "")
+    return f"{provider}/{model}"
+
+def clear_llm_cache() -> None:
+    """Drop every cached LLM response, in memory and on disk."""
+    _LLM_CACHE.clear()
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear()
+
+def cached_call_llm(prompt: str, temperature: float = 0.7, **kwargs) -> str:
+    """
+    Call the LLM, reusing a cached response for an identical prompt,
+    temperature, model and generation options.
+    
+    Looks in the in-process cache first, then the on-disk cache, so repeated
+    runs skip the round trip too. Responses cut off at the token limit are
+    not cached.
+    
+    Args:
+        prompt: The prompt to send to the LLM
+        temperature: Controls randomness (lower is more deterministic)
+        **kwargs: Additional call_llm arguments (all but api_key are part of
+            the cache key)
+    
+    Returns:
+        The LLM's response text
+    """
+    key = prompt_key(prompt, temperature, _model_label(kwargs), _generation_options(kwargs))
+    response = _LLM_CACHE.get(key)
+    if response is not None:
+        return response
+    
+    disk_cache = get_disk_cache()
+    response = disk_cache.get(key) if disk_cache else None
+    if response is None:
+        response, truncated = complete_llm(prompt, temperature=temperature, **kwargs)
+        if truncated:
+            return response
+        if disk_cache and response:
+            disk_cache.set(key, response)
+    _LLM_CACHE.set(key, response)
+    return response
@@ -3,12 +3,82 @@ Monitoring utilities for Repository Analysis to MCP Server system.
 """
 
 import time
+import queue
+import atexit
 import logging
+import logging.handlers
+import weakref
 import functools
-from typing import Dict, Any, Optional, Callable, Union
+import threading
+from collections import Counter
+from typing import Dict, List, Any, Optional, Callable, Union
 
-# Global counter dictionary for metrics
-_counters = {}
+logger = logging.getLogger(__name__)
+
+# Global counters for tagged metrics, guarded by a lock
+_counters = Counter()
+# Reentrant: a shard's finalizer may run while this thread already holds it
+_counters_lock = threading.RLock()
+
+# Background listener that writes queued log records to the real handlers
+_log_listener = None
+
+# Whether log_execution_time attaches "_metadata" to dict results (off by default)
+_METADATA_ENABLED = False
+
+# Per-thread counter shards for untagged metrics, merged when read; a shard
+# is folded into _counters when its thread exits, keyed here by id()
+_local = threading.local()
+_shards: Dict[int, Counter] = {}
+
+# Merged totals at the last reset, subtracted when counters are read; a reset
+# never writes to shards, which their threads update without the lock
+_reset_baseline = Counter()
+
+class _ShardHolder:
+    """Thread-local owner of a shard; it is dropped when its thread exits."""
+    
+    def __init__(self):
+        self.counters = Counter()
+
+def _retire_shard(counters: Counter) -> None:
+    """Fold a finished thread's shard into the global counters."""
+    with _counters_lock:
+        _counters.update(counters)
+        _shards.pop(id(counters), None)
+
+def _get_shard() -> Counter:
+    """
+    Get the calling thread's counter shard, registering it on first use.
+    
+    Returns:
+        Counter owned by the current thread
+    """
+    holder = getattr(_local, "holder", None)
+    if holder is None:
+        holder = _ShardHolder()
+        _local.holder = holder
+        with _counters_lock:
+            _shards[id(holder.counters)] = holder.counters
+        # Runs when the thread's locals are cleared on exit, so short-lived
+        # executor threads do not leave shards behind
+        weakref.finalize(holder, _retire_shard, holder.counters)
+    return holder.counters
+
+def _merged_counters() -> Counter:
+    """
+    Merge the global counters with every thread shard, net of the last reset.
+    
+    Returns:
+        Counter with the combined values
+    """
+    with _counters_lock:
+        merged = Counter(dict(_counters))
+        for shard in list(_shards.values()):
+            merged.update(dict(shard))
+        for name, value in _reset_baseline.items():
+            merged[name] -= value
+    return merged
 
 def log_execution_time(operation_name: Optional[str] = None) -> Callable:
     """
@@ -21,47 +91,50 @@ def log_execution_time(operation_name: Optional[str] = None) -> Callable:
         Decorated function that logs execution time
     """
     def decorator(func):
+        # Resolve the operation name and metric keys once, at decoration time
+        op_name = operation_name or f"{func.__module__}.{func.__name__}"
+        count_key = f"{op_name}_count"
+        time_key = f"{op_name}_time_total"
+        error_key = f"{op_name}_errors"
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Generate operation name if not provided
-            op_name = operation_name or f"{func.__module__}.{func.__name__}"
-            
             # Log start
-            start_time = time.time()
-            logging.debug(f"Starting {op_name}")
+            start_ns = time.perf_counter_ns()
+            logger.debug("Starting %s", op_name)
             
             try:
                 # Execute function
                 result = func(*args, **kwargs)
-                
-                # Calculate execution time
-                execution_time = time.time() - start_time
-                
-                # Log completion
-                logging.info(f"Completed {op_name} in {execution_time:.2f} seconds")
-                
-                # Track metric
-                increment_counter(f"{op_name}_count")
-                increment_counter(f"{op_name}_time_total", value=execution_time)
-                
-                # If result is a dict, add execution metadata
-                if isinstance(result, dict):
-                    result.setdefault("_metadata", {}).update({
-                        "execution_time": execution_time,
-                        "operation": op_name
-                    })
-                
-                return result
             except Exception as e:
                 # Log failure and execution time
-                execution_time = time.time() - start_time
-                logging.error(f"Failed {op_name} after {execution_time:.2f} seconds: {str(e)}")
+                execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                logger.error("Failed %s after %.2f seconds: %s", op_name, execution_time, e)
                 
                 # Track failure metric
-                increment_counter(f"{op_name}_errors")
+                increment_counter(error_key)
                 
                 # Re-raise the exception
                 raise
+            
+            # Calculate execution time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            
+            # Log completion
+            logger.info("Completed %s in %.2f seconds", op_name, execution_time)
+            
+            # Track metric
+            increment_counter(count_key)
+            increment_counter(time_key, value=execution_time)
+            
+            # If enabled and result is a plain dict, add execution metadata
+            if _METADATA_ENABLED and type(result) is dict:
+                result.setdefault("_metadata", {}).update({
+                    "execution_time": execution_time,
+                    "operation": op_name
+                })
+            
+            return result
         
         return wrapper
     
@@ -73,6 +146,16 @@ def log_execution_time(operation_name: Optional[str] = None) -> Callable:
     
     return decorator
 
+def set_execution_metadata(enabled: bool) -> None:
+    """
+    Enable or disable "_metadata" injection into dict results of timed functions.
+    
+    Args:
+        enabled: Whether log_execution_time should annotate dict results
+    """
+    global _METADATA_ENABLED
+    _METADATA_ENABLED = enabled
+
 def configure_logging(level: Union[str, int], format_string: Optional[str] = None) -> logging.Logger:
     """
     Configures structured logging for the system.
@@ -92,15 +175,31 @@ def configure_logging(level: Union[str, int], format_string: Optional[str] = Non
     if not format_string:
         format_string = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
     
-    # Configure root logger
-    logging.basicConfig(
-        level=level,
-        format=format_string,
-        handlers=[
+    # Write records from a background thread so logging calls on hot paths
+    # only enqueue instead of blocking on console/file I/O
+    global _log_listener
+    if _log_listener is None:
+        formatter = logging.Formatter(format_string)
+        handlers = [
             logging.StreamHandler(),  # Console handler
             logging.FileHandler("repo_analyzer.log")  # File handler
         ]
-    )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        
+        # Configure root logger
+        logging.basicConfig(
+            level=level,
+            format="%(message)s",  # Final formatting happens in the listener's handlers
+            handlers=[logging.handlers.QueueHandler(log_queue)]
+        )
+    else:
+        logging.getLogger().setLevel(level)
     
     # Create logger for this application
     logger = logging.getLogger("repo_analyzer")
@@ -125,20 +224,22 @@ def increment_counter(name: str, value: float = 1, tags: Optional[Dict[str, str]
         value: Value to increment by
         tags: Metadata tags
     """
-    # Initialize counter if not exists
-    if name not in _counters:
-        _counters[name] = 0
-    
-    # Increment counter
-    _counters[name] += value
-    
-    # Log the increment
-    tag_str = ""
     if tags:
-        tag_str = ", ".join(f"{k}={v}" for k, v in tags.items())
-        tag_str = f" with tags {tag_str}"
+        # Tagged metrics are rare, so a shared locked counter is fine
+        with _counters_lock:
+            _counters[name] += value
+    else:
+        # Hot path: each thread only writes to its own shard, no lock needed
+        _get_shard()[name] += value
     
-    logging.debug(f"Incremented counter {name} by {value}{tag_str}, new value: {_counters[name]}")
+    # Log the increment
+    if logger.isEnabledFor(logging.DEBUG):
+        tag_str = ""
+        if tags:
+            tag_str = ", ".join(f"{k}={v}" for k, v in tags.items())
+            tag_str = f" with tags {tag_str}"
+        
+        logger.debug(f"Incremented counter {name} by {value}{tag_str}, new value: {get_counter(name)}")
 
 def get_counter(name: str) -> float:
     """
@@ -150,7 +251,7 @@ def get_counter(name: str) -> float:
     Returns:
         Current counter value
     """
-    return _counters.get(name, 0)
+    return _merged_counters().get(name, 0)
 
 def get_all_counters() -> Dict[str, float]:
     """
@@ -159,7 +260,7 @@ def get_all_counters() -> Dict[str, float]:
     Returns:
         Dictionary of all counters
     """
-    return _counters.copy()
+    return dict(_merged_counters())
 
 def reset_counter(name: str) -> None:
     """
@@ -168,17 +269,22 @@ def reset_counter(name: str) -> None:
     Args:
         name: Counter name
     """
-    if name in _counters:
-        _counters[name] = 0
-        logging.debug(f"Reset counter {name} to 0")
+    with _counters_lock:
+        current = _merged_counters()
+        found = name in current
+        if found:
+            _reset_baseline[name] += current[name]
+    if found:
+        logger.debug(f"Reset counter {name} to 0")
 
 def reset_all_counters() -> None:
     """
     Reset all counters to zero.
     """
-    for name in _counters:
-        _counters[name] = 0
-    logging.debug(f"Reset all {len(_counters)} counters to 0")
+    with _counters_lock:
+        current = _merged_counters()
+        _reset_baseline.update(current)
+    logger.debug(f"Reset all {len(current)} counters to 0")
 
 if __name__ == "__main__":
     # Configure logging
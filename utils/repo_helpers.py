@@ -7,14 +7,16 @@ def get_content_for_indices(files_data, indices):
     
     Args:
         files_data: List of (path, content) tuples
-        indices: List of indices to retrieve
+        indices: List of indices to retrieve (None for all files)
         
     Returns:
         Dictionary mapping "idx # path" to content
     """
-    content_map = {}
-    for i in indices:
-        if 0 <= i < len(files_data):
-            path, content = files_data[i]
-            content_map[f"{i} # {path}"] = content # Use index + path as key for context
-    return content_map 
\ No newline at end of file
+    n = len(files_data)
+    
+    # Fast path: every file requested, no bounds checks needed
+    if indices is None:
+        return {f"{i} # {path}": content for i, (path, content) in enumerate(files_data)}
+    
+    # Use index + path as key for context
+    return {f"{i} # {files_data[i][0]}": files_data[i][1] for i in indices if 0 <= i < n}
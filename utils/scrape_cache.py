@@ -0,0 +1,168 @@
+"""
+On-disk cache of scraped pages for Repository Analysis to MCP Server system.
+
+Pages are stored in SQLite keyed by URL together with their HTTP validators
+(ETag / Last-Modified), so later runs can revalidate with a conditional GET
+and reuse the parsed page on 304 Not Modified.
+"""
+
+import os
+import json
+import time
+import zlib
+from typing import Dict, Any, Optional
+
+from .sqlite_cache import SQLiteCache, SharedCache
+
+# Check if zstandard is installed for faster, smaller page compression
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Default location, overridable with POCKETFLOW_SCRAPE_CACHE
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pocketflow", "scrape_cache.sqlite3")
+
+# Pages fetched more recently than this are reused without any request
+DEFAULT_FRESH_SECONDS = 6 * 3600
+
+# One-byte codec tag prefixed to each stored blob
+_CODEC_ZLIB = b"z"
+_CODEC_ZSTD = b"s"
+
+def _compress(data: bytes) -> bytes:
+    """Compress a blob with zstd (level 3) when available, else zlib."""
+    if ZSTD_AVAILABLE:
+        return _CODEC_ZSTD + zstandard.ZstdCompressor(level=3).compress(data)
+    return _CODEC_ZLIB + zlib.compress(data, 6)
+
+def _decompress(blob: bytes) -> bytes:
+    """Decompress a blob written by _compress."""
+    codec, payload = blob[:1], blob[1:]
+    if codec == _CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Cached page was compressed with zstd, which is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return zlib.decompress(payload)
+
+class ScrapeCache(SQLiteCache):
+    """
+    SQLite-backed cache of parsed pages and their GitHub URLs.
+
+    Entries never expire; stale ones are revalidated with their HTTP
+    validators instead.
+    """
+
+    label = "Scrape cache"
+    table = "pages"
+    key_columns = ("url",)
+    columns = ("etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL, "
+               "content BLOB NOT NULL, github_urls TEXT NOT NULL")
+    decode_errors = SQLiteCache.decode_errors + (zlib.error,) + ((zstandard.ZstdError,) if ZSTD_AVAILABLE else ())
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, fresh_seconds: float = DEFAULT_FRESH_SECONDS):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite database file
+            fresh_seconds: Age below which an entry is used without revalidation
+        """
+        super().__init__(path)
+        self.fresh_seconds = fresh_seconds
+
+    def _decode(self, row: tuple) -> Dict[str, Any]:
+        """Turn a stored row into the dictionary returned by get."""
+        etag, last_modified, fetched_at, content, github_urls = row
+        page_data = json.loads(_decompress(content))
+        page_data["github_urls"] = json.loads(github_urls)
+        return {
+            "page_data": page_data,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": time.time() - fetched_at < self.fresh_seconds
+        }
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached page.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Dictionary with page_data, etag, last_modified and fresh (whether
+            it can be used without revalidating), or None if not cached
+        """
+        return self._get((url,), "etag, last_modified, fetched_at, content, github_urls", self._decode, url)
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build revalidation headers for a cached entry.
+
+        Args:
+            entry: Result of get(), or None
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty without validators)
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(self, url: str, page_data: Dict[str, Any], etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Store a successfully parsed page.
+
+        Args:
+            url: Page URL
+            page_data: Parsed page dictionary
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        content = {key: value for key, value in page_data.items() if key != "github_urls"}
+        self._put((url,), lambda: {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "content": _compress(json.dumps(content).encode("utf-8")),
+            "github_urls": json.dumps(page_data.get("github_urls", []))
+        }, url)
+
+    def touch(self, url: str) -> None:
+        """
+        Mark a cached page as fresh again after a 304 Not Modified.
+
+        Args:
+            url: Page URL
+        """
+        self._write(f"UPDATE {self.table} SET fetched_at = ? WHERE url = ?", (time.time(), url), url, "update")
+
+    def delete(self, url: str) -> None:
+        """
+        Remove a cached page.
+
+        Args:
+            url: Page URL
+        """
+        self._delete((url,), url)
+
+_SCRAPE_CACHE = SharedCache(ScrapeCache, "POCKETFLOW_SCRAPE_CACHE", DEFAULT_CACHE_PATH)
+
+def get_scrape_cache() -> Optional[ScrapeCache]:
+    """
+    Get the shared scrape cache, opening it on first use.
+
+    Set POCKETFLOW_SCRAPE_CACHE to a file path to relocate the cache, or to
+    an empty string to disable it.
+
+    Returns:
+        Shared ScrapeCache, or None if disabled or it could not be opened
+    """
+    return _SCRAPE_CACHE.get()
@@ -3,16 +3,42 @@ Search utilities for Repository Analysis to MCP Server system.
 """
 
 import os
+import re
 import json
 import sys
+import argparse
 import time  # Added time module import for sleep functionality
+import copy
+import asyncio
 import random  # For random user agent selection
-from typing import Dict, List, Any, Optional, Tuple
-from urllib.parse import urlparse
+import logging
+import string
+import textwrap
+import threading
+import multiprocessing
+import yaml
+from collections import Counter, defaultdict
+from contextlib import AsyncExitStack
+from functools import partial, lru_cache
+from itertools import chain, islice
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable, AsyncIterator
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
-from .llm import call_llm
-from .monitoring import log_execution_time
-from .github import extract_github_urls
+from .llm import call_llm, gather_llm
+from .llm_cache import LRUCache, cached_call_llm
+from .monitoring import log_execution_time, increment_counter
+from .scrape_cache import get_scrape_cache
+from .search_cache import get_search_cache
+from .http import create_session
+from .github import (extract_github_urls, extract_github_urls_bulk, GitHubUrlExtractor,
+                     check_repository_complexity_and_size)
+
+# Per-item progress goes through logging, which main.py routes through a
+# queue so concurrent workers do not contend on stdout
+logger = logging.getLogger(__name__)
 
 # Check if yt-dlp is installed
 try:
@@ -48,14 +74,498 @@ except ImportError:
     print("requests not installed. Install with: pip install requests")
     REQUESTS_AVAILABLE = False
 
+# Check if aiohttp is installed for asynchronous page fetching
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# httpx provides the async client when aiohttp is not installed
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 support in httpx needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Shared session so scraping reuses keep-alive connections across calls,
+# with a larger per-host pool and quick retries of connection-level failures
+_SESSION = None
+if REQUESTS_AVAILABLE:
+    _SESSION = create_session(headers={
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        # Compression codecs urllib3 can decode here (adds br when brotli is installed)
+        'Accept-Encoding': requests.utils.default_headers()['Accept-Encoding'],
+    })
+
+# Only the start of a page is used, so stop downloading after this many bytes
+MAX_PAGE_BYTES = 512 * 1024
+
+# Longest text scanned for GitHub URLs in one go; bounds the regex cost of
+# pathological descriptions and pages
+TEXT_CAP = 512 * 1024
+
+def _cap_text(text: str) -> str:
+    """
+    Truncate text to TEXT_CAP before a GitHub URL scan, counting truncations.
+    
+    Args:
+        text: Text about to be scanned
+        
+    Returns:
+        The text, cut to at most TEXT_CAP characters
+    """
+    if len(text) <= TEXT_CAP:
+        return text
+    increment_counter("github_scan_truncations")
+    return text[:TEXT_CAP]
+
+def _count_parse_truncation(parsed: Tuple[Dict[str, Any], bool]) -> Dict[str, Any]:
+    """
+    Count a GitHub scan truncation reported by _parse_page.
+    
+    The parse may run in a worker process, whose counters never reach this
+    one, so the worker reports the truncation and the caller counts it.
+    
+    Args:
+        parsed: Return value of _parse_page
+        
+    Returns:
+        The page data
+    """
+    page_data, truncated = parsed
+    if truncated:
+        increment_counter("github_scan_truncations")
+    return page_data
+
+# Check if selectolax is installed for fast C-based HTML parsing
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 # Check if BeautifulSoup is installed for HTML parsing
 try:
     from bs4 import BeautifulSoup
     BS4_AVAILABLE = True
 except ImportError:
-    print("BeautifulSoup not installed. Install with: pip install beautifulsoup4")
+    if not SELECTOLAX_AVAILABLE:
+        print("BeautifulSoup not installed. Install with: pip install beautifulsoup4")
     BS4_AVAILABLE = False
 
+# Pages can be parsed with either library
+HTML_PARSER_AVAILABLE = SELECTOLAX_AVAILABLE or BS4_AVAILABLE
+
+# Prefer orjson for parsing LLM JSON responses, fall back to the stdlib parser
+# (orjson.JSONDecodeError subclasses ValueError, like json's)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Check if pyahocorasick is installed for single-pass multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Check if numpy is installed for vectorized score aggregation and ranking
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Use the C-based lxml parser with BeautifulSoup when available
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = 'lxml'
+except ImportError:
+    BS4_PARSER = 'html.parser'
+
+# Maximum number of candidate repository link lines kept per description
+MAX_OTHER_LINKS = 20
+
+# A canonical GitHub repository URL (owner and repository, optional trailing slash)
+_GITHUB_REPO_URL_RE = re.compile(r'https?://(?:www\.)?github\.com/[\w.-]+/[\w.-]+/?')
+
+def _is_github_repo_url(url: Any) -> bool:
+    """Whether url is a string holding exactly one GitHub repository URL."""
+    return isinstance(url, str) and _GITHUB_REPO_URL_RE.fullmatch(url) is not None
+
+# Owner and repository at the start of any GitHub URL (tree/blob paths, query
+# strings and fragments may follow)
+_GITHUB_REPO_PREFIX_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/([\w.-]+)/([\w.-]+)', re.IGNORECASE)
+
+def _normalize_github_url(url: Any) -> Any:
+    """
+    Reduce a GitHub URL to https://github.com/owner/repo.
+    
+    Drops the scheme variant, www., a .git suffix, trailing slashes and any
+    tree/blob path, query or fragment, so URLs such as LLM answers collapse
+    onto the regex extractor's form. Anything else is returned unchanged.
+    
+    Args:
+        url: URL to normalize
+        
+    Returns:
+        Normalized repository URL, or url itself if it is not a GitHub URL
+    """
+    if not isinstance(url, str):
+        return url
+    match = _GITHUB_REPO_PREFIX_RE.match(url.strip())
+    if match is None:
+        return url
+    owner, repo = match.groups()
+    if repo.endswith('.git'):
+        repo = repo[:-4]
+    return f"https://github.com/{owner}/{repo}"
+
+# Ask providers with a JSON mode for a bare JSON object
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Decoder for pulling one JSON value out of surrounding LLM prose
+_JSON_DECODER = json.JSONDecoder()
+
+def _extract_json(text: Any, opener: str) -> Optional[Any]:
+    """
+    Extract the first well-formed JSON object or array from text.
+    
+    A response that is exactly one JSON value (as JSON mode returns) is parsed
+    whole with _loads (orjson when installed). Otherwise each candidate opening
+    bracket is located with str.find and one value is decoded from there with
+    raw_decode, so surrounding prose is ignored and no regex backtracking is
+    involved.
+    
+    Args:
+        text: Text that contains a JSON value, e.g. an LLM response; bytes are
+            handed to orjson as-is and only decoded if the scan is needed
+        opener: '{' for an object or '[' for an array
+        
+    Returns:
+        The decoded dict or list, or None if no valid value was found
+    """
+    if not text:
+        return None
+    
+    expected = dict if opener == '{' else list
+    
+    # Fast path: the whole response is the JSON value
+    stripped = text.strip()
+    if stripped[:1] in (opener, opener.encode()):
+        try:
+            value = _loads(stripped)
+            if isinstance(value, expected):
+                return value
+        except ValueError:
+            pass
+    
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode('utf-8', errors='replace')
+    if opener not in text:
+        return None
+    
+    idx = text.find(opener)
+    while idx != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, idx)
+            if isinstance(value, expected):
+                return value
+        except ValueError:
+            pass
+        idx = text.find(opener, idx + 1)
+    return None
+
+# Whole lines holding a link that mentions git (github, gitlab, ...), case-insensitive;
+# one finditer over the description yields them without splitting it into lines
+_GIT_LINE_RE = re.compile(r'^[^\n]*?https?://\S*git[^\n]*', re.IGNORECASE | re.MULTILINE)
+
+# Algorithmic relevance scores this far from the threshold skip the LLM check
+_DECISIVE_MARGIN = 0.2
+
+# Relevance batches scored concurrently by the synchronous batch check
+_RELEVANCE_WORKERS = 4
+
+# Search results keyed on (source, normalized enhanced query), stored with the
+# number of results that were asked for so smaller requests are served a prefix
+_SEARCH_CACHE = LRUCache(maxsize=256, ttl=900.0)
+
+# Web searches fetch at least this many results so later, larger requests for
+# the same query are still cache hits (engines return a full page regardless)
+_MIN_WEB_FETCH = 10
+
+def _normalize_query(query: str) -> str:
+    """
+    Canonical form of a search query, so equivalent queries share cache entries.
+    
+    Search engines ignore case and extra whitespace, and quotes wrapping the
+    whole query are usually a copy-paste artifact, so all three are dropped.
+    
+    Args:
+        query: Search query as given
+        
+    Returns:
+        Lowercased query with whitespace collapsed and enclosing quotes removed
+    """
+    query = " ".join(query.lower().split())
+    while len(query) > 1 and query[0] == query[-1] and query[0] in "\"'":
+        query = query[1:-1].strip()
+    return query
+
+def _search_cache_key(source: str, query: str) -> Tuple[str, str]:
+    """Cache key for a search, ignoring case, whitespace and enclosing quotes in the query."""
+    return (source, _normalize_query(query))
+
+def _cached_search(key: Tuple[str, str], max_results: int) -> Optional[List[Dict[str, Any]]]:
+    """
+    Look up cached search results, recording a hit or miss.
+    
+    A search cached for at least max_results results, or one that returned
+    fewer than it asked for (nothing more to find), answers smaller requests
+    with its first max_results results. The in-process cache is tried first,
+    then the on-disk cache shared between runs.
+    
+    Args:
+        key: Search cache key from _search_cache_key
+        max_results: Number of results wanted
+        
+    Returns:
+        A private copy of the cached results, or None on a miss
+    """
+    cached = _SEARCH_CACHE.get(key)
+    if cached is None:
+        disk_cache = get_search_cache()
+        cached = disk_cache.get(*key) if disk_cache else None
+        if cached is not None:
+            _SEARCH_CACHE.set(key, cached)
+    if cached is not None:
+        fetched, results = cached
+        if fetched >= max_results or len(results) < fetched:
+            increment_counter("search_cache_hits")
+            return copy.deepcopy(results[:max_results])
+    increment_counter("search_cache_misses")
+    return None
+
+def _store_search(key: Tuple[str, str], fetched: int, results: List[Dict[str, Any]]) -> None:
+    """Cache a copy of search results, in process and on disk, so later caller mutations do not leak in."""
+    if results:
+        _SEARCH_CACHE.set(key, (fetched, copy.deepcopy(results)))
+        disk_cache = get_search_cache()
+        if disk_cache:
+            disk_cache.set(*key, fetched, results)
+
+# Scraped pages and videos keyed on (kind, canonical URL); failed scrapes are
+# only reused for a short while so transient errors get retried
+_SCRAPE_RESULT_CACHE = LRUCache(maxsize=2048, ttl=3600.0)
+_FAILED_SCRAPE_TTL = 60.0
+
+@lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """
+    Canonicalize a URL for cache keys: lowercase scheme and host, drop the
+    fragment and sort the query parameters.
+    
+    Args:
+        url: URL to canonicalize
+        
+    Returns:
+        Canonical URL string
+    """
+    parsed = urlparse(url.strip())
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path or '/',
+                       parsed.params, query, ''))
+
+def _cached_scrape(kind: str, url: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a scraped page or video, recording a hit or miss.
+    
+    Args:
+        kind: "page" or "video"
+        url: Scraped URL
+        
+    Returns:
+        A private copy of the cached scrape result, or None on a miss
+    """
+    entry = _SCRAPE_RESULT_CACHE.get((kind, _canonical_url(url)))
+    if entry is not None:
+        stored_at, data = entry
+        if not data.get("scrape_failed") or time.monotonic() - stored_at < _FAILED_SCRAPE_TTL:
+            increment_counter("scrape_cache_hits")
+            return copy.deepcopy(data)
+    increment_counter("scrape_cache_misses")
+    return None
+
+def _store_scrape(kind: str, url: str, data: Dict[str, Any]) -> None:
+    """Cache a copy of a scrape result so later caller mutations do not leak in."""
+    _SCRAPE_RESULT_CACHE.set((kind, _canonical_url(url)), (time.monotonic(), copy.deepcopy(data)))
+
+# Repository assessments keyed on (github_url, query, features, whether relevance
+# was judged); failures are not cached
+_ASSESS_CACHE = LRUCache(maxsize=4096, ttl=3600.0)
+_ASSESS_FAILED_REASON = "Unable to assess repository quality"
+
+# Neutral assessment returned (as a copy) when the LLM cannot be asked
+_ASSESS_FALLBACK = {
+    "relevance_score": 0.5,
+    "quality_score": 0.5,
+    "reasoning": _ASSESS_FAILED_REASON
+}
+
+def _llm_offline() -> bool:
+    """
+    Whether LLM calls are switched off with POCKETFLOW_OFFLINE.
+    
+    Offline runs (e.g. CI) keep the algorithmic relevance checks and regex URL
+    extraction, and give every repository the neutral fallback assessment,
+    instead of waiting on LLM requests that cannot succeed.
+    
+    Returns:
+        True if POCKETFLOW_OFFLINE is set to anything but "" or "0"
+    """
+    return os.environ.get("POCKETFLOW_OFFLINE", "") not in ("", "0")
+
+# Maximum concurrent single-repository assessments (LLM rate limits)
+_ASSESS_CONCURRENCY = 10
+
+# Repositories found only in content scoring less than this above the relevance
+# threshold are ranked on that score without an LLM quality assessment
+_ASSESS_RELEVANCE_MARGIN = 0.1
+_UNASSESSED_REASON = "Not assessed: borderline content relevance"
+
+# Repositories cited by at least this many search results skip the LLM quality
+# assessment and get these scores; each citing result also adds to the ranking
+_EVIDENCE_MIN_SOURCES = 3
+_EVIDENCE_RELEVANCE = 0.9
+_EVIDENCE_QUALITY = 0.8
+_EVIDENCE_WEIGHT = 0.05
+
+# Refined queries keyed on (query, keywords, tech_stack, features)
+_REFINE_CACHE = LRUCache(maxsize=512, ttl=3600.0)
+
+# Concurrency limits for scraping search results
+_SCRAPE_WORKERS = 8
+_MAX_REQUESTS_PER_HOST = 2
+
+# Per-host semaphores keep concurrent scraping polite to each site
+_HOST_SEMAPHORES: Dict[str, threading.Semaphore] = defaultdict(
+    lambda: threading.Semaphore(_MAX_REQUESTS_PER_HOST))
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+# Worker processes for CPU-bound HTML parsing, created on first use
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool used to parse fetched pages on all cores.
+    
+    Returns:
+        Shared ProcessPoolExecutor
+    """
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        with _PARSE_POOL_LOCK:
+            if _PARSE_POOL is None:
+                # Workers are started on demand while other threads run (and
+                # may hold locks); fork would copy those locks held forever
+                start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                  mp_context=multiprocessing.get_context(start_method))
+    return _PARSE_POOL
+
+def _host_semaphore(url: str) -> threading.Semaphore:
+    """
+    Get the semaphore limiting concurrent requests to the URL's host.
+    
+    Args:
+        url: URL about to be requested
+        
+    Returns:
+        Semaphore shared by all requests to the same host
+    """
+    domain = extract_domain(url)
+    with _HOST_SEMAPHORES_LOCK:
+        return _HOST_SEMAPHORES[domain]
+
+def _run_engine(engine: Any, query: str) -> List[Dict[str, str]]:
+    """
+    Run one Search-Engines-Scraper engine instance and return its raw results.
+    
+    Args:
+        engine: Engine instance (Google, Bing, Duckduckgo)
+        query: Search query
+        
+    Returns:
+        List of raw result dictionaries
+    """
+    engine.search(query, pages=1)  # Get just the first page of results
+    return engine.results
+
+def _run_engine_class(engine_name: str, query: str) -> List[Dict[str, str]]:
+    """
+    Run a single-engine SearchEngines search and return its raw results.
+    
+    Args:
+        engine_name: Engine name understood by SearchEngines (e.g. 'google')
+        query: Search query
+        
+    Returns:
+        List of raw result dictionaries
+    """
+    search = SearchEngines([engine_name])
+    return search.search(query, pages=1).get(engine_name, [])
+
+def _completed_engine_results(futures: List[Any], limit: int, failures: List[Exception]) -> Any:
+    """
+    Yield each engine's raw results, capped at limit, in completion order.
+    
+    Args:
+        futures: Futures returned by submitting _run_engine/_run_engine_class
+        limit: Maximum number of raw results taken from each engine
+        failures: List each failed engine's exception is appended to
+        
+    Returns:
+        Iterator over per-engine result iterators
+    """
+    for future in as_completed(futures):
+        try:
+            yield islice(future.result(), limit)
+        except Exception as e:
+            logger.warning("Search engine failed: %s", e)
+            failures.append(e)
+
+def _is_complete_result(result: Dict[str, str]) -> bool:
+    """Check that a normalized search result has a title, URL and snippet."""
+    return bool(result["title"] and result["url"] and result["snippet"])
+
+def _unique_results(results: Any) -> Any:
+    """
+    Drop results whose canonical URL was already yielded.
+    
+    Args:
+        results: Iterable of normalized search results
+        
+    Returns:
+        Iterator over results with distinct URLs
+    """
+    seen = set()
+    for result in results:
+        key = _canonical_url(result["url"])
+        if key not in seen:
+            seen.add(key)
+            yield result
+
 @log_execution_time("web_search")
 def search_web(query: str, max_results: int = 10, keywords: List[str] = None, 
                tech_stack: List[str] = None, features: List[str] = None) -> List[Dict[str, str]]:
@@ -76,6 +586,7 @@ def search_web(query: str, max_results: int = 10, keywords: List[str] = None,
         raise ImportError("Search-Engines-Scraper is required for web search. Install with: pip install -U git+https://github.com/tasos-py/Search-Engines-Scraper.git")
     
     # Enhance query with keywords, tech_stack, and features if provided
+    query = _normalize_query(query)
     enhanced_query = query
     if keywords or tech_stack or features:
         additional_terms = []
@@ -90,86 +601,141 @@ def search_web(query: str, max_results: int = 10, keywords: List[str] = None,
         additional_terms.append("github repository")
         enhanced_query = f"{query} {' '.join(additional_terms)}"
     
+    cache_key = _search_cache_key("web", enhanced_query)
+    cached = _cached_search(cache_key, max_results)
+    if cached is not None:
+        return cached
+    
+    fetch_count = max(max_results, _MIN_WEB_FETCH)
     results = []
     
-    # Use the SearchEngines class if available, otherwise use individual engines
+    # Query every engine concurrently; the searches are independent network round trips
     if SEARCH_ENGINES_AVAILABLE == "class":
-        from search_engines_scraper import SearchEngines
-        
-        # Initialize with multiple engines for better coverage
+        # One single-engine SearchEngines per engine instead of the library's sequential loop
         engines = ["google", "bing", "duckduckgo"]
-        search = SearchEngines(engines)
-        
-        # Execute search
-        search_results = search.search(enhanced_query, pages=1)  # Get first page of results
-        
-        # Process and format results
-        for engine, engine_results in search_results.items():
-            for result in engine_results[:max_results]:
-                if len(results) >= max_results:
-                    break
-                    
-                # Extract relevant information
-                title = result.get('title', '')
-                url = result.get('url', '')
-                snippet = result.get('description', '')
-                source = extract_domain(url)
-                
-                if title and url and snippet:
-                    results.append({
-                        "title": title,
-                        "url": url,
-                        "snippet": snippet,
-                        "source": source
-                    })
-            
-            if len(results) >= max_results:
-                break
+        run_engine = _run_engine_class
+        url_key, snippet_key = 'url', 'description'
     else:
-        # Use individual engines approach as fallback
-        from search_engines import Google, Bing, Duckduckgo
+        # Use individual engines approach as fallback (imported at module load)
         engines = [Google(), Bing(), Duckduckgo()]
-        
-        for engine in engines:
-            if len(results) >= max_results:
-                break
-                
-            engine.search(enhanced_query, pages=1)  # Get just the first page of results
-            search_results = engine.results
-            
-            # Limit number of results from each engine
-            for result in search_results[:max_results]:
-                if len(results) >= max_results:
-                    break
-                    
-                # Extract relevant information
-                title = result.get('title', '')
-                url = result.get('link', '')
-                snippet = result.get('text', '')
-                source = extract_domain(url)
-                
-                if title and url and snippet:
-                    results.append({
-                        "title": title,
-                        "url": url,
-                        "snippet": snippet,
-                        "source": source
-                    })
+        run_engine = _run_engine
+        url_key, snippet_key = 'link', 'text'
     
+    failures: List[Exception] = []
+    executor = ThreadPoolExecutor(max_workers=len(engines))
+    try:
+        futures = [executor.submit(run_engine, engine, enhanced_query) for engine in engines]
+        
+        # Merge results lazily as engines finish; islice stops once max_results are
+        # valid and distinct, so URLs found by several engines are kept only once
+        normalized = (
+            {
+                "title": result.get('title', ''),
+                "url": result.get(url_key, ''),
+                "snippet": result.get(snippet_key, '')
+            }
+            for result in chain.from_iterable(_completed_engine_results(futures, fetch_count, failures))
+        )
+        for result in islice(_unique_results(filter(_is_complete_result, normalized)), fetch_count):
+            result["source"] = extract_domain(result["url"])
+            results.append(result)
+    finally:
+        # Once max_results are in, stop waiting for slower engines and drop
+        # any engine that has not started yet
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # A short list is cached as "nothing more to find", which only holds if
+    # every engine answered; otherwise the next call asks again
+    if len(results) >= fetch_count or not failures:
+        _store_search(cache_key, fetch_count, results)
     return results[:max_results]
 
+# yt-dlp options for flat search results with as much metadata as possible;
+# search_youtube adds the per-call playlistend
+_YDL_SEARCH_OPTS = {
+    'quiet': True,
+    'extract_flat': True,
+    'force_generic_extractor': True,
+    'ignoreerrors': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'format': 'best',
+    'getdescription': True,  # Get full video descriptions 
+    'get_title': True,       # Ensure we get video titles
+    'get_thumbnail': True,   # Get thumbnail URLs
+    'get_duration': True,    # Get video durations
+    'get_filename': True,    # Get video filenames
+    'no_color': True,        # Disable color codes in output
+}
+
+# yt-dlp options for fetching a video's metadata without resolving formats or comments
+_YDL_DESCRIPTION_OPTS = {
+    'quiet': True,
+    'ignoreerrors': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'no_color': True,
+}
+
+def _expand_video_descriptions(videos: List[Dict[str, Any]], needles: List[str], limit: int) -> None:
+    """
+    Fill in descriptions and GitHub URLs for flat search hits that lack them.
+    
+    Only the first `limit` videos whose title mentions one of the needles
+    (or the first `limit` videos when there are no needles) are expanded,
+    concurrently and through one shared YoutubeDL instance.
+    
+    Args:
+        videos: Search results without a description, updated in place
+        needles: Keywords, technologies and features used to pick candidates
+        limit: Maximum number of videos to expand
+    """
+    needles_lc = [needle.lower() for needle in needles if needle]
+    candidates = [
+        video for video in videos
+        if not needles_lc or any(needle in video["title"].lower() for needle in needles_lc)
+    ][:limit]
+    if not candidates:
+        return
+    
+    with yt_dlp.YoutubeDL(_YDL_DESCRIPTION_OPTS) as ydl:
+        def fetch_description(video: Dict[str, Any]) -> str:
+            try:
+                # process=False returns the raw metadata without format selection
+                info = ydl.extract_info(video["url"], download=False, process=False)
+                return (info or {}).get('description') or ""
+            except Exception as e:
+                logger.warning("Could not fetch description for %s: %s", video['url'], e)
+                return ""
+        
+        with ThreadPoolExecutor(max_workers=min(len(candidates), 6)) as executor:
+            descriptions = list(executor.map(fetch_description, candidates))
+    
+    for video, description in zip(candidates, descriptions):
+        if description:
+            github_urls = extract_github_urls(description)
+            video["snippet"] = description
+            video["github_urls"] = github_urls
+            video["has_github_url"] = bool(github_urls)
+
 @log_execution_time("youtube_search")
 def search_youtube(query: str, max_results: int = 5, keywords: List[str] = None, 
-                 tech_stack: List[str] = None, features: List[str] = None) -> List[Dict[str, str]]:
+                 tech_stack: List[str] = None, features: List[str] = None,
+                 expand_top: int = 5) -> List[Dict[str, str]]:
     """
     Searches YouTube for relevant videos using yt-dlp with focus on GitHub repositories.
     
+    The flat search usually omits descriptions, so up to expand_top promising
+    hits without one get their description fetched in a second, lightweight
+    pass; GitHub URLs found there let search_and_scrape skip a full scrape.
+    
     Args:
         query: Search query
         max_results: Maximum number of results to return
         keywords: List of keywords to focus search on
         tech_stack: List of technologies to focus search on
         features: List of features to focus search on
+        expand_top: Maximum number of description-less hits to expand (0 disables)
         
     Returns:
         List of result dictionaries with title, url, and description
@@ -178,6 +744,7 @@ def search_youtube(query: str, max_results: int = 5, keywords: List[str] = None,
         raise ImportError("yt-dlp is required for YouTube search. Install with: pip install -U yt-dlp")
     
     # Enhance query with keywords, tech_stack, and features if provided
+    query = _normalize_query(query)
     enhanced_query = query
     if keywords or tech_stack or features:
         additional_terms = []
@@ -192,35 +759,25 @@ def search_youtube(query: str, max_results: int = 5, keywords: List[str] = None,
         additional_terms.append("github repository tutorial")
         enhanced_query = f"{query} {' '.join(additional_terms)}"
     
-    # Configure yt-dlp options for more metadata
-    ydl_opts = {
-        'quiet': True,
-        'extract_flat': True,
-        'force_generic_extractor': True,
-        'ignoreerrors': True,
-        'no_warnings': True,
-        'skip_download': True,
-        'format': 'best',
-        'getdescription': True,  # Get full video descriptions 
-        'get_title': True,       # Ensure we get video titles
-        'get_thumbnail': True,   # Get thumbnail URLs
-        'get_duration': True,    # Get video durations
-        'get_filename': True,    # Get video filenames
-        'no_color': True,        # Disable color codes in output
-        'playlistend': max_results, # Limit the number of results
-    }
-    
     # Format the search query for yt-dlp
     search_query = f"ytsearch{max_results}:{enhanced_query}"
     
-    # Perform the search
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info_dict = ydl.extract_info(search_query, download=False)
-        if 'entries' not in info_dict:
+    cache_key = _search_cache_key("yt", enhanced_query)
+    cached = _cached_search(cache_key, max_results)
+    if cached is not None:
+        return cached
+    
+    # Perform the search, limiting the number of results. Without processing,
+    # yt-dlp hands back the search extractor's lazy generator, so result pages
+    # are only fetched and turned into entries as they are consumed here
+    with yt_dlp.YoutubeDL({**_YDL_SEARCH_OPTS, 'playlistend': max_results}) as ydl:
+        info_dict = ydl.extract_info(search_query, download=False, process=False)
+        if not info_dict or 'entries' not in info_dict:
             return []
             
         results = []
-        for entry in info_dict['entries']:
+        missing_description = []
+        for entry in islice(info_dict['entries'], max_results):
             if entry is None:
                 continue
                 
@@ -233,7 +790,7 @@ def search_youtube(query: str, max_results: int = 5, keywords: List[str] = None,
             description = entry.get('description', '')
             channel = entry.get('channel', entry.get('uploader', ''))
             upload_date = entry.get('upload_date', '')
-            thumbnail = entry.get('thumbnail', '')
+            thumbnail = entry.get('thumbnail') or (entry.get('thumbnails') or [{}])[-1].get('url', '')
             duration = entry.get('duration', 0)
             
             # Try to extract GitHub URLs from description immediately
@@ -250,24 +807,118 @@ def search_youtube(query: str, max_results: int = 5, keywords: List[str] = None,
                 "github_urls": github_urls,  # Include any immediately found GitHub URLs
                 "has_github_url": bool(github_urls)  # Flag for videos with GitHub URLs
             })
-            
-        return results
+            if not description:
+                missing_description.append(results[-1])
+    
+    if expand_top > 0 and missing_description:
+        needles = (keywords or []) + (tech_stack or []) + (features or [])
+        _expand_video_descriptions(missing_description, needles, expand_top)
+    
+    _store_search(cache_key, max_results, results)
+    return results
 
-@log_execution_time("scrape_youtube")
-def scrape_youtube_video(video_url: str) -> Dict[str, Any]:
+async def _batch_search(search: Callable[..., List[Dict[str, Any]]], kind: str, queries: List[str],
+                        max_results: int, concurrency: int, **filters: Any) -> List[List[Dict[str, Any]]]:
+    """Run one blocking search per query concurrently on the default executor."""
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def run(query: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                return await loop.run_in_executor(None, partial(search, query, max_results=max_results, **filters))
+            except Exception as e:
+                logger.warning("%s search failed for %s: %s", kind, query, e)
+                return []
+    
+    # Equivalent queries would all miss the cache at once, so run each only once
+    distinct = list(dict.fromkeys(_normalize_query(query) for query in queries))
+    answers = dict(zip(distinct, await asyncio.gather(*(run(query) for query in distinct))))
+    
+    results = []
+    seen = set()
+    for query in queries:
+        normalized = _normalize_query(query)
+        answer = answers[normalized]
+        # Repeats get their own copies, as a cache hit would
+        results.append([dict(result) for result in answer] if normalized in seen else answer)
+        seen.add(normalized)
+    return results
+
+async def batch_search_web(queries: List[str], max_results: int = 10, concurrency: int = 8,
+                           **filters: Any) -> List[List[Dict[str, str]]]:
     """
-    Scrapes detailed information from a YouTube video using yt-dlp.
-    Specifically focuses on extracting GitHub URLs from description and comments.
+    Run several web searches concurrently.
+    
+    Each query goes through search_web (and its cache), so N queries take
+    about as long as the slowest one rather than the sum.
+    
+    Args:
+        queries: Search queries
+        max_results: Maximum number of results per query
+        concurrency: Maximum number of searches in flight at once
+        **filters: keywords, tech_stack and features, as for search_web
+        
+    Returns:
+        One result list per query, in order (empty if that search failed)
+    """
+    return await _batch_search(search_web, "Web", queries, max_results, concurrency, **filters)
+
+async def batch_search_youtube(queries: List[str], max_results: int = 5, concurrency: int = 8,
+                               **filters: Any) -> List[List[Dict[str, str]]]:
+    """
+    Run several YouTube searches concurrently.
+    
+    Args:
+        queries: Search queries
+        max_results: Maximum number of results per query
+        concurrency: Maximum number of searches in flight at once
+        **filters: keywords, tech_stack, features and expand_top, as for search_youtube
+        
+    Returns:
+        One result list per query, in order (empty if that search failed)
+    """
+    return await _batch_search(search_youtube, "YouTube", queries, max_results, concurrency, **filters)
+
+# yt-dlp options for full video metadata, including comments
+# Comments fetched and scanned per video
+MAX_VIDEO_COMMENTS = 30
+
+_YDL_SCRAPE_OPTS = {
+    'quiet': True,
+    'ignoreerrors': True,
+    'no_warnings': True,
+    'getcomments': True,
+    'getdescription': True,
+    'get_title': True,
+    'get_id': True,
+    'no_color': True,
+    'skip_download': True,
+    'format': 'best', # Just to avoid errors, not actually downloading
+    'extract_flat': False, # We want full info, not just playlist metadata
+    'youtube_include_dash_manifest': False,
+    'youtube_include_hls_manifest': False,
+    'extractor_args': {'youtube': {
+        'skip': ['dash', 'hls'],  # Skip streams for speed
+        'max_comments': [str(MAX_VIDEO_COMMENTS)]  # Stop fetching once enough comments are in
+    }}
+}
+
+# Large info-dict entries that are never read, dropped as soon as extraction returns
+_UNUSED_INFO_KEYS = ('formats', 'requested_formats', 'thumbnails', 'automatic_captions',
+                     'subtitles', 'heatmap', 'chapters')
+
+def _extract_video_data(ydl: Any, video_url: str) -> Dict[str, Any]:
+    """
+    Extract details and GitHub URLs for one video with a shared YoutubeDL instance.
     
     Args:
+        ydl: Open yt_dlp.YoutubeDL instance
         video_url: YouTube video URL
         
     Returns:
         Dictionary with video details and extracted GitHub URLs
     """
-    if not YT_DLP_AVAILABLE:
-        raise ImportError("yt-dlp is required for YouTube video scraping. Install with: pip install -U yt-dlp")
-    
     # Initialize with default values and assume failure until proven otherwise
     video_data = {
         "title": "",
@@ -283,109 +934,432 @@ def scrape_youtube_video(video_url: str) -> Dict[str, Any]:
     }
     
     try:
-        # Configure yt-dlp options to extract comments and detailed info
-        ydl_opts = {
-            'quiet': True,
-            'ignoreerrors': True,
-            'no_warnings': True,
-            'writeinfojson': True,
-            'getcomments': True,
-            'getdescription': True,
-            'get_title': True,
-            'get_id': True,
-            'no_color': True,
-            'skip_download': True,
-            'format': 'best', # Just to avoid errors, not actually downloading
-            'extract_flat': False, # We want full info, not just playlist metadata
-            'extractor_args': {'youtube': {'skip': ['dash', 'hls']}}  # Skip streams for speed
-        }
+        info = ydl.extract_info(video_url, download=False)
         
-        # Extract video information
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
-            
-            if not info:
-                print(f"  Failed to extract info from {video_url}")
-                return video_data
-            
-            # Extract basic video information
-            video_data["title"] = info.get('title', '')
-            video_data["description"] = info.get('description', '')
-            video_data["uploader"] = info.get('uploader', '')
-            video_data["view_count"] = info.get('view_count', 0)
-            video_data["upload_date"] = info.get('upload_date', '')
-            video_data["duration"] = info.get('duration', 0)
-        
-            # Extract comments if available
-            comments = []
-            comments_data = info.get('comments', [])
-            for comment in comments_data[:30]:  # Check more comments for GitHub URLs
-                if isinstance(comment, dict):
-                    comment_text = comment.get('text', '')
-                    if comment_text:
-                        comments.append(comment_text)
-                elif isinstance(comment, str):
-                    comments.append(comment)
-        
-            video_data["comments"] = comments
-            
-            # Try to extract GitHub URLs from description
-            description_urls = extract_github_urls(video_data["description"]) if video_data["description"] else []
-        
-            # Try to extract GitHub URLs from comments - all comments are now strings
-            comment_text = "\n".join(comments)
-            comment_urls = extract_github_urls(comment_text) if comment_text else []
-        
-            # Combine and deduplicate GitHub URLs
-            all_github_urls = list(set(description_urls + comment_urls))
-            video_data["github_urls"] = all_github_urls
-        
-            # Extract other links from description that might be GitHub repository references
-            # but weren't caught by the regex pattern
-            other_links = []
-            if video_data["description"]:
-                for line in video_data["description"].split('\n'):
-                    if 'http' in line and 'git' in line.lower():
-                        other_links.append(line.strip())
-        
-            video_data["other_potential_repo_links"] = other_links
-            video_data["scrape_failed"] = False  # Mark scrape as successful
-            
+        if not info:
+            logger.warning("Failed to extract info from %s", video_url)
             return video_data
+        
+        # Release the bulky parts of the info dict before scanning the rest
+        for key in _UNUSED_INFO_KEYS:
+            info.pop(key, None)
+        
+        # Extract basic video information
+        video_data["title"] = info.get('title', '')
+        video_data["description"] = info.get('description', '')
+        video_data["uploader"] = info.get('uploader', '')
+        video_data["view_count"] = info.get('view_count', 0)
+        video_data["upload_date"] = info.get('upload_date', '')
+        video_data["duration"] = info.get('duration', 0)
+    
+        # Extract comments if available
+        comments = []
+        comments_data = info.get('comments', [])
+        for comment in comments_data[:MAX_VIDEO_COMMENTS]:  # Check more comments for GitHub URLs
+            if isinstance(comment, dict):
+                comment_text = comment.get('text', '')
+                if comment_text:
+                    comments.append(comment_text)
+            elif isinstance(comment, str):
+                comments.append(comment)
+    
+        video_data["comments"] = comments
+        
+        # Scan the description and all comments for GitHub URLs in one bulk pass
+        url_lists = extract_github_urls_bulk([_cap_text(text) for text in chain([video_data["description"] or ""], comments)])
+        video_data["github_urls"] = list(dict.fromkeys(chain.from_iterable(url_lists)))
+    
+        # Extract other links from description that might be GitHub repository references
+        # but weren't caught by the regex pattern
+        other_links = []
+        if video_data["description"]:
+            # Match candidate lines lazily and stop once enough are collected
+            for line_match in islice(_GIT_LINE_RE.finditer(video_data["description"]), MAX_OTHER_LINKS):
+                other_links.append(line_match.group(0).strip())
+    
+        video_data["other_potential_repo_links"] = other_links
+        video_data["scrape_failed"] = False  # Mark scrape as successful
+        
+        return video_data
             
     except Exception as e:
-        print(f"  Error scraping YouTube video {video_url}: {str(e)}")
+        logger.warning("Error scraping YouTube video %s: %s", video_url, e)
         return video_data  # Return with scrape_failed=True
 
-@log_execution_time("scrape_webpage")
-def scrape_webpage(url: str, max_retries: int = 2) -> Dict[str, Any]:
+@log_execution_time("scrape_youtube")
+def scrape_youtube_videos(video_urls: List[str], max_workers: int = 6) -> List[Dict[str, Any]]:
+    """
+    Scrapes detailed information from several YouTube videos using yt-dlp.
+    Specifically focuses on extracting GitHub URLs from descriptions and comments.
+    
+    All videos share one YoutubeDL instance, so extractor setup happens once,
+    and their metadata is fetched concurrently.
+    
+    Args:
+        video_urls: YouTube video URLs
+        max_workers: Maximum number of videos fetched at the same time
+        
+    Returns:
+        List of video detail dictionaries, in the same order as video_urls
+    """
+    if not YT_DLP_AVAILABLE:
+        raise ImportError("yt-dlp is required for YouTube video scraping. Install with: pip install -U yt-dlp")
+    
+    if not video_urls:
+        return []
+    
+    # Serve videos scraped recently (e.g. by an overlapping query) from the cache
+    results = [_cached_scrape("video", url) for url in video_urls]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if not missing:
+        return results
+    
+    with yt_dlp.YoutubeDL(_YDL_SCRAPE_OPTS) as ydl:
+        if len(missing) == 1:
+            scraped = [_extract_video_data(ydl, video_urls[missing[0]])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                scraped = list(executor.map(partial(_extract_video_data, ydl),
+                                            (video_urls[i] for i in missing)))
+    
+    for i, video_data in zip(missing, scraped):
+        _store_scrape("video", video_urls[i], video_data)
+        results[i] = video_data
+    return results
+
+def scrape_youtube_video(video_url: str) -> Dict[str, Any]:
+    """
+    Scrapes detailed information from a YouTube video using yt-dlp.
+    Specifically focuses on extracting GitHub URLs from description and comments.
+    
+    Args:
+        video_url: YouTube video URL
+        
+    Returns:
+        Dictionary with video details and extracted GitHub URLs
+    """
+    return scrape_youtube_videos([video_url])[0]
+
+# Containers whose text is preferred over the whole body, matching
+# the selector 'article, main, .content, .post, .entry, #content'
+_CONTENT_TAGS = {'article', 'main'}
+_CONTENT_CLASSES = {'content', 'post', 'entry'}
+
+# Caps applied while walking a parsed page
+MAX_CONTENT_CHARS = 5000
+MAX_LINKS = 50
+MAX_CODE_BLOCKS = 10
+
+def _absolute_href(href: Optional[str], parsed_url: Any) -> Optional[str]:
+    """
+    Resolve a link target against the page URL.
+    
+    Args:
+        href: Raw href attribute
+        parsed_url: urlparse result of the page URL
+        
+    Returns:
+        Absolute http(s) URL, or None for empty, javascript: and other links
+    """
+    if not href:
+        return None
+    
+    # Convert relative URLs to absolute
+    if href.startswith('/') and not href.startswith('//'):
+        return f"{parsed_url.scheme}://{parsed_url.netloc}{href}"
+    if not (href.startswith('http://') or href.startswith('https://')):
+        # Skip javascript: and other non-http links
+        return None
+    return href
+
+def _finish_parsed_page(title: str, content: str, links: List[Dict[str, str]], hrefs: List[str],
+                        code_blocks: List[str], scan_github: bool) -> Tuple[Dict[str, Any], bool]:
+    """
+    Cap the content and collect GitHub URLs from the parsed page parts.
+    
+    Args:
+        title: Page title
+        content: Main content text (space-separated text nodes, may exceed the cap)
+        links: Link dictionaries to return
+        hrefs: Every link target on the page
+        code_blocks: Code blocks mentioning GitHub
+        scan_github: Whether to scan for GitHub URLs
+        
+    Returns:
+        Page data dictionary, and whether the GitHub URL scan was cut to TEXT_CAP
+    """
+    if len(content) > MAX_CONTENT_CHARS:
+        content = content[:MAX_CONTENT_CHARS] + "..."
+    
+    # Extract GitHub URLs from the page text, link targets and code blocks in a
+    # single regex pass, skipping markup, scripts and styles in the raw HTML
+    github_urls = []
+    scan_truncated = False
+    if scan_github:
+        text = "\n".join(chain([content], hrefs, code_blocks))
+        scan_truncated = len(text) > TEXT_CAP
+        github_urls = extract_github_urls(text[:TEXT_CAP])
+    
+    return {
+        "title": title,
+        "content": content,
+        "links": links,
+        "github_urls": github_urls,
+        "code_blocks": code_blocks,
+        "scrape_failed": False  # Scraping was successful
+    }, scan_truncated
+
+def _parse_page_selectolax(body: bytes, url: str, scan_github: bool) -> Tuple[Dict[str, Any], bool]:
+    """selectolax (C) implementation of _parse_page."""
+    tree = HTMLParser(body)
+    parsed_url = urlparse(url)
+    
+    title_node = tree.css_first('title')
+    title = title_node.text() if title_node is not None else ""
+    
+    links = []
+    hrefs = []
+    for node in tree.css('a[href]'):
+        href = _absolute_href(node.attributes.get('href'), parsed_url)
+        if href is None:
+            continue
+        
+        # Every target is scanned for GitHub URLs, only the first few are returned
+        hrefs.append(href)
+        if len(links) < MAX_LINKS:
+            links.append({
+                "url": href,
+                "text": node.text(strip=True)[:100]  # Truncate long link text
+            })
+    
+    # Code blocks that might contain GitHub references
+    code_blocks = []
+    if scan_github:
+        for node in tree.css('pre, code, .highlight'):
+            if len(code_blocks) >= MAX_CODE_BLOCKS:
+                break
+            if node.tag == 'a':
+                continue
+            code_text = node.text(strip=True)
+            if "github.com" in code_text and len(code_text) < 2000:  # Limit size
+                code_blocks.append(code_text)
+    
+    # Extract main content (prioritize article tags, main, or body).
+    # Space-separate text nodes so URLs are not glued to the following text
+    content_root = tree.css_first('article, main, #content, .content, .post, .entry') or tree.body
+    content = content_root.text(separator=' ', strip=True) if content_root is not None else ""
+    
+    return _finish_parsed_page(title, content, links, hrefs, code_blocks, scan_github)
+
+def _parse_page(body: bytes, url: str, scan_github: bool = True) -> Tuple[Dict[str, Any], bool]:
+    """
+    Parse a fetched page into title, content, links, code blocks and GitHub URLs.
+    
+    Uses selectolax when installed. Otherwise the BeautifulSoup tree is walked
+    once, dispatching each tag to the bucket it feeds, and every bucket stops
+    growing once its cap is reached.
+    
+    Args:
+        body: Raw (size-capped) HTML bytes; the parser handles decoding
+        url: Page URL, used to resolve relative links
+        scan_github: Whether to look for GitHub URLs; False when the streamed
+            body was already found to contain none
+        
+    Returns:
+        Dictionary with page content and extracted GitHub URLs, and whether
+        the GitHub URL scan was truncated; pass it to _count_parse_truncation
+    """
+    if SELECTOLAX_AVAILABLE:
+        return _parse_page_selectolax(body, url, scan_github)
+    
+    soup = BeautifulSoup(body, BS4_PARSER)
+    parsed_url = urlparse(url)
+    
+    title = ""
+    content_root = None
+    links = []
+    hrefs = []
+    code_blocks = []
+    
+    for el in soup.find_all(True):
+        name = el.name
+        
+        if name == 'title':
+            if not title:
+                title = el.string or ""
+            continue
+        
+        # First matching container in document order holds the main content
+        if content_root is None and (
+                name in _CONTENT_TAGS
+                or el.get('id') == 'content'
+                or not _CONTENT_CLASSES.isdisjoint(el.get('class') or ())):
+            content_root = el
+        
+        if name == 'a':
+            href = _absolute_href(el.get('href'), parsed_url)
+            if href is None:
+                continue
+            
+            # Every target is scanned for GitHub URLs, only the first few are returned
+            hrefs.append(href)
+            if len(links) < MAX_LINKS:
+                links.append({
+                    "url": href,
+                    "text": el.get_text(strip=True)[:100]  # Truncate long link text
+                })
+        
+        # Code blocks that might contain GitHub references
+        elif scan_github and len(code_blocks) < MAX_CODE_BLOCKS and (
+                name in ('pre', 'code') or 'highlight' in (el.get('class') or ())):
+            code_text = el.get_text(strip=True)
+            if "github.com" in code_text and len(code_text) < 2000:  # Limit size
+                code_blocks.append(code_text)
+    
+    # Extract main content (prioritize article tags, main, or body), stopping at the cap.
+    # Space-separate text nodes so URLs are not glued to the following text
+    if content_root is None:
+        content_root = soup.body
+    parts = []
+    length = 0
+    truncated = False
+    if content_root is not None:
+        for text in content_root.stripped_strings:
+            parts.append(text)
+            length += len(text) + 1
+            if length > MAX_CONTENT_CHARS:
+                truncated = True
+                break
+    content = " ".join(parts)
+    if truncated and len(content) <= MAX_CONTENT_CHARS:
+        # Stopped early at the cap; still mark the content as truncated
+        content = content[:MAX_CONTENT_CHARS] + "..."
+    
+    return _finish_parsed_page(title, content, links, hrefs, code_blocks, scan_github)
+
+def _empty_page_data() -> Dict[str, Any]:
+    """Page data returned when a page could not be scraped."""
+    return {
+        "title": "",
+        "content": "",
+        "links": [],
+        "github_urls": [],
+        "code_blocks": [],
+        "scrape_failed": True  # Assume failure until proven otherwise
+    }
+
+def _scrape_headers(attempt: int) -> Dict[str, str]:
+    """
+    Build request headers for a scrape attempt.
+    
+    Args:
+        attempt: Zero-based attempt number, used to rotate the user agent
+        
+    Returns:
+        Header dictionary
+    """
+    # Select user agent using centralized function
+    return {
+        'User-Agent': get_random_user_agent(attempt),
+        'Accept': 'text/html,application/xhtml+xml,application/xml',
+        'Accept-Language': 'en-US,en;q=0.9',
+    }
+
+# HTTP statuses worth retrying (blocked, rate limited, upstream trouble);
+# any other HTTP error fails the page immediately
+_RETRY_STATUSES = frozenset({403, 429, 502, 503, 504})
+_BACKOFF_CAP = 30.0
+_RETRY_AFTER_CAP = 60.0
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Compute the wait before the next scrape attempt.
+    
+    Exponential backoff with jitter, raised to the server's Retry-After
+    (seconds or HTTP date) when one was sent.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        retry_after: Retry-After response header, if any
+        
+    Returns:
+        Seconds to wait
+    """
+    wait = min(_BACKOFF_CAP, (2 ** attempt) + random.random())
+    if retry_after:
+        try:
+            requested = float(retry_after)
+        except ValueError:
+            try:
+                requested = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                requested = 0.0
+        wait = max(wait, min(requested, _RETRY_AFTER_CAP))
+    return wait
+
+def _http_error_info(error: Exception) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Status code and Retry-After header of a requests, aiohttp or httpx HTTP error.
+    
+    Args:
+        error: Exception raised while fetching a page
+        
+    Returns:
+        Tuple of (status code, Retry-After), or (None, None) for non-HTTP errors
+    """
+    if REQUESTS_AVAILABLE and isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code, error.response.headers.get('Retry-After')
+    if AIOHTTP_AVAILABLE and isinstance(error, aiohttp.ClientResponseError):
+        return error.status, (error.headers or {}).get('Retry-After')
+    if HTTPX_AVAILABLE and isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code, error.response.headers.get('Retry-After')
+    return None, None
+
+def _log_scrape_error(url: str, error: Exception, status_code: Optional[int]) -> None:
+    """Log a failed scrape attempt."""
+    if status_code == 403:
+        logger.warning("Received 403 Forbidden error from %s", url)
+    elif status_code is not None:
+        logger.warning("HTTP error %s when scraping %s: %s", status_code, url, error)
+    else:
+        logger.warning("Error scraping %s: %s", url, error)
+
+@log_execution_time("scrape_webpage")
+def scrape_webpage(url: str, max_retries: int = 2, session: Any = None) -> Dict[str, Any]:
     """
     Scrapes a webpage to extract content and GitHub URLs.
     Focuses specifically on finding GitHub repository references.
-    Includes retry mechanism with fixed 5-second delay between retries for handling 403 errors.
+    Retries network errors and 403/429/5xx gateway responses with exponential
+    backoff and jitter, honoring Retry-After; other HTTP errors fail at once.
+    Results are reused process-wide for an hour (a minute for failures).
     
     Args:
         url: Webpage URL
         max_retries: Maximum number of retry attempts (default: 2)
+        session: requests.Session to fetch with (default: the module's pooled
+            keep-alive session)
         
     Returns:
         Dictionary with page content and extracted GitHub URLs
     """
+    cached = _cached_scrape("page", url)
+    if cached is not None:
+        return cached
+    
+    page_data = _scrape_webpage(url, max_retries, session or _SESSION)
+    _store_scrape("page", url, page_data)
+    return page_data
+
+def _scrape_webpage(url: str, max_retries: int, session: Any) -> Dict[str, Any]:
+    """Uncached implementation of scrape_webpage."""
     if not REQUESTS_AVAILABLE:
         raise ImportError("requests is required for webpage scraping. Install with: pip install requests")
     
-    if not BS4_AVAILABLE:
-        raise ImportError("BeautifulSoup4 is required for webpage parsing. Install with: pip install beautifulsoup4")
+    if not HTML_PARSER_AVAILABLE:
+        raise ImportError("selectolax or BeautifulSoup4 is required for webpage parsing. Install with: pip install selectolax")
     
     # Initialize with default values
-    page_data = {
-        "title": "",
-        "content": "",
-        "links": [],
-        "github_urls": [],
-        "code_blocks": [],
-        "scrape_failed": True  # Assume failure until proven otherwise
-    }
+    page_data = _empty_page_data()
     
     # Auto-detect if URL is GitHub
     if "github.com" in url and "/blob/" not in url:
@@ -394,114 +1368,305 @@ def scrape_webpage(url: str, max_retries: int = 2) -> Dict[str, Any]:
         page_data["scrape_failed"] = False
         return page_data
     
+    # Reuse a recently scraped copy, or revalidate an older one with a conditional GET
+    cache = get_scrape_cache()
+    cached = cache.get(url) if cache else None
+    if cached and cached["fresh"]:
+        return cached["page_data"]
+    
     for attempt in range(max_retries + 1):
         try:
-            # Select user agent using centralized function
-            headers = {
-                'User-Agent': get_random_user_agent(attempt),
-                'Accept': 'text/html,application/xhtml+xml,application/xml',
-                'Accept-Language': 'en-US,en;q=0.9',
-            }
+            headers = _scrape_headers(attempt)
+            if cached:
+                headers.update(cache.conditional_headers(cached))
             
             # Log retry attempts
             if attempt > 0:
-                print(f"  Retry attempt {attempt}/{max_retries} for {url}")
-                print("  Waiting 5 seconds before retry...")
-                time.sleep(5)  # Fixed 5-second delay between retries
-            
-            # Make the request
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()  # Raise an exception for 4XX/5XX status codes
+                logger.info("Retry attempt %s/%s for %s", attempt, max_retries, url)
             
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Stream the response and stop reading once the size cap is reached
+            with session.get(url, headers=headers, timeout=(5, 10), stream=True) as response:
+                response.raise_for_status()  # Raise an exception for 4XX/5XX status codes
+                
+                # Unchanged since it was cached: skip the download and the parse
+                if response.status_code == 304 and cached:
+                    cache.touch(url)
+                    return cached["page_data"]
+                
+                # Spot GitHub URLs while the body streams in
+                body = bytearray()
+                extractor = GitHubUrlExtractor()
+                for chunk in response.iter_content(chunk_size=16384):
+                    body += chunk
+                    extractor.feed(chunk)
+                    if len(body) >= MAX_PAGE_BYTES:
+                        break
             
-            # Extract page title
-            title = soup.title.string if soup.title else ""
+            body = bytes(body[:MAX_PAGE_BYTES])
             
-            # Extract main content (prioritize article tags, main, or body)
-            content_tags = soup.select('article, main, .content, .post, .entry, #content')
-            if content_tags:
-                content = content_tags[0].get_text(strip=True)
-            else:
-                content = soup.body.get_text(strip=True) if soup.body else ""
+            # Parse the bounded body into page data, skipping the GitHub URL
+            # passes when the raw stream held none
+            page_data = _count_parse_truncation(_parse_page(body, url, scan_github=bool(extractor.close())))
             
-            # Limit content to avoid excessively large responses
-            content = content[:5000] + "..." if len(content) > 5000 else content
+            if cache:
+                cache.set(url, page_data, response.headers.get('ETag'), response.headers.get('Last-Modified'))
             
-            # Extract all links
-            links = []
-            for a_tag in soup.find_all('a', href=True):
-                link_text = a_tag.get_text(strip=True)
-                href = a_tag['href']
-                
-                # Convert relative URLs to absolute
-                if href.startswith('/') and not href.startswith('//'):
-                    parsed_url = urlparse(url)
-                    href = f"{parsed_url.scheme}://{parsed_url.netloc}{href}"
-                elif not (href.startswith('http://') or href.startswith('https://')):
-                    # Skip javascript: and other non-http links
-                    continue
-                
-                links.append({
-                    "url": href,
-                    "text": link_text[:100]  # Truncate long link text
-                })
+            return page_data
             
-            # Extract GitHub URLs
-            github_urls = extract_github_urls(response.text)
+        except Exception as e:
+            status_code, retry_after = _http_error_info(e)
+            _log_scrape_error(url, e, status_code)
             
-            # Extract code blocks that might contain GitHub references
-            code_blocks = []
-            for code_tag in soup.select('pre, code, .highlight'):
-                code_text = code_tag.get_text(strip=True)
-                if "github.com" in code_text and len(code_text) < 2000:  # Limit size
-                    code_blocks.append(code_text)
-                    # Also check for GitHub URLs in code blocks
-                    code_github_urls = extract_github_urls(code_text)
-                    if code_github_urls:
-                        github_urls.extend(code_github_urls)
+            # Give up on exhausted attempts or non-retryable HTTP errors,
+            # returning with the scrape_failed flag
+            if attempt == max_retries or (status_code is not None and status_code not in _RETRY_STATUSES):
+                return page_data
             
-            # Deduplicate GitHub URLs
-            github_urls = list(set(github_urls))
+            wait = _retry_delay(attempt, retry_after)
+            logger.info("Waiting %.1f seconds before retry...", wait)
+            time.sleep(wait)
+    
+    # If we reach here, all retry attempts have failed
+    return page_data
+
+async def _read_body_async(session: Any, url: str,
+                           headers: Dict[str, str]) -> Tuple[Optional[bytes], bool, Dict[str, Optional[str]]]:
+    """
+    Fetch at most MAX_PAGE_BYTES of a page over an aiohttp session or httpx client.
+    
+    Args:
+        session: aiohttp.ClientSession or httpx.AsyncClient
+        url: Webpage URL
+        headers: Request headers
+        
+    Returns:
+        Tuple of the (possibly truncated) response body, or None on 304 Not
+        Modified; whether any GitHub URL was seen while it streamed in; and
+        the response's ETag / Last-Modified validators
+    """
+    body = bytearray()
+    extractor = GitHubUrlExtractor()
+    if AIOHTTP_AVAILABLE and isinstance(session, aiohttp.ClientSession):
+        async with session.get(url, headers=headers,
+                               timeout=aiohttp.ClientTimeout(total=10)) as response:
+            response.raise_for_status()  # Raise an exception for 4XX/5XX status codes
+            validators = {"etag": response.headers.get('ETag'),
+                          "last_modified": response.headers.get('Last-Modified')}
+            if response.status == 304:
+                return None, False, validators
+            async for chunk in response.content.iter_chunked(16384):
+                body += chunk
+                extractor.feed(chunk)
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
+    else:
+        async with session.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            validators = {"etag": response.headers.get('ETag'),
+                          "last_modified": response.headers.get('Last-Modified')}
+            if response.status_code == 304:
+                return None, False, validators
+            async for chunk in response.aiter_bytes(16384):
+                body += chunk
+                extractor.feed(chunk)
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
+    return bytes(body[:MAX_PAGE_BYTES]), bool(extractor.close()), validators
+
+async def scrape_webpage_async(session: Any, url: str,
+                               max_retries: int = 2) -> Dict[str, Any]:
+    """
+    Asynchronous version of scrape_webpage using a shared client.
+    
+    Args:
+        session: aiohttp.ClientSession or httpx.AsyncClient (its pool sets the
+            connection limits)
+        url: Webpage URL
+        max_retries: Maximum number of retry attempts (default: 2)
+        
+    Returns:
+        Dictionary with page content and extracted GitHub URLs
+    """
+    cached = _cached_scrape("page", url)
+    if cached is not None:
+        return cached
+    
+    page_data = await _scrape_webpage_async(session, url, max_retries)
+    _store_scrape("page", url, page_data)
+    return page_data
+
+async def _scrape_webpage_async(session: Any, url: str, max_retries: int) -> Dict[str, Any]:
+    """Uncached implementation of scrape_webpage_async."""
+    if not HTML_PARSER_AVAILABLE:
+        raise ImportError("selectolax or BeautifulSoup4 is required for webpage parsing. Install with: pip install selectolax")
+    
+    page_data = _empty_page_data()
+    
+    # Auto-detect if URL is GitHub
+    if "github.com" in url and "/blob/" not in url:
+        page_data["github_urls"] = [url]
+        page_data["scrape_failed"] = False
+        return page_data
+    
+    # Reuse a recently scraped copy, or revalidate an older one with a conditional GET
+    cache = get_scrape_cache()
+    cached = cache.get(url) if cache else None
+    if cached and cached["fresh"]:
+        return cached["page_data"]
+    
+    for attempt in range(max_retries + 1):
+        try:
+            # Log retry attempts
+            if attempt > 0:
+                logger.info("Retry attempt %s/%s for %s", attempt, max_retries, url)
             
-            # Update page data
-            page_data = {
-                "title": title,
-                "content": content,
-                "links": links,
-                "github_urls": github_urls,
-                "code_blocks": code_blocks,
-                "scrape_failed": False  # Scraping was successful
-            }
+            headers = _scrape_headers(attempt)
+            if cached:
+                headers.update(cache.conditional_headers(cached))
+            body, has_github, validators = await _read_body_async(session, url, headers)
             
-            return page_data
+            # Unchanged since it was cached: skip the parse
+            if body is None and cached:
+                cache.touch(url)
+                return cached["page_data"]
             
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if hasattr(e, 'response') else 0
+            # Parse in a worker process so the event loop keeps fetching
+            try:
+                parsed = await asyncio.get_running_loop().run_in_executor(
+                    _get_parse_pool(), _parse_page, body, url, has_github)
+            except BrokenProcessPool:
+                parsed = _parse_page(body, url, has_github)
+            page_data = _count_parse_truncation(parsed)
             
-            if status_code == 403:
-                print(f"  Received 403 Forbidden error from {url}")
-            else:
-                print(f"  HTTP error {status_code} when scraping {url}: {str(e)}")
+            if cache:
+                cache.set(url, page_data, validators["etag"], validators["last_modified"])
+            return page_data
             
-            # If we've exhausted retry attempts, return with scrape_failed flag
-            if attempt == max_retries:
-                return page_data
-                
         except Exception as e:
-            print(f"  Error scraping {url}: {str(e)}")
+            status_code, retry_after = _http_error_info(e)
+            _log_scrape_error(url, e, status_code)
             
-            # If we've exhausted retry attempts, return with scrape_failed flag
-            if attempt == max_retries:
-                return page_data
+            # Give up on exhausted attempts or non-retryable HTTP errors
+            if attempt == max_retries or (status_code is not None and status_code not in _RETRY_STATUSES):
+                break
+            
+            wait = _retry_delay(attempt, retry_after)
+            logger.info("Waiting %.1f seconds before retry...", wait)
+            await asyncio.sleep(wait)
     
     # If we reach here, all retry attempts have failed
     return page_data
 
+def _async_scrape_client(concurrency: int) -> Any:
+    """
+    Create the pooled async client used for page scraping.
+    
+    Args:
+        concurrency: Maximum number of pages in flight at once
+        
+    Returns:
+        aiohttp.ClientSession when aiohttp is installed, otherwise an
+        httpx.AsyncClient; use it as an async context manager
+    """
+    if AIOHTTP_AVAILABLE:
+        connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=_MAX_REQUESTS_PER_HOST)
+        return aiohttp.ClientSession(connector=connector)
+    return httpx.AsyncClient(http2=H2_AVAILABLE, follow_redirects=True,
+                             limits=httpx.Limits(max_connections=max(concurrency, 20),
+                                                 max_keepalive_connections=20),
+                             timeout=httpx.Timeout(10, connect=5))
+
+def _bounded_page_scraper(concurrency: int) -> Callable[[Any, str], Awaitable[Dict[str, Any]]]:
+    """
+    Wrap scrape_webpage_async in global and per-host concurrency limits.
+    
+    Call this from the event loop that will run the scrapes, since the
+    semaphores bind to it.
+    
+    Args:
+        concurrency: Maximum number of pages in flight at once
+        
+    Returns:
+        Coroutine function taking (client, url) and returning page data
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    # Per-host cap, held across retries and backoff so one slow or rate-limiting
+    # host cannot take every slot
+    host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(_MAX_REQUESTS_PER_HOST))
+    
+    async def scrape(session: Any, url: str) -> Dict[str, Any]:
+        async with host_semaphores[urlparse(url).netloc], semaphore:
+            return await scrape_webpage_async(session, url)
+    
+    return scrape
+
+async def scrape_webpages_async(urls: List[str], concurrency: int = 20) -> List[Dict[str, Any]]:
+    """
+    Fetch and parse pages concurrently over one pooled client.
+    
+    Uses aiohttp when installed, otherwise an httpx.AsyncClient. A page that
+    raises becomes an empty failed result instead of cancelling the others.
+    
+    Args:
+        urls: Webpage URLs
+        concurrency: Maximum number of pages in flight at once
+        
+    Returns:
+        List of page data dictionaries, in the same order as urls
+    """
+    if not AIOHTTP_AVAILABLE and not HTTPX_AVAILABLE:
+        raise ImportError("aiohttp or httpx is required for asynchronous scraping. Install with: pip install aiohttp")
+    
+    scrape = _bounded_page_scraper(concurrency)
+    async with _async_scrape_client(concurrency) as session:
+        results = await asyncio.gather(*(scrape(session, url) for url in urls),
+                                       return_exceptions=True)
+    
+    return [_empty_page_data() if isinstance(result, BaseException) else result
+            for result in results]
+
+def _scrape_pages_threaded(urls: List[str]) -> List[Dict[str, Any]]:
+    """Fetch and parse pages with scrape_webpage on a thread pool."""
+    def scrape(url: str) -> Dict[str, Any]:
+        with _host_semaphore(url):
+            return scrape_webpage(url)
+    
+    with ThreadPoolExecutor(max_workers=_SCRAPE_WORKERS) as executor:
+        return list(executor.map(scrape, urls))
+
+def scrape_webpages(urls: List[str], concurrency: int = 20) -> List[Dict[str, Any]]:
+    """
+    Scrape several pages concurrently.
+    
+    Runs scrape_webpages_async when aiohttp (or httpx) is installed and no
+    event loop is already running in this thread, otherwise a thread pool
+    over scrape_webpage.
+    
+    Args:
+        urls: Webpage URLs
+        concurrency: Maximum number of pages in flight at once (async path)
+        
+    Returns:
+        List of page data dictionaries, in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    if (AIOHTTP_AVAILABLE or HTTPX_AVAILABLE) and HTML_PARSER_AVAILABLE:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(scrape_webpages_async(urls, concurrency))
+    
+    return _scrape_pages_threaded(urls)
+
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
-    Extract the domain name from a URL.
+    Extract the domain name from a URL. Results are memoized: each search
+    result's URL is looked up again for the per-host scrape limit.
     
     Args:
         url: URL to extract domain from
@@ -509,15 +1674,37 @@ def extract_domain(url: str) -> str:
     Returns:
         Domain name
     """
-    try:
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-        # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        return domain
-    except:
-        return url
+    # Slice the host out with a few str.find calls; a full urlparse is
+    # overkill for pulling out the netloc
+    start = url.find('://')
+    start = start + 3 if start >= 0 else 0
+    end = len(url)
+    for separator in '/?#':
+        index = url.find(separator, start, end)
+        if index >= 0:
+            end = index
+    domain = url[start:end]
+    # Drop credentials and port
+    domain = domain[domain.rfind('@') + 1:]
+    port = domain.find(':')
+    if port >= 0:
+        domain = domain[:port]
+    # Remove www. prefix if present
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+# User agents rotated across scrape attempts
+USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:90.0) Gecko/20100101 Firefox/90.0',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (iPad; CPU OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59'
+)
 
 def get_random_user_agent(index=None):
     """
@@ -529,27 +1716,70 @@ def get_random_user_agent(index=None):
     Returns:
         User agent string
     """
-    user_agents = [
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15',
-        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:90.0) Gecko/20100101 Firefox/90.0',
-        'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
-        'Mozilla/5.0 (iPad; CPU OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59'
-    ]
-    
     if index is not None:
-        return user_agents[index % len(user_agents)]
+        return USER_AGENTS[index % len(USER_AGENTS)]
     
-    return random.choice(user_agents)
+    return random.choice(USER_AGENTS)
+
+def build_relevance_automaton(keywords: List[str] = None,
+                              tech_stack: List[str] = None,
+                              features: List[str] = None) -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton matching all relevance needles in one scan.
+    
+    Args:
+        keywords: List of keywords
+        tech_stack: List of technologies
+        features: List of features
+        
+    Returns:
+        ahocorasick.Automaton whose values are tuples of (category, original
+        needle), or None if pyahocorasick is not installed or there are no needles
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    # Automata are shared by every call with the same needles
+    return _relevance_automaton(tuple(keywords or ()), tuple(tech_stack or ()), tuple(features or ()))
+
+@lru_cache(maxsize=32)
+def _relevance_automaton(keywords: Tuple[str, ...], tech_stack: Tuple[str, ...],
+                         features: Tuple[str, ...]) -> Optional[Any]:
+    """Build (once per needle set) the automaton returned by build_relevance_automaton."""
+    # Group by lowercased needle, since one string may appear in several categories
+    entries: Dict[str, List[Tuple[str, str]]] = {}
+    for category, needles in (("keywords", keywords), ("tech", tech_stack), ("features", features)):
+        for needle in needles:
+            if needle:
+                entries.setdefault(needle.lower(), []).append((category, needle))
+    
+    if not entries:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for needle_lc, values in entries.items():
+        automaton.add_word(needle_lc, tuple(values))
+    automaton.make_automaton()
+    return automaton
+
+@lru_cache(maxsize=128)
+def _lowercased(terms: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercase a tuple of relevance needles (memoized per needle list)."""
+    return tuple(term.lower() for term in terms)
+
+# Weights of the algorithmic relevance score: GitHub URLs are most important,
+# followed by features, tech stack, and keywords
+_GITHUB_WEIGHT = 0.4
+_FEATURES_WEIGHT = 0.3
+_TECH_STACK_WEIGHT = 0.2
+_KEYWORDS_WEIGHT = 0.1
 
 def check_content_relevance(content: Dict[str, str], 
                          keywords: List[str] = None, 
                          tech_stack: List[str] = None, 
                          features: List[str] = None,
-                         threshold: float = 0.5) -> Dict[str, Any]:
+                         threshold: float = 0.5,
+                         automaton: Optional[Any] = None) -> Dict[str, Any]:
     """
     Checks if content is relevant based on keywords, tech stack, and features.
     
@@ -559,6 +1789,9 @@ def check_content_relevance(content: Dict[str, str],
         tech_stack: List of technologies to check against
         features: List of features to check against
         threshold: Minimum relevance score (0-1)
+        automaton: Optional automaton from build_relevance_automaton for the
+            same keywords, tech stack and features; matches all needles in one pass.
+            Looked up from the automaton cache when omitted
         
     Returns:
         Dictionary with relevance analysis including:
@@ -578,38 +1811,44 @@ def check_content_relevance(content: Dict[str, str],
     text = f"{content.get('title', '')} {content.get('snippet', '')}"
     text = text.lower()
     
-    # Find matches
-    matched_keywords = [kw for kw in keywords if kw.lower() in text]
-    matched_tech = [tech for tech in tech_stack if tech.lower() in text]
-    matched_features = [feature for feature in features if feature.lower() in text]
+    if automaton is None:
+        automaton = build_relevance_automaton(keywords, tech_stack, features)
+    
+    if automaton is not None:
+        # One linear scan finds every needle, then keep the caller's ordering
+        found = {"keywords": set(), "tech": set(), "features": set()}
+        for _, values in automaton.iter(text):
+            for category, needle in values:
+                found[category].add(needle)
+        matched_keywords = [kw for kw in keywords if kw in found["keywords"]]
+        matched_tech = [tech for tech in tech_stack if tech in found["tech"]]
+        matched_features = [feature for feature in features if feature in found["features"]]
+    else:
+        # Needles are lowercased once per needle list (memoized across results),
+        # then matched against the lowercased text
+        keywords, tech_stack, features = tuple(keywords), tuple(tech_stack), tuple(features)
+        matched_keywords = [kw for kw, lc in zip(keywords, _lowercased(keywords)) if lc in text]
+        matched_tech = [tech for tech, lc in zip(tech_stack, _lowercased(tech_stack)) if lc in text]
+        matched_features = [feature for feature, lc in zip(features, _lowercased(features)) if lc in text]
     
     # Already extracted GitHub URLs if available
-    has_github_urls = "github_urls" in content and bool(content["github_urls"])
+    has_github_urls = bool(content.get("github_urls"))
     github_url_in_text = "github.com" in text
     
-    # Calculate weights for different match types
-    # GitHub URLs are most important, followed by features, tech stack, and keywords
-    weights = {
-        "github_urls": 0.4,  # 40% weight for GitHub URLs
-        "features": 0.3,     # 30% weight for features
-        "tech_stack": 0.2,   # 20% weight for tech stack
-        "keywords": 0.1      # 10% weight for general keywords
-    }
-    
     # Calculate weighted score components
-    github_score = weights["github_urls"] if (has_github_urls or github_url_in_text) else 0
+    github_score = _GITHUB_WEIGHT if (has_github_urls or github_url_in_text) else 0
     
     feature_score = 0
     if features:
-        feature_score = weights["features"] * (len(matched_features) / len(features))
+        feature_score = _FEATURES_WEIGHT * (len(matched_features) / len(features))
         
     tech_score = 0
     if tech_stack:
-        tech_score = weights["tech_stack"] * (len(matched_tech) / len(tech_stack))
+        tech_score = _TECH_STACK_WEIGHT * (len(matched_tech) / len(tech_stack))
         
     keyword_score = 0
     if keywords:
-        keyword_score = weights["keywords"] * (len(matched_keywords) / len(keywords))
+        keyword_score = _KEYWORDS_WEIGHT * (len(matched_keywords) / len(keywords))
     
     # Calculate overall relevance score
     relevance_score = github_score + feature_score + tech_score + keyword_score
@@ -637,40 +1876,109 @@ def check_content_relevance(content: Dict[str, str],
         "reasoning": "; ".join(reasoning) if reasoning else "No relevant matches found"
     }
 
-def check_content_relevance_with_llm(content: Dict[str, str], 
-                                query: str,
-                                keywords: List[str] = None, 
-                                tech_stack: List[str] = None, 
-                                features: List[str] = None,
-                                threshold: float = 0.5) -> Dict[str, Any]:
+# Ambiguous results scored per LLM call by check_content_relevance_with_llm_batch
+RELEVANCE_BATCH_SIZE = 10
+
+def check_content_relevance_many(contents: List[Dict[str, str]],
+                                 keywords: List[str] = None,
+                                 tech_stack: List[str] = None,
+                                 features: List[str] = None,
+                                 threshold: float = 0.5,
+                                 automaton: Optional[Any] = None,
+                                 query: Optional[str] = None,
+                                 max_workers: int = 8) -> List[Dict[str, Any]]:
     """
-    Uses LLM to check if content is relevant based on the query, keywords, tech stack, and features.
-    Falls back to algorithm-based relevance checking if the LLM fails.
+    Check several results for relevance, in input order.
+    
+    Results sharing a canonical URL are scored once. With a query, results go
+    through the batched LLM check, up to max_workers LLM calls in flight.
+    Without one, the algorithmic check is CPU-bound (so threads would not help
+    under the GIL) and runs in a loop sharing one keyword automaton.
     
     Args:
-        content: Dictionary with content info (title, url, snippet)
-        query: The original or refined search query
+        contents: Dictionaries with content info (title, url, snippet)
         keywords: List of keywords to check against
         tech_stack: List of technologies to check against
         features: List of features to check against
         threshold: Minimum relevance score (0-1)
+        automaton: Optional automaton from build_relevance_automaton
+        query: Search query for the LLM check (None for algorithm-only)
+        max_workers: Maximum number of concurrent LLM calls
         
     Returns:
-        Dictionary with relevance analysis
+        Relevance analysis for each result, in input order
     """
-    # Initialize empty lists if not provided
-    keywords = keywords or []
-    tech_stack = tech_stack or []
-    features = features or []
+    # Score each distinct URL once; results without a URL are all scored
+    positions = {}
+    unique = []
+    slots = []
+    for content in contents:
+        url = content.get("url")
+        key = _canonical_url(url) if url else None
+        if key is None or key not in positions:
+            if key is not None:
+                positions[key] = len(unique)
+            slots.append(len(unique))
+            unique.append(content)
+        else:
+            slots.append(positions[key])
     
-    # Extract content to analyze
-    title = content.get('title', '')
-    snippet = content.get('snippet', '')
-    url = content.get('url', '')
+    if query is not None:
+        scored = check_content_relevance_with_llm_batch(unique, query, keywords, tech_stack, features,
+                                                        threshold=threshold, automaton=automaton,
+                                                        max_workers=max_workers)
+    else:
+        if automaton is None:
+            automaton = build_relevance_automaton(keywords, tech_stack, features)
+        scored = [check_content_relevance(content, keywords, tech_stack, features,
+                                          threshold=threshold, automaton=automaton)
+                  for content in unique]
+    
+    # Duplicates get their own copy so callers can annotate results independently
+    seen = set()
+    results = []
+    for slot in slots:
+        results.append(scored[slot] if slot not in seen else dict(scored[slot]))
+        seen.add(slot)
+    return results
+
+def check_content_relevance_groups(groups: List[List[Dict[str, str]]], **kwargs: Any) -> List[List[Dict[str, Any]]]:
+    """
+    Check the result lists of several searches (e.g. from batch_search_web)
+    for relevance together, so a URL returned by more than one query is
+    scored only once.
+    
+    Args:
+        groups: One result list per search
+        **kwargs: Arguments for check_content_relevance_many
+        
+    Returns:
+        Relevance analysis for each result, grouped like the input
+    """
+    scored = iter(check_content_relevance_many(list(chain.from_iterable(groups)), **kwargs))
+    return [list(islice(scored, len(group))) for group in groups]
+
+def _relevance_without_llm(content: Dict[str, Any], keywords: List[str], tech_stack: List[str],
+                           features: List[str], threshold: float, automaton: Optional[Any],
+                           decisive_margin: float = _DECISIVE_MARGIN) -> Tuple[Dict[str, Any], bool]:
+    """
+    Decide relevance without the LLM where possible.
     
+    Args:
+        content: Dictionary with content info (title, url, snippet)
+        keywords: List of keywords to check against
+        tech_stack: List of technologies to check against
+        features: List of features to check against
+        threshold: Minimum relevance score (0-1)
+        automaton: Optional automaton from build_relevance_automaton
+        decisive_margin: Distance from the threshold beyond which the
+            algorithmic score is trusted without the LLM
+        
+    Returns:
+        Tuple of (relevance analysis, whether the LLM should still be asked)
+    """
     # First check if we already know it has GitHub URLs - automatic relevance
-    has_github_urls = "github_urls" in content and bool(content["github_urls"])
-    if has_github_urls:
+    if content.get("github_urls"):
         return {
             "is_relevant": True,
             "relevance_score": 0.9,
@@ -679,72 +1987,584 @@ def check_content_relevance_with_llm(content: Dict[str, str],
             "matched_features": features,
             "has_github_urls": True,
             "reasoning": "Already contains GitHub repository URLs"
-        }
+        }, False
+    
+    # Run the cheap algorithmic check first
+    algo = check_content_relevance(content, keywords, tech_stack, features, threshold, automaton)
     
     # If snippet is too short or missing, fall back to algorithmic approach
+    snippet = content.get('snippet', '')
     if not snippet or len(snippet) < 50:
-        return check_content_relevance(content, keywords, tech_stack, features, threshold)
+        return algo, False
     
-    # Keep snippet length reasonable for the LLM
-    snippet_preview = snippet[:1000] + ("..." if len(snippet) > 1000 else "")
+    # Nothing asked for appears in the result and it mentions no GitHub URL,
+    # so the LLM has nothing to weigh, whatever the threshold
+    score = algo["relevance_score"]
+    if score == 0 and (keywords or tech_stack or features):
+        return algo, False
+
+    # Skip the LLM when the algorithmic score is clearly above or below the threshold
+    decisive = score >= threshold + decisive_margin or score <= threshold - decisive_margin
+    return algo, not decisive
+
+# string.Template rather than str.format, so the JSON example needs no brace escaping
+_RELEVANCE_BATCH_PROMPT = string.Template(textwrap.dedent("""
+    Assess if each of these content items is relevant to the user's search for GitHub repositories:
+    
+    $items
+    
+    User is looking for:
+    - Query: $query
+    - Keywords: $keywords
+    - Technologies: $tech_stack
+    - Features: $features
+    
+    For each item, determine if it is likely to:
+    1. Contain or link to GitHub repositories
+    2. Discuss implementations of the requested technologies
+    3. Cover the desired features
+    
+    Respond with a JSON object holding one result per item, in this exact format:
+    {
+      "results": [
+        {"i": 0, "is_relevant": true/false, "relevance_score": 0.0-1.0, "reasoning": "brief explanation"}
+      ]
+    }
+""").strip())
+
+def _relevance_batch_prompt(contents: List[Dict[str, Any]], query: str, keywords: List[str],
+                            tech_stack: List[str], features: List[str]) -> str:
+    """
+    Build one prompt asking the LLM to score several results.
+    
+    Args:
+        contents: Results to score, tagged in the prompt by their index
+        query: The original or refined search query
+        keywords: List of keywords
+        tech_stack: List of technologies
+        features: List of features
+        
+    Returns:
+        Prompt text
+    """
+    items = []
+    for i, content in enumerate(contents):
+        # Keep snippet length reasonable for the LLM
+        snippet = content.get('snippet', '')
+        items.append({
+            "i": i,
+            "title": content.get('title', ''),
+            "url": content.get('url', ''),
+            "snippet": snippet[:1000] + ("..." if len(snippet) > 1000 else "")
+        })
     
     # Format lists for the prompt
     keywords_str = ", ".join(keywords) if keywords else "None specified"
     tech_stack_str = ", ".join(tech_stack) if tech_stack else "None specified"
     features_str = ", ".join(features) if features else "None specified"
     
-    prompt = f"""
-    Assess if this content is relevant to the user's search for GitHub repositories:
+    return _RELEVANCE_BATCH_PROMPT.substitute(items=json.dumps(items, ensure_ascii=False), query=query,
+                                              keywords=keywords_str, tech_stack=tech_stack_str,
+                                              features=features_str)
+
+def _apply_relevance_batch(response: Optional[str], contents: List[Dict[str, Any]],
+                           fallbacks: List[Dict[str, Any]], keywords: List[str],
+                           tech_stack: List[str], features: List[str]) -> List[Dict[str, Any]]:
+    """
+    Map a batch relevance reply back onto its results by index.
     
-    Content title: {title}
-    Content URL: {url}
-    Content snippet: {snippet_preview}
+    Args:
+        response: LLM reply (a {"results": [...]} object), or None if the call failed
+        contents: Results that were scored
+        fallbacks: Algorithmic analysis for each result, kept for any the reply omits
+        keywords: List of keywords
+        tech_stack: List of technologies
+        features: List of features
+        
+    Returns:
+        Relevance analysis for each result, in input order
+    """
+    results = list(fallbacks)
+    # JSON mode returns the object as the whole reply, which _extract_json parses
+    # directly; the scan only runs for providers without JSON mode
+    parsed = _extract_json(response, '{') if response else None
+    entries = parsed.get("results") if isinstance(parsed, dict) else None
+    if not isinstance(entries, list):
+        if response:
+            logger.warning("LLM-based relevance check returned no results object")
+        return results
     
-    User is looking for:
-    - Query: {query}
-    - Keywords: {keywords_str}
-    - Technologies: {tech_stack_str}
-    - Features: {features_str}
+    for entry in entries:
+        # Validate result structure
+        if not isinstance(entry, dict) or "is_relevant" not in entry or "relevance_score" not in entry:
+            continue
+        i = entry.pop("i", None)
+        if not isinstance(i, int) or not 0 <= i < len(results):
+            continue
+        # Add the fields from the normal relevance check for consistency
+        entry["matched_keywords"] = keywords
+        entry["matched_tech"] = tech_stack
+        entry["matched_features"] = features
+        entry["has_github_urls"] = "github.com" in contents[i].get('snippet', '').lower()
+        entry.setdefault("reasoning", "")
+        results[i] = entry
+    return results
+
+def _plan_relevance_batches(contents: List[Dict[str, Any]], keywords: List[str], tech_stack: List[str],
+                            features: List[str], threshold: float, automaton: Optional[Any],
+                            batch_size: int, decisive_margin: float) -> Tuple[List[Dict[str, Any]], List[List[int]]]:
+    """
+    Score every result without the LLM and group the ambiguous ones into batches.
     
-    Determine if this content is likely to:
-    1. Contain or link to GitHub repositories
-    2. Discuss implementations of the requested technologies
-    3. Cover the desired features
+    Returns:
+        Tuple of (relevance analysis per result, batches of result indexes for the LLM)
+    """
+    results = []
+    pending = []
+    for i, content in enumerate(contents):
+        result, ask_llm = _relevance_without_llm(content, keywords, tech_stack, features, threshold,
+                                                 automaton, decisive_margin)
+        results.append(result)
+        if ask_llm:
+            pending.append(i)
+    batch_size = max(1, batch_size)
+    return results, [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+
+def check_content_relevance_with_llm_batch(contents: List[Dict[str, str]],
+                                           query: str,
+                                           keywords: List[str] = None,
+                                           tech_stack: List[str] = None,
+                                           features: List[str] = None,
+                                           threshold: float = 0.5,
+                                           automaton: Optional[Any] = None,
+                                           batch_size: int = RELEVANCE_BATCH_SIZE,
+                                           decisive_margin: float = _DECISIVE_MARGIN,
+                                           max_workers: int = _RELEVANCE_WORKERS) -> List[Dict[str, Any]]:
+    """
+    Uses LLM to check if several results are relevant, scoring up to batch_size
+    of them per LLM call, with up to max_workers calls in flight. Results with
+    GitHub URLs, short snippets or a clearly decisive algorithmic score skip
+    the LLM; anything the LLM fails to score falls back to algorithm-based
+    relevance checking.
     
-    Respond with a JSON object in this exact format:
-    {{
-      "is_relevant": true/false,
-      "relevance_score": 0.0-1.0,
-      "reasoning": "brief explanation"
-    }}
+    Args:
+        contents: Dictionaries with content info (title, url, snippet)
+        query: The original or refined search query
+        keywords: List of keywords to check against
+        tech_stack: List of technologies to check against
+        features: List of features to check against
+        threshold: Minimum relevance score (0-1)
+        automaton: Optional automaton from build_relevance_automaton
+        batch_size: Maximum number of results per LLM call
+        decisive_margin: Distance from the threshold beyond which the
+            algorithmic score is trusted without the LLM
+        max_workers: Maximum number of batches scored concurrently
+        
+    Returns:
+        Relevance analysis for each result, in input order
     """
+    # Initialize empty lists if not provided
+    keywords = keywords or []
+    tech_stack = tech_stack or []
+    features = features or []
     
-    try:
-        response = call_llm(prompt, temperature=0.1)
-        # Extract JSON from the response
-        import json
-        import re
-        
-        # Find JSON object in the response using regex
-        json_match = re.search(r'\{[\s\S]*\}', response)
-        if json_match:
-            json_str = json_match.group(0)
-            result = json.loads(json_str)
-            
-            # Validate result structure
-            if "is_relevant" in result and "relevance_score" in result:
-                # Add the fields from the normal relevance check for consistency
-                result["matched_keywords"] = keywords
-                result["matched_tech"] = tech_stack
-                result["matched_features"] = features
-                result["has_github_urls"] = "github.com" in snippet.lower()
-                return result
+    results, batches = _plan_relevance_batches(contents, keywords, tech_stack, features,
+                                               threshold, automaton, batch_size, decisive_margin)
     
-    except Exception as e:
-        print(f"LLM-based relevance check failed: {str(e)}")
+    def score(batch: List[int]) -> List[Dict[str, Any]]:
+        batch_contents = [contents[i] for i in batch]
+        try:
+            response = cached_call_llm(_relevance_batch_prompt(batch_contents, query, keywords, tech_stack, features),
+                                       temperature=0.1, response_format=_JSON_RESPONSE_FORMAT)
+        except Exception as e:
+            logger.warning("LLM-based relevance check failed: %s", e)
+            response = None
+        return _apply_relevance_batch(response, batch_contents, [results[i] for i in batch],
+                                      keywords, tech_stack, features)
+    
+    # A single batch needs no pool
+    if len(batches) <= 1 or max_workers <= 1:
+        scored_batches = map(score, batches)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            scored_batches = list(executor.map(score, batches))
+    
+    for batch, scored in zip(batches, scored_batches):
+        for i, result in zip(batch, scored):
+            results[i] = result
+    return results
+
+async def check_content_relevance_with_llm_batch_async(contents: List[Dict[str, str]],
+                                                       query: str,
+                                                       keywords: List[str] = None,
+                                                       tech_stack: List[str] = None,
+                                                       features: List[str] = None,
+                                                       threshold: float = 0.5,
+                                                       automaton: Optional[Any] = None,
+                                                       batch_size: int = RELEVANCE_BATCH_SIZE,
+                                                       decisive_margin: float = _DECISIVE_MARGIN) -> List[Dict[str, Any]]:
+    """
+    Awaitable version of check_content_relevance_with_llm_batch that sends all
+    batches concurrently on the shared LLM executor.
+    
+    Args:
+        contents: Dictionaries with content info (title, url, snippet)
+        query: The original or refined search query
+        keywords: List of keywords to check against
+        tech_stack: List of technologies to check against
+        features: List of features to check against
+        threshold: Minimum relevance score (0-1)
+        automaton: Optional automaton from build_relevance_automaton
+        batch_size: Maximum number of results per LLM call
+        decisive_margin: Distance from the threshold beyond which the
+            algorithmic score is trusted without the LLM
+        
+    Returns:
+        Relevance analysis for each result, in input order
+    """
+    # Initialize empty lists if not provided
+    keywords = keywords or []
+    tech_stack = tech_stack or []
+    features = features or []
+    
+    results, batches = _plan_relevance_batches(contents, keywords, tech_stack, features,
+                                               threshold, automaton, batch_size, decisive_margin)
+    batch_contents = [[contents[i] for i in batch] for batch in batches]
+    responses = await gather_llm([_relevance_batch_prompt(chunk, query, keywords, tech_stack, features)
+                                  for chunk in batch_contents],
+                                 temperature=0.1, response_format=_JSON_RESPONSE_FORMAT)
+    for batch, chunk, response in zip(batches, batch_contents, responses):
+        if isinstance(response, Exception):
+            logger.warning("LLM-based relevance check failed: %s", response)
+            response = None
+        scored = _apply_relevance_batch(response, chunk, [results[i] for i in batch],
+                                        keywords, tech_stack, features)
+        for i, result in zip(batch, scored):
+            results[i] = result
+    return results
+
+def check_content_relevance_with_llm(content: Dict[str, str], 
+                                query: str,
+                                keywords: List[str] = None, 
+                                tech_stack: List[str] = None, 
+                                features: List[str] = None,
+                                threshold: float = 0.5,
+                                automaton: Optional[Any] = None,
+                                decisive_margin: float = _DECISIVE_MARGIN) -> Dict[str, Any]:
+    """
+    Uses LLM to check if content is relevant based on the query, keywords, tech stack, and features.
+    The LLM is skipped when the algorithmic score is already decisive.
+    Falls back to algorithm-based relevance checking if the LLM fails.
     
-    # Fallback to algorithmic approach
-    return check_content_relevance(content, keywords, tech_stack, features, threshold)
+    Args:
+        content: Dictionary with content info (title, url, snippet)
+        query: The original or refined search query
+        keywords: List of keywords to check against
+        tech_stack: List of technologies to check against
+        features: List of features to check against
+        threshold: Minimum relevance score (0-1)
+        automaton: Optional automaton from build_relevance_automaton
+        decisive_margin: Distance from the threshold beyond which the
+            algorithmic score is trusted without the LLM
+        
+    Returns:
+        Dictionary with relevance analysis
+    """
+    return check_content_relevance_with_llm_batch([content], query, keywords, tech_stack, features,
+                                                  threshold=threshold, automaton=automaton,
+                                                  decisive_margin=decisive_margin)[0]
+
+def _screen_items(items: List[Dict[str, Any]], kind: str, refined_query: str,
+                  keywords: List[str], tech_stack: List[str], features: List[str],
+                  use_llm: bool, threshold: float, automaton: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """
+    Check search results for relevance before they are scraped.
+    
+    Args:
+        items: YouTube or web search results
+        kind: Label used in progress output (e.g. 'YouTube video')
+        refined_query: Query used for the LLM relevance check
+        keywords: Keywords for relevance filtering
+        tech_stack: Technologies for relevance filtering
+        features: Features for relevance filtering
+        use_llm: Whether to use the (batched) LLM relevance check
+        threshold: Minimum relevance score (0.0-1.0)
+        automaton: Optional automaton from build_relevance_automaton
+        
+    Returns:
+        Relevance analysis dictionary for each item, in input order
+    """
+    # Check relevance with the standard or LLM-enhanced method
+    relevances = check_content_relevance_many(items, keywords, tech_stack, features, threshold=threshold,
+                                              automaton=automaton, query=refined_query if use_llm else None)
+    
+    total = len(items)
+    for i, (item, relevance) in enumerate(zip(items, relevances)):
+        logger.info("Checking %s %s/%s: %s", kind, i+1, total, item['title'])
+        if relevance["is_relevant"]:
+            logger.info("Relevance: %.2f - %s", relevance['relevance_score'], relevance['reasoning'])
+        else:
+            logger.info("Skipping (not relevant): %s", relevance['reasoning'])
+    
+    return relevances
+
+def _comment_text(comment: Any) -> str:
+    """Text of a scraped comment, given as a string or a yt-dlp comment dictionary."""
+    if isinstance(comment, dict):
+        return comment.get('text', '')
+    return comment if isinstance(comment, str) else ''
+
+def _video_fallback_texts(video_data: Dict[str, Any]) -> List[str]:
+    """
+    Texts of a scraped video handed to LLM URL extraction, in the order they
+    are tried; the comments are only used if the description yields nothing.
+    
+    Args:
+        video_data: Scraped video details from scrape_youtube_videos
+        
+    Returns:
+        The description and the first five comments joined together
+    """
+    comments = video_data.get('comments', [])[:5]
+    return [video_data.get('description', ''), "\n".join(map(_comment_text, comments))]
+
+def _extract_urls_in_tiers(items: List[Dict[str, Any]], texts: List[List[str]], max_workers: int) -> None:
+    """
+    Fill in github_urls from LLM URL extraction, one tier of texts at a time.
+    
+    Each tier is one batched extraction over the items still without URLs, so
+    an item's later texts (a video's comments) are only sent when its earlier
+    ones yielded nothing.
+    
+    Args:
+        items: Scraped item dictionaries the regex found no URLs in
+        texts: Fallback texts for each item, in the order they are tried
+        max_workers: Concurrent LLM calls for the batched extraction
+    """
+    for tier in range(max(map(len, texts), default=0)):
+        pending = [(item, item_texts[tier]) for item, item_texts in zip(items, texts)
+                   if tier < len(item_texts) and not item.get('github_urls')]
+        if not pending:
+            break
+        found = batch_extract_github_urls([text for _, text in pending], regex_checked=True,
+                                          max_workers=max_workers)
+        for (item, _), llm_urls in zip(pending, found):
+            if llm_urls:
+                item['github_urls'] = llm_urls
+
+def _page_fallback_text(page_data: Dict[str, Any]) -> str:
+    """Text of a scraped page handed to LLM URL extraction (limited for the LLM)."""
+    return page_data.get('content', '')[:5000]
+
+def _finish_video(video: Dict[str, Any], video_data: Dict[str, Any], use_llm: bool) -> Dict[str, Any]:
+    """
+    Collect GitHub URLs for a scraped video, falling back to LLM extraction.
+    
+    Args:
+        video: YouTube search result
+        video_data: Scraped video details from scrape_youtube_videos
+        use_llm: Whether to use LLM URL extraction when the regex finds nothing
+        
+    Returns:
+        Dictionary with a failed flag and the video (with github_urls) as item,
+        or None as item if nothing was found
+    """
+    outcome = {"failed": False, "item": None}
+    
+    # Check if scraping failed
+    if video_data.get('scrape_failed', False):
+        outcome["failed"] = True
+        logger.warning("Scraping failed for YouTube video %s - skipping to next video", video['url'])
+        return outcome
+    
+    # Try enhanced URL extraction if enabled and no URLs found; the scrape
+    # already ran the regex over the description and comments
+    if use_llm and not video_data.get('github_urls'):
+        # Try LLM-enhanced extraction from the description, then the comments
+        _extract_urls_in_tiers([video_data], [_video_fallback_texts(video_data)], _SCRAPE_WORKERS)
+    
+    github_urls = video_data.get('github_urls', [])
+    
+    logger.info("GitHub URLs from scraping %s: %s", video['url'], len(github_urls))
+    
+    if github_urls:
+        video['github_urls'] = github_urls
+        outcome["item"] = video
+    else:
+        logger.info("No GitHub URLs found in video: %s", video['title'])
+    
+    return outcome
+
+def _finish_page(page: Dict[str, Any], page_data: Dict[str, Any], use_llm: bool) -> Dict[str, Any]:
+    """
+    Collect GitHub URLs for a scraped page, falling back to LLM extraction.
+    
+    Args:
+        page: Web search result
+        page_data: Scraped page details
+        use_llm: Whether to use LLM URL extraction when the regex finds nothing
+        
+    Returns:
+        Dictionary with a failed flag and the page (with github_urls) as item,
+        or None as item if nothing was found
+    """
+    outcome = {"failed": False, "item": None}
+    
+    # Check if scraping failed
+    if page_data.get('scrape_failed', False):
+        outcome["failed"] = True
+        logger.warning("Scraping failed for web page %s - skipping to next page", page['url'])
+        return outcome
+    
+    # Try enhanced URL extraction if enabled and no URLs found; the scrape
+    # already ran the regex over the page content
+    if use_llm and not page_data.get('github_urls'):
+        # Use LLM to extract GitHub URLs
+        llm_urls = extract_github_urls_with_llm(_page_fallback_text(page_data), regex_checked=True)
+        if llm_urls:
+            page_data['github_urls'] = llm_urls
+    
+    github_urls = page_data.get('github_urls', [])
+    
+    logger.info("GitHub URLs from scraping %s: %s", page['url'], len(github_urls))
+    
+    if github_urls:
+        page['github_urls'] = github_urls
+        outcome["item"] = page
+    else:
+        logger.info("No GitHub URLs found in page: %s", page['title'])
+    
+    return outcome
+
+def _mean(values: List[float]) -> float:
+    """Average of the values (0 when empty), vectorized with numpy when available."""
+    if not values:
+        return 0
+    if NUMPY_AVAILABLE:
+        return float(np.mean(np.asarray(values, dtype=np.float64)))
+    return sum(values) / len(values)
+
+def _rank_descending(*score_lists: List[float]) -> List[int]:
+    """
+    Order indexes by the summed scores, highest first.
+    
+    Ties keep their original order (a stable sort), so equally scored
+    repositories stay in the order they were found.
+    
+    Args:
+        *score_lists: Parallel lists of scores to add up per index
+        
+    Returns:
+        Indexes into the score lists, best first
+    """
+    if not score_lists or not score_lists[0]:
+        return []
+    if NUMPY_AVAILABLE:
+        totals = np.sum([np.asarray(scores, dtype=np.float64) for scores in score_lists], axis=0)
+        return np.argsort(-totals, kind="stable").tolist()
+    totals = [sum(scores) for scores in zip(*score_lists)]
+    return sorted(range(len(totals)), key=totals.__getitem__, reverse=True)
+
+def _search_and_scrape_source(kind: str, count: int, refined_query: str, keywords: List[str],
+                              tech_stack: List[str], features: List[str], use_llm: bool,
+                              threshold: float, automaton: Optional[Any],
+                              max_workers: int, early_stop_urls: int = 0) -> Dict[str, Any]:
+    """
+    Search one source, screen the results and scrape the relevant ones.
+    
+    Args:
+        kind: "youtube" or "web"
+        count: Number of results to search for (0 skips the source)
+        refined_query: Search query
+        keywords: Keywords for relevance filtering
+        tech_stack: Technologies for relevance filtering
+        features: Features for relevance filtering
+        use_llm: Whether to use the LLM relevance check and URL fallbacks
+        threshold: Minimum relevance score (0.0-1.0)
+        automaton: Optional automaton from build_relevance_automaton
+        max_workers: Concurrent LLM calls for the batched URL fallback
+        early_stop_urls: Stop scraping once this many distinct GitHub URLs
+            were found, scraping half that many items per batch (0 scrapes all)
+        
+    Returns:
+        Dictionary with results (items with GitHub URLs, in ranking order),
+        relevance_scores, failures and attempts
+    """
+    summary = {"results": [], "relevance_scores": [], "failures": 0, "attempts": 0}
+    if count <= 0:
+        return summary
+    
+    if kind == "youtube":
+        logger.info("Searching YouTube for: %s", refined_query)
+        items = search_youtube(refined_query, max_results=count,
+                               keywords=keywords, tech_stack=tech_stack, features=features)
+    else:
+        logger.info("Searching web for: %s", refined_query)
+        items = search_web(refined_query, max_results=count,
+                           keywords=keywords, tech_stack=tech_stack, features=features)
+    
+    # Check relevance in batched LLM calls before anything is scraped
+    relevances = _screen_items(items, "YouTube video" if kind == "youtube" else "web page", refined_query,
+                               keywords, tech_stack, features, use_llm, threshold, automaton)
+    summary["relevance_scores"] = [relevance['relevance_score'] for relevance in relevances]
+    relevant = []
+    for item, relevance in zip(items, relevances):
+        if relevance["is_relevant"]:
+            # Kept on the item so repository assessment need not judge relevance again
+            item["relevance_score"] = relevance["relevance_score"]
+            relevant.append(item)
+    if not relevant:
+        return summary
+    
+    if kind == "youtube":
+        # Videos whose description already yielded GitHub URLs need no full scrape;
+        # the rest are scraped in one yt-dlp session per batch
+        scrape_batch = scrape_youtube_videos
+        finish = _finish_video
+        fallback_texts = _video_fallback_texts
+    else:
+        # Fetch each batch of relevant pages together (asyncio when aiohttp is available)
+        scrape_batch = scrape_webpages
+        finish = _finish_page
+        
+        def fallback_texts(page_data: Dict[str, Any]) -> List[str]:
+            return [_page_fallback_text(page_data)]
+    
+    # Scrape in ranking order, a batch at a time, and stop once enough distinct
+    # GitHub URLs have been found; tail items rarely make the top results
+    batch_size = max(1, early_stop_urls // 2) if early_stop_urls else len(relevant)
+    found_urls = set()
+    for start in range(0, len(relevant), batch_size):
+        batch = relevant[start:start + batch_size]
+        if kind == "youtube":
+            to_scrape = [video for video in batch if not video.get('github_urls')]
+        else:
+            to_scrape = batch
+        summary["attempts"] += len(to_scrape)
+        scraped = scrape_batch([item['url'] for item in to_scrape]) if to_scrape else []
+        
+        # Items the regex found nothing in go to LLM URL extraction together, in
+        # batched prompts, instead of one LLM round trip per item
+        if use_llm:
+            missing = [data for data in scraped if not data.get('scrape_failed') and not data.get('github_urls')]
+            _extract_urls_in_tiers(missing, [fallback_texts(data) for data in missing], max_workers)
+        
+        # Keep the search ranking: scraped items in order, plus videos that needed no scrape
+        finished = {id(item): finish(item, data, False) for item, data in zip(to_scrape, scraped)}
+        outcomes = [finished.get(id(item), {"failed": False, "item": item}) for item in batch]
+        
+        for outcome in outcomes:
+            summary["failures"] += outcome["failed"]
+            if outcome["item"] is not None:
+                summary["results"].append(outcome["item"])
+                found_urls.update(url.lower() for url in outcome["item"]["github_urls"])
+        
+        if early_stop_urls and len(found_urls) >= early_stop_urls:
+            if start + batch_size < len(relevant):
+                logger.info("Found %s GitHub URLs in %s results; skipping the remaining %s",
+                            len(found_urls), kind, len(relevant) - start - batch_size)
+            break
+    return summary
 
 def search_and_scrape(query: str, 
                      keywords: List[str] = None, 
@@ -756,10 +2576,13 @@ def search_and_scrape(query: str,
                      use_web: bool = True,
                      use_llm: bool = True,
                      setup_llm_first: bool = True,
-                     threshold: float = 0.5) -> Dict[str, Any]:
+                     threshold: float = 0.5,
+                     max_workers: int = _SCRAPE_WORKERS,
+                     early_stop_urls: int = 25) -> Dict[str, Any]:
     """
     Performs search and scrape process to find GitHub repositories.
     Combines YouTube and web search, with scraping to extract GitHub URLs.
+    The YouTube and web branches run concurrently.
     
     Args:
         query: Search query
@@ -773,6 +2596,9 @@ def search_and_scrape(query: str,
         use_llm: Whether to use LLM enhancements
         setup_llm_first: Whether to set up LLM before searching or defer to caller
         threshold: Minimum relevance score (0.0-1.0) for filtering results
+        max_workers: Concurrent LLM calls per branch for the batched URL fallback
+        early_stop_urls: Stop scraping a branch once it has found this many
+            distinct GitHub URLs (0 scrapes every relevant result)
         
     Returns:
         Dictionary with search results and extracted GitHub URLs
@@ -782,175 +2608,123 @@ def search_and_scrape(query: str,
     tech_stack = tech_stack or []
     features = features or []
     
-    # Tracking variables
-    youtube_results = []
-    web_results = []
-    all_github_urls = []
-    scrape_failure_count = 0
-    total_scrape_attempts = 0
-    relevance_scores = []
+    # Skip every LLM step when offline
+    use_llm = use_llm and not _llm_offline()
     
     # Skip LLM refinement if setup_llm_first is False
     refined_query = query
     if use_llm and setup_llm_first:
         refined_query = refine_search_query(query, keywords, tech_stack, features)
-        print(f"Refined query: {refined_query}")
-    
-    # Search and scrape YouTube videos
-    if use_youtube and youtube_count > 0:
-        print(f"Searching YouTube for: {refined_query}")
-        videos = search_youtube(refined_query, max_results=youtube_count, 
-                              keywords=keywords, tech_stack=tech_stack, features=features)
-        
-        for i, video in enumerate(videos):
-            print(f"Scraping YouTube video {i+1}/{len(videos)}: {video['title']}")
-            
-            # Check relevance with standard or LLM-enhanced method
-            if use_llm and setup_llm_first:
-                relevance = check_content_relevance_with_llm(
-                    video, refined_query, keywords, tech_stack, features, threshold=threshold
-                )
-            else:
-                relevance = check_content_relevance(
-                    video, keywords, tech_stack, features, threshold=threshold
-                )
-            
-            # Track relevance scores for reporting
-            relevance_scores.append(relevance['relevance_score'])
-            
-            if relevance["is_relevant"]:
-                print(f"  Relevance: {relevance['relevance_score']:.2f} - {relevance['reasoning']}")
-                
-                total_scrape_attempts += 1
-                video_data = scrape_youtube_video(video['url'])
-                
-                # Check if scraping failed
-                if video_data.get('scrape_failed', False):
-                    scrape_failure_count += 1
-                    print(f"  Scraping failed for YouTube video {video['url']} - skipping to next video")
-                    continue
-                
-                # Try enhanced URL extraction if enabled and no URLs found
-                if use_llm and setup_llm_first and not video_data.get('github_urls'):
-                    # Try LLM-enhanced extraction from description
-                    description = video_data.get('description', '')
-                    llm_urls_desc = extract_github_urls_with_llm(description)
-                    
-                    # Try LLM-enhanced extraction from comments
-                    comments = video_data.get('comments', [])
-                    
-                    # Handle both list of strings and list of dictionaries
-                    comment_texts = []
-                    for c in comments[:5]:
-                        if isinstance(c, dict):
-                            comment_texts.append(c.get('text', ''))
-                        elif isinstance(c, str):
-                            comment_texts.append(c)
-                    
-                    comment_text = "\n".join(comment_texts)
-                    llm_urls_comments = extract_github_urls_with_llm(comment_text)
-                    
-                    # Combine URLs from both sources
-                    llm_urls = llm_urls_desc + llm_urls_comments
-                    if llm_urls:
-                        video_data['github_urls'] = llm_urls
-                
-                github_urls = video_data.get('github_urls', [])
-                
-                print(f"  GitHub URLs from scraping: {len(github_urls)}")
-                
-                if github_urls:
-                    video['github_urls'] = github_urls
-                    all_github_urls.extend(github_urls)
-                    youtube_results.append(video)
-                else:
-                    print(f"  No GitHub URLs found in video {i+1}")
-            else:
-                print(f"  Skipping (not relevant): {relevance['reasoning']}")
-    
-    # Search and scrape web pages
-    if use_web and web_count > 0:
-        print(f"\nSearching web for: {refined_query}")
-        pages = search_web(refined_query, max_results=web_count, 
-                         keywords=keywords, tech_stack=tech_stack, features=features)
-        
-        for i, page in enumerate(pages):
-            print(f"Scraping web page {i+1}/{len(pages)}: {page['title']}")
-            
-            # Check relevance with standard or LLM-enhanced method
-            if use_llm and setup_llm_first:
-                relevance = check_content_relevance_with_llm(
-                    page, refined_query, keywords, tech_stack, features, threshold=threshold
-                )
-            else:
-                relevance = check_content_relevance(
-                    page, keywords, tech_stack, features, threshold=threshold
-                )
-            
-            # Track relevance scores for reporting
-            relevance_scores.append(relevance['relevance_score'])
-            
-            if relevance["is_relevant"]:
-                print(f"  Relevance: {relevance['relevance_score']:.2f} - {relevance['reasoning']}")
-                
-                total_scrape_attempts += 1
-                page_data = scrape_webpage(page['url'])
-                
-                # Check if scraping failed
-                if page_data.get('scrape_failed', False):
-                    scrape_failure_count += 1
-                    print(f"  Scraping failed for web page {page['url']} - skipping to next page")
-                    continue
-                
-                # Try enhanced URL extraction if enabled and no URLs found
-                if use_llm and setup_llm_first and not page_data.get('github_urls'):
-                    # Use LLM to extract GitHub URLs
-                    page_text = page_data.get('text', '')
-                    llm_urls = extract_github_urls_with_llm(page_text[:5000])  # Limit text length for LLM
-                    if llm_urls:
-                        page_data['github_urls'] = llm_urls
-                
-                github_urls = page_data.get('github_urls', [])
-                
-                print(f"  GitHub URLs from scraping: {len(github_urls)}")
-                
-                if github_urls:
-                    page['github_urls'] = github_urls
-                    all_github_urls.extend(github_urls)
-                    web_results.append(page)
-                else:
-                    print(f"  No GitHub URLs found in page {i+1}")
-            else:
-                print(f"  Skipping (not relevant): {relevance['reasoning']}")
-    
-    # Deduplicate GitHub URLs
-    unique_github_urls = list(set(all_github_urls))
+        logger.info("Refined query: %s", refined_query)
+    
+    # Match all relevance needles in one pass per item when pyahocorasick is available
+    automaton = build_relevance_automaton(keywords, tech_stack, features)
+    
+    # The YouTube and web branches are independent I/O-bound pipelines, so run
+    # them side by side; results are merged in a fixed order afterwards
+    branch = partial(_search_and_scrape_source, refined_query=refined_query, keywords=keywords,
+                     tech_stack=tech_stack, features=features, use_llm=use_llm and setup_llm_first,
+                     threshold=threshold, automaton=automaton, max_workers=max_workers,
+                     early_stop_urls=early_stop_urls)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        youtube_future = executor.submit(branch, "youtube", youtube_count if use_youtube else 0)
+        web_future = executor.submit(branch, "web", web_count if use_web else 0)
+        youtube, web = youtube_future.result(), web_future.result()
+    
+    youtube_results = youtube["results"]
+    web_results = web["results"]
+    relevance_scores = youtube["relevance_scores"] + web["relevance_scores"]
+    scrape_failure_count = youtube["failures"] + web["failures"]
+    total_scrape_attempts = youtube["attempts"] + web["attempts"]
+    
+    # Normalize, validate and deduplicate GitHub URLs once here, keeping the order
+    # they were found in, so the assessment steps can rely on well-formed input;
+    # owner and repository names are case-insensitive on GitHub. A URL found in
+    # several items keeps the highest relevance any of them was judged to have,
+    # and the number of items citing it is kept as evidence for the ranking
+    unique = {}
+    prior_relevances = {}
+    source_counts = Counter()
+    for item in chain(youtube_results, web_results):
+        relevance = item.get("relevance_score")
+        item_keys = set()
+        for url in item["github_urls"]:
+            url = _normalize_github_url(url)
+            if _is_github_repo_url(url):
+                key = url.lower()
+                unique.setdefault(key, url)
+                item_keys.add(key)
+                if relevance is not None:
+                    prior_relevances[key] = max(relevance, prior_relevances.get(key, relevance))
+        source_counts.update(item_keys)
+    unique_github_urls = list(unique.values())
     
     # Calculate average relevance score if available
-    avg_relevance = sum(relevance_scores) / len(relevance_scores) if relevance_scores else 0
+    avg_relevance = _mean(relevance_scores)
     
     # Skip repo quality assessment if not using LLM or deferring setup
     repos_with_quality = []
     if use_llm and setup_llm_first:
-        print("Assessing repository quality...")
+        # Repositories cited by several sources are taken as good without an LLM
+        # assessment; of the rest, only those from clearly relevant content are
+        # assessed, and borderline ones keep their content relevance and follow
+        assess_urls, borderline_urls = [], []
+        repos = []
         for url in unique_github_urls:
-            quality = assess_repository_quality(url, query, features)
-            repos_with_quality.append({
+            prior = prior_relevances.get(url.lower())
+            sources = source_counts[url.lower()]
+            if sources >= _EVIDENCE_MIN_SOURCES:
+                repos.append({
+                    "url": url,
+                    "relevance_score": _EVIDENCE_RELEVANCE,
+                    "quality_score": _EVIDENCE_QUALITY,
+                    "reasoning": f"Cited by {sources} sources"
+                })
+            elif prior is None or prior >= threshold + _ASSESS_RELEVANCE_MARGIN:
+                assess_urls.append(url)
+            else:
+                borderline_urls.append(url)
+        
+        logger.info("Assessing repository quality for %s of %s repositories...",
+                    len(assess_urls), len(unique_github_urls))
+        qualities = assess_repositories_quality_batch(
+            assess_urls, query, features,
+            prior_relevances=[prior_relevances.get(url.lower()) for url in assess_urls])
+        
+        repos.extend(
+            {
                 "url": url,
                 "relevance_score": quality.get("relevance_score", 0.5),
                 "quality_score": quality.get("quality_score", 0.5),
                 "reasoning": quality.get("reasoning", "")
-            })
+            }
+            for url, quality in zip(assess_urls, qualities)
+        )
+        borderline = [
+            {
+                "url": url,
+                "relevance_score": prior_relevances[url.lower()],
+                "quality_score": 0.5,
+                "reasoning": _UNASSESSED_REASON
+            }
+            for url in borderline_urls
+        ]
         
-        # Sort repos by relevance and quality
-        repos_with_quality.sort(key=lambda x: (x["relevance_score"] + x["quality_score"]), reverse=True)
+        # Sort repos by relevance, quality and how many sources cite them,
+        # assessed ones first
+        repos_with_quality = []
+        for group in (repos, borderline):
+            order = _rank_descending([repo["relevance_score"] for repo in group],
+                                     [repo["quality_score"] for repo in group],
+                                     [_EVIDENCE_WEIGHT * source_counts[repo["url"].lower()] for repo in group])
+            repos_with_quality.extend(group[i] for i in order)
         
         # Update the list of URLs to be in quality order
         unique_github_urls = [repo["url"] for repo in repos_with_quality]
     
-    print(f"\nSearch complete. Found {len(unique_github_urls)} unique GitHub repositories.")
+    logger.info("Search complete. Found %s unique GitHub repositories.", len(unique_github_urls))
     if scrape_failure_count > 0:
-        print(f"Scraping failed for {scrape_failure_count} out of {total_scrape_attempts} pages/videos.")
+        logger.warning("Scraping failed for %s out of %s pages/videos.", scrape_failure_count, total_scrape_attempts)
     
     return {
         "query": query,
@@ -968,6 +2742,134 @@ def search_and_scrape(query: str,
         "scrape_success_rate": 1 - (scrape_failure_count / total_scrape_attempts) if total_scrape_attempts > 0 else 0
     }
 
+async def iter_search_and_scrape(query: str,
+                                 keywords: List[str] = None,
+                                 tech_stack: List[str] = None,
+                                 features: List[str] = None,
+                                 youtube_count: int = 5,
+                                 web_count: int = 5,
+                                 use_youtube: bool = True,
+                                 use_web: bool = True,
+                                 use_llm: bool = True,
+                                 threshold: float = 0.5,
+                                 concurrency: int = 20) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming version of search_and_scrape.
+    
+    YouTube and web searches run concurrently, relevance is checked with
+    batched LLM calls, and each relevant result is yielded as soon as its
+    GitHub URLs are known, so consumers (e.g. an MCP server) can start work
+    before the slowest page has been fetched. Repository assessment is left
+    to the caller (see assess_repositories_quality_batch).
+    
+    Args:
+        query: Search query
+        keywords: Keywords for relevance filtering
+        tech_stack: Technologies for relevance filtering
+        features: Features for relevance filtering
+        youtube_count: Number of YouTube videos to search
+        web_count: Number of web pages to search
+        use_youtube: Whether to include YouTube search
+        use_web: Whether to include web search
+        use_llm: Whether to use LLM enhancements
+        threshold: Minimum relevance score (0.0-1.0) for filtering results
+        concurrency: Maximum number of pages fetched at once
+        
+    Yields:
+        Dictionaries with "type" ("youtube" or "web") and "result" (the search
+        result, with its github_urls), in completion order
+    """
+    # Initialize empty lists if None
+    keywords = keywords or []
+    tech_stack = tech_stack or []
+    features = features or []
+    
+    loop = asyncio.get_running_loop()
+    use_llm = use_llm and not _llm_offline()
+    
+    refined_query = query
+    if use_llm:
+        refined_query = await loop.run_in_executor(None, refine_search_query, query, keywords, tech_stack, features)
+        logger.info("Refined query: %s", refined_query)
+    
+    automaton = build_relevance_automaton(keywords, tech_stack, features)
+    
+    async def search_relevant(kind: str, search: Callable[..., List[Dict[str, Any]]],
+                              count: int) -> Tuple[str, List[Dict[str, Any]]]:
+        items = await loop.run_in_executor(None, partial(search, refined_query, max_results=count, keywords=keywords,
+                                                         tech_stack=tech_stack, features=features))
+        if use_llm:
+            relevances = await check_content_relevance_with_llm_batch_async(
+                items, refined_query, keywords, tech_stack, features, threshold=threshold, automaton=automaton)
+        else:
+            relevances = check_content_relevance_many(items, keywords, tech_stack, features,
+                                                      threshold=threshold, automaton=automaton)
+        relevant = [item for item, relevance in zip(items, relevances) if relevance["is_relevant"]]
+        logger.info("%s of %s %s results are relevant", len(relevant), len(items), kind)
+        return kind, relevant
+    
+    async def finish_videos(videos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Videos whose description already yielded GitHub URLs need no full scrape;
+        # the rest share one yt-dlp session
+        to_scrape = [video['url'] for video in videos if not video.get('github_urls')]
+        scraped = {}
+        if to_scrape:
+            scraped = dict(zip(to_scrape, await loop.run_in_executor(None, scrape_youtube_videos, to_scrape)))
+        outcomes = await asyncio.gather(*(
+            loop.run_in_executor(None, _finish_video, video, scraped[video['url']], use_llm)
+            for video in videos if video['url'] in scraped
+        ))
+        return [video for video in videos if video['url'] not in scraped] + \
+               [outcome["item"] for outcome in outcomes if outcome["item"] is not None]
+    
+    async def finish_page(session: Any, page: Dict[str, Any]) -> List[Dict[str, Any]]:
+        try:
+            if session is not None:
+                page_data = await scrape_page(session, page['url'])
+            else:
+                page_data = await loop.run_in_executor(None, scrape_webpage, page['url'])
+        except Exception as e:
+            logger.warning("Error scraping %s: %s", page['url'], e)
+            page_data = _empty_page_data()
+        outcome = await loop.run_in_executor(None, _finish_page, page, page_data, use_llm)
+        return [outcome["item"]] if outcome["item"] is not None else []
+    
+    # Tasks mapped to what they produce: "search" tasks yield relevant results
+    # to scrape, the others finished results
+    tasks: Dict["asyncio.Future", str] = {}
+    if use_youtube and youtube_count > 0:
+        tasks[asyncio.ensure_future(search_relevant("youtube", search_youtube, youtube_count))] = "search"
+    if use_web and web_count > 0:
+        tasks[asyncio.ensure_future(search_relevant("web", search_web, web_count))] = "search"
+    
+    async with AsyncExitStack() as stack:
+        session = None
+        scrape_page = None
+        if use_web and web_count > 0 and (AIOHTTP_AVAILABLE or HTTPX_AVAILABLE) and HTML_PARSER_AVAILABLE:
+            session = await stack.enter_async_context(_async_scrape_client(concurrency))
+            scrape_page = _bounded_page_scraper(concurrency)
+        
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    role = tasks.pop(task)
+                    if role == "search":
+                        kind, relevant = task.result()
+                        if kind == "youtube":
+                            if relevant:
+                                tasks[asyncio.ensure_future(finish_videos(relevant))] = "youtube"
+                        else:
+                            for page in relevant:
+                                tasks[asyncio.ensure_future(finish_page(session, page))] = "web"
+                    else:
+                        for item in task.result():
+                            yield {"type": role, "result": item}
+        finally:
+            # The consumer stopped early or a search failed: drop outstanding work
+            for task in tasks:
+                task.cancel()
+
 def interactive_search(initial_query=None) -> Dict[str, Any]:
     """
     Interactive search mode with detailed configuration options.
@@ -1052,6 +2954,16 @@ def interactive_search(initial_query=None) -> Dict[str, Any]:
         except ValueError:
             print("Invalid threshold format. Using default: 0.5")
     
+    # Stop scraping once enough repositories were found
+    early_stop_urls = 25
+    if use_youtube or use_web:
+        try:
+            stop_input = input("Stop after finding how many GitHub URLs? (0 = no limit, default: 25): ")
+            if stop_input.strip():
+                early_stop_urls = max(0, int(stop_input))
+        except ValueError:
+            print("Invalid number. Using default: 25")
+    
     # Summary before execution
     print("\n=== Search Summary ===")
     print(f"Query: {query}")
@@ -1062,6 +2974,7 @@ def interactive_search(initial_query=None) -> Dict[str, Any]:
     print(f"Web Search: {'Enabled' if use_web else 'Disabled'}{f' ({web_count} pages)' if use_web else ''}")
     print(f"LLM Enhancement: {'Enabled' if use_llm else 'Disabled'}")
     print(f"Relevance Threshold: {relevance_threshold}")
+    print(f"Stop After: {f'{early_stop_urls} GitHub URLs' if early_stop_urls else 'No limit'}")
     
     if input("\nProceed with search? (y/n, default: y): ").lower() == "n":
         print("Search canceled.")
@@ -1081,9 +2994,26 @@ def interactive_search(initial_query=None) -> Dict[str, Any]:
         "use_youtube": use_youtube,
         "use_web": use_web,
         "use_llm": use_llm,
-        "relevance_threshold": relevance_threshold
+        "relevance_threshold": relevance_threshold,
+        "early_stop_urls": early_stop_urls
     }
 
+_REFINE_PROMPT = textwrap.dedent("""
+    Refine this search query to find GitHub repositories:
+    
+    Original query: {query}
+    Keywords: {keywords_str}
+    Technologies: {tech_stack_str}
+    Desired features: {features_str}
+    
+    Create a search query that will effectively find GitHub repositories
+    with relevant code implementations. Focus on the core technologies and features.
+    The query should be concise (under 10 words) and highly specific.
+    Use common technical terminology that would likely appear in repository descriptions.
+    
+    Return only the optimized search query text without any explanations or quotes.
+""").strip()
+
 def refine_search_query(query: str, keywords: List[str] = None, 
                        tech_stack: List[str] = None, features: List[str] = None) -> str:
     """
@@ -1101,137 +3031,257 @@ def refine_search_query(query: str, keywords: List[str] = None,
     # Skip refinement if the original query is very short
     if not query or len(query) < 5:
         return query
+    
+    # Key on case- and order-insensitive arguments so near-identical searches share a refinement
+    cache_key = (" ".join(query.lower().split()),
+                 tuple(sorted({k.lower() for k in keywords or ()})),
+                 tuple(sorted({t.lower() for t in tech_stack or ()})),
+                 tuple(sorted({f.lower() for f in features or ()})))
+    cached = _REFINE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
         
     # Format lists for the prompt
     keywords_str = ", ".join(keywords) if keywords else "None specified"
     tech_stack_str = ", ".join(tech_stack) if tech_stack else "None specified"
     features_str = ", ".join(features) if features else "None specified"
     
-    prompt = f"""
-    Refine this search query to find GitHub repositories:
-    
-    Original query: {query}
-    Keywords: {keywords_str}
-    Technologies: {tech_stack_str}
-    Desired features: {features_str}
-    
-    Create a search query that will effectively find GitHub repositories 
-    with relevant code implementations. Focus on the core technologies and features.
-    The query should be concise (under 10 words) and highly specific.
-    Use common technical terminology that would likely appear in repository descriptions.
-    
-    Return only the optimized search query text without any explanations or quotes.
-    """
+    prompt = _REFINE_PROMPT.format(query=query, keywords_str=keywords_str,
+                                   tech_stack_str=tech_stack_str, features_str=features_str)
     
     try:
-        refined_query = call_llm(prompt, temperature=0.3)
+        refined_query = cached_call_llm(prompt, temperature=0.3)
         # Remove any quotes or extra formatting the LLM might add
         refined_query = refined_query.strip(' "\'\n')
         
         # If the refinement is valid and not too long, use it
         if refined_query and 5 <= len(refined_query) <= 100:
-            print(f"Refined query: '{refined_query}' (original: '{query}')")
+            logger.info("Refined query: '%s' (original: '%s')", refined_query, query)
+            _REFINE_CACHE.set(cache_key, refined_query)
             return refined_query
         else:
             return query
     except Exception as e:
-        print(f"Query refinement failed: {str(e)}")
+        logger.warning("Query refinement failed: %s", e)
         return query
 
-def extract_github_urls_with_llm(text: str) -> List[str]:
+def extract_github_urls_with_llm(text: str, regex_checked: bool = False) -> List[str]:
     """
     Extract GitHub repository URLs from text using LLM when regex doesn't find any.
     
     Args:
         text: Text to extract GitHub URLs from
+        regex_checked: Whether the caller already ran extract_github_urls over
+            this text and found nothing, so the regex pass can be skipped
         
     Returns:
         List of GitHub repository URLs found in the text
     """
-    if not text:
-        return []
-        
-    # First use standard regex extraction (more efficient)
-    from .github import extract_github_urls
-    regex_urls = extract_github_urls(text)
-    
-    # If regex found URLs, return them
-    if regex_urls:
-        return regex_urls
-    
-    # Only use LLM if the text is reasonable in length (to save tokens)
-    if len(text) > 10000:
-        # For very long text, just return empty list as LLM would be too expensive
-        return []
-    
-    # Use shorter preview for very long text
-    text_preview = text[:8000] if len(text) > 8000 else text
-    
-    prompt = f"""
-    Extract all GitHub repository URLs from this text. Only return valid GitHub 
-    repository URLs (i.e., https://github.com/username/repository).
+    return batch_extract_github_urls([text], regex_checked=regex_checked)[0]
+
+# Texts sent per batched LLM URL extraction call, and the characters of text
+# shared between them
+URL_EXTRACT_BATCH_SIZE = 4
+_URL_EXTRACT_CHARS = 8000
+
+_EXTRACT_URLS_PROMPT = textwrap.dedent("""
+    Extract all GitHub repository URLs from each of these {count} texts. Only return
+    valid GitHub repository URLs (i.e., https://github.com/username/repository).
     
     Instructions:
     1. Look for GitHub repository URLs in any format
     2. Include URLs that may be in markdown format like [repo](https://github.com/user/repo)
     3. Also look for phrases like "github repo: user/repo" or "git clone https://github.com/user/repo"
     
-    Return the URLs as a JSON array of strings. Return an empty array [] if none are found.
+    Return a JSON object of the form
+    {{"results": [{{"id": 1, "urls": ["https://github.com/user/repo"]}}]}}
+    with one entry per text. Use an empty list for a text with no URLs.
+    
+    {text_list}
+""").strip()
+
+def _extract_urls_batch_llm(texts: List[str]) -> List[List[str]]:
+    """
+    Ask the LLM for the GitHub URLs in several texts with one prompt.
     
-    Text: {text_preview}
+    Args:
+        texts: Texts the regex found nothing in
+        
+    Returns:
+        One list of GitHub repository URLs per text (empty on failure)
     """
+    results: List[List[str]] = [[] for _ in texts]
+    
+    # Share the preview budget between the texts
+    preview_chars = _URL_EXTRACT_CHARS // len(texts)
+    text_list = "\n\n".join(f"Text {n}:\n{text[:preview_chars]}" for n, text in enumerate(texts, 1))
+    
+    prompt = _EXTRACT_URLS_PROMPT.format(count=len(texts), text_list=text_list)
     
     try:
-        response = call_llm(prompt, temperature=0.1)
-        
-        # Try to extract JSON array
-        import json
-        import re
-        
-        # Look for array pattern in response
-        array_match = re.search(r'\[[\s\S]*\]', response)
-        if array_match:
-            array_str = array_match.group(0)
-            # Parse the JSON array
-            urls = json.loads(array_str)
-            
+        response = cached_call_llm(prompt, temperature=0.1, max_tokens=256 * len(texts),
+                                   response_format=_JSON_RESPONSE_FORMAT)
+        
+        # Look for the JSON object in the response (providers without JSON mode may add prose)
+        result = _extract_json(response, '{')
+        entries = result.get("results") if result is not None else None
+        if not isinstance(entries, list):
+            return results
+        
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not isinstance(entry.get("urls"), list):
+                continue
+            # Prefer the echoed id, fall back to the position in the array
+            n = entry.get("id", position + 1)
+            if not isinstance(n, int) or not 1 <= n <= len(texts):
+                continue
             # Filter to ensure we only have valid GitHub URLs
-            github_urls = [url for url in urls if isinstance(url, str) and "github.com" in url]
-            
-            if github_urls:
-                print(f"LLM found {len(github_urls)} GitHub URLs not detected by regex")
-                return github_urls
-                
+            results[n - 1] = [url for url in entry["urls"] if isinstance(url, str) and _is_github_repo_url(url)]
+        
+        found = sum(map(len, results))
+        if found:
+            logger.info("LLM found %s GitHub URLs not detected by regex", found)
+    
     except Exception as e:
-        print(f"LLM-based GitHub URL extraction failed: {str(e)}")
+        logger.warning("LLM-based GitHub URL extraction failed: %s", e)
+    
+    return results
+
+def batch_extract_github_urls(texts: List[str], regex_checked: bool = False,
+                              batch_size: int = URL_EXTRACT_BATCH_SIZE,
+                              max_workers: int = _SCRAPE_WORKERS) -> List[List[str]]:
+    """
+    Extract GitHub repository URLs from several texts, using the LLM only for
+    texts that mention GitHub but in which the regex finds nothing. Those are
+    sent batch_size at a time in one prompt, with the batches running concurrently.
+    
+    Args:
+        texts: Texts to extract GitHub URLs from
+        regex_checked: Whether the regex already ran on the texts and found nothing
+        batch_size: Maximum number of texts per LLM call
+        max_workers: Maximum number of LLM calls in flight at once
+        
+    Returns:
+        One list of GitHub repository URLs per text, in the same order
+    """
+    results: List[List[str]] = [[] for _ in texts]
+    pending = []
+    for i, text in enumerate(texts):
+        if not text or text.isspace():
+            continue
+        
+        if not regex_checked:
+            # First use standard regex extraction (more efficient)
+            results[i] = extract_github_urls(text)
+            if results[i]:
+                continue
+        
+        # Only use LLM if the text mentions GitHub at all and is reasonable in
+        # length (to save tokens); for very long text the LLM would be too expensive
+        if len(text) <= 10000 and "github" in text.lower():
+            pending.append(i)
+    
+    if not pending:
+        return results
+    
+    batch_size = max(1, batch_size)
+    batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+        answers = executor.map(lambda batch: _extract_urls_batch_llm([texts[i] for i in batch]), batches)
+        for batch, urls in zip(batches, answers):
+            for i, found in zip(batch, urls):
+                results[i] = found
+    return results
+
+_ASSESS_PROMPT_WITH_DATA = textwrap.dedent("""
+    Assess this GitHub repository's {subject}:
+    Repository: {github_url}
+    User query: {query}
+    Desired features: {features_str}
+    
+    Repository metrics:
+    - Stars: {stars}
+    - Forks: {forks}
+    - Complexity score: {complexity_score}/10
+    - Languages: {languages}
+    
+    Return a JSON object with this format:
+    {format}
+""").strip()
+
+_ASSESS_PROMPT_FALLBACK = textwrap.dedent("""
+    Assess this GitHub repository's {subject}:
+    Repository: {github_url}
+    User query: {query}
+    Desired features: {features_str}
+    
+    Based on the URL and repository name alone (without fetching data), evaluate:
+    {questions_str}
     
-    # If LLM extraction failed, return empty list
-    return []
+    Return a JSON object with this format:
+    {format}
+""").strip()
 
-def assess_repository_quality(github_url: str, query: str, features: List[str] = None) -> Dict[str, Any]:
+def _assessment_format(with_relevance: bool) -> str:
+    """JSON format asked of the LLM, leaving relevance out when it is already known."""
+    relevance_line = '  "relevance_score": 0.0-1.0,\n' if with_relevance else ''
+    return (f'{{\n{relevance_line}'
+            '  "quality_score": 0.0-1.0,\n'
+            '  "reasoning": "brief explanation of your assessment"\n'
+            '}')
+
+def _with_prior_relevance(result: Dict[str, Any], prior_relevance: Optional[float]) -> Dict[str, Any]:
+    """Fill in a relevance score judged earlier instead of asking the LLM again."""
+    if prior_relevance is not None:
+        result["relevance_score"] = prior_relevance
+    return result
+
+def assess_repository_quality(github_url: str, query: str, features: List[str] = None,
+                              prior_relevance: Optional[float] = None) -> Dict[str, Any]:
     """
     Assess a GitHub repository's quality and relevance to the user's query.
     Uses both GitHub API data (via check_repository_complexity_and_size) and LLM assessment.
+    Successful assessments are cached per (URL, query, features).
     
     Args:
         github_url: URL of the GitHub repository
         query: The user's search query
         features: List of features the user is looking for
+        prior_relevance: Relevance score already judged for the content the URL
+            came from; when given, the LLM is only asked about quality
         
     Returns:
         Dictionary with quality assessment metrics
     """
-    if not github_url or "github.com" not in github_url:
+    cache_key = (github_url, query, tuple(features or ()), prior_relevance is None)
+    cached = _ASSESS_CACHE.get(cache_key)
+    if cached is not None:
+        return _with_prior_relevance(dict(cached), prior_relevance)
+    
+    result = _assess_repository_quality(github_url, query, features, prior_relevance is None)
+    if result.get("reasoning") != _ASSESS_FAILED_REASON:
+        _ASSESS_CACHE.set(cache_key, dict(result))
+    return _with_prior_relevance(result, prior_relevance)
+
+def _assess_repository_quality(github_url: str, query: str, features: List[str] = None,
+                               with_relevance: bool = True) -> Dict[str, Any]:
+    """Uncached implementation of assess_repository_quality."""
+    if not _is_github_repo_url(github_url):
         return {
             "relevance_score": 0.0,
             "quality_score": 0.0,
             "reasoning": "Not a valid GitHub repository URL"
         }
     
+    if _llm_offline():
+        return dict(_ASSESS_FALLBACK)
+    
+    required = ("relevance_score", "quality_score") if with_relevance else ("quality_score",)
+    subject = "relevance and quality" if with_relevance else "quality"
+    
     # Get GitHub data using API (will prompt for token if needed)
-    from utils.github import check_repository_complexity_and_size
     try:
-        print(f"Getting GitHub data for {github_url}...")
+        logger.info("Getting GitHub data for %s...", github_url)
         github_data = check_repository_complexity_and_size(github_url)
         stars = github_data.get("stars", 0)
         forks = github_data.get("forks", 0)
@@ -1242,97 +3292,226 @@ def assess_repository_quality(github_url: str, query: str, features: List[str] =
             # Format features for the prompt
             features_str = ", ".join(features) if features else "None specified"
             
-            prompt = f"""
-            Assess this GitHub repository's relevance and quality:
-            Repository: {github_url}
-            User query: {query}
-            Desired features: {features_str}
-            
-            Repository metrics:
-            - Stars: {stars}
-            - Forks: {forks}
-            - Complexity score: {complexity_score}/10
-            - Languages: {', '.join(github_data.get('languages', {}).keys())}
-            
-            Return a JSON object with this format:
-            {{
-              "relevance_score": 0.0-1.0,
-              "quality_score": 0.0-1.0,
-              "reasoning": "brief explanation of your assessment"
-            }}
-            """
+            prompt = _ASSESS_PROMPT_WITH_DATA.format(
+                subject=subject, github_url=github_url, query=query, features_str=features_str,
+                stars=stars, forks=forks, complexity_score=complexity_score,
+                languages=", ".join(github_data.get('languages', {}).keys()),
+                format=_assessment_format(with_relevance))
             
             try:
-                response = call_llm(prompt, temperature=0.3)
-                
-                # Extract JSON from the response
-                import json
-                import re
+                response = cached_call_llm(prompt, temperature=0.0, max_tokens=256,
+                                           response_format=_JSON_RESPONSE_FORMAT)
                 
-                # Look for JSON object pattern
-                json_match = re.search(r'\{[\s\S]*\}', response)
-                if json_match:
-                    json_str = json_match.group(0)
-                    result = json.loads(json_str)
-                    
+                # Look for a JSON object in the response
+                result = _extract_json(response, '{')
+                if result is not None:
                     # Ensure required fields exist
-                    if "relevance_score" in result and "quality_score" in result:
+                    if all(field in result for field in required):
                         return result
             
             except Exception as e:
-                print(f"Repository quality LLM assessment failed: {str(e)}")
+                logger.warning("Repository quality LLM assessment failed: %s", e)
     
     except Exception as e:
-        print(f"Repository data retrieval failed: {str(e)}")
+        logger.warning("Repository data retrieval failed: %s", e)
     
     # Fallback to the original approach of URL-based assessment
     features_str = ", ".join(features) if features else "None specified"
+    questions = [
+        "Is this likely a quality implementation based on naming conventions and organization?",
+        "Is this from a reputable developer or organization?"
+    ]
+    if with_relevance:
+        questions.insert(0, "Does this repository likely implement the features from the user's query?")
+    questions_str = "\n".join(f"{n}. {question}" for n, question in enumerate(questions, 1))
     
-    prompt = f"""
-    Assess this GitHub repository's relevance and quality:
-    Repository: {github_url}
-    User query: {query}
-    Desired features: {features_str}
-    
-    Based on the URL and repository name alone (without fetching data), evaluate:
-    1. Does this repository likely implement the features from the user's query?
-    2. Is this likely a quality implementation based on naming conventions and organization?
-    3. Is this from a reputable developer or organization?
-    
-    Return a JSON object with this format:
-    {{
-      "relevance_score": 0.0-1.0,
-      "quality_score": 0.0-1.0,
-      "reasoning": "brief explanation of your assessment"
-    }}
-    """
+    prompt = _ASSESS_PROMPT_FALLBACK.format(subject=subject, github_url=github_url, query=query,
+                                            features_str=features_str, questions_str=questions_str,
+                                            format=_assessment_format(with_relevance))
     
     try:
-        response = call_llm(prompt, temperature=0.3)
+        response = cached_call_llm(prompt, temperature=0.0, max_tokens=256,
+                                   response_format=_JSON_RESPONSE_FORMAT)
         
-        # Extract JSON from the response
-        import json
-        import re
-        
-        # Look for JSON object pattern
-        json_match = re.search(r'\{[\s\S]*\}', response)
-        if json_match:
-            json_str = json_match.group(0)
-            result = json.loads(json_str)
-            
+        # Look for a JSON object in the response
+        result = _extract_json(response, '{')
+        if result is not None:
             # Ensure required fields exist
-            if "relevance_score" in result and "quality_score" in result:
+            if all(field in result for field in required):
                 return result
     
     except Exception as e:
-        print(f"Repository quality assessment failed: {str(e)}")
+        logger.warning("Repository quality assessment failed: %s", e)
     
     # Return default values if assessment fails
-    return {
-        "relevance_score": 0.5,
-        "quality_score": 0.5,
-        "reasoning": "Unable to assess repository quality"
-    }
+    return dict(_ASSESS_FALLBACK)
+
+_ASSESS_BATCH_PROMPT = string.Template(textwrap.dedent("""
+    Assess the $subject of these $count GitHub repositories:
+    $repo_list
+    
+    User query: $query
+    Desired features: $features
+    
+    Based on each URL and repository name, evaluate ${relevance_question}whether it
+    is likely a quality implementation, and whether it is from a reputable developer
+    or organization.
+    
+    Return a JSON array with exactly $count objects, in the same order, in this format:
+    [
+      {
+        "index": 1,
+        ${relevance_field}"quality_score": 0.0-1.0,
+        "reasoning": "brief explanation of your assessment"
+      }
+    ]
+""").strip())
+
+def assess_repositories_quality_batch(github_urls: List[str], query: str,
+                                     features: List[str] = None,
+                                     batch_size: int = 20,
+                                     prior_relevances: List[Optional[float]] = None) -> List[Dict[str, Any]]:
+    """
+    Assess several GitHub repositories with one LLM call per batch.
+    
+    Repositories already assessed are served from the assessment cache; the
+    rest are sent batch_size at a time in a single prompt asking for a JSON
+    array. Any repository missing from the LLM's answer falls back to
+    assess_repository_quality.
+    
+    Args:
+        github_urls: GitHub repository URLs, already validated with _is_github_repo_url
+        query: The user's search query
+        features: List of features the user is looking for
+        batch_size: Maximum number of repositories per LLM call
+        prior_relevances: Relevance score already judged for each URL (or None
+            where unknown); those repositories are only assessed for quality
+        
+    Returns:
+        List of quality assessment dictionaries, in the same order as github_urls
+    """
+    features_key = tuple(features or ())
+    priors = prior_relevances or [None] * len(github_urls)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(github_urls)
+    
+    # Serve cached assessments and queue the rest, split by whether relevance
+    # still has to be judged
+    pending = {True: [], False: []}
+    for i, url in enumerate(github_urls):
+        cached = _ASSESS_CACHE.get((url, query, features_key, priors[i] is None))
+        if cached is not None:
+            results[i] = _with_prior_relevance(dict(cached), priors[i])
+        else:
+            pending[priors[i] is None].append(i)
+    
+    features_str = ", ".join(features) if features else "None specified"
+    
+    for with_relevance, indices in pending.items():
+        # Offline, everything pending falls through to the single-path fallback
+        if _llm_offline():
+            break
+        required = ("relevance_score", "quality_score") if with_relevance else ("quality_score",)
+        subject = "relevance and quality" if with_relevance else "quality"
+        relevance_field = '"relevance_score": 0.0-1.0,\n    ' if with_relevance else ''
+        relevance_question = ("whether the repository likely implements the requested features, "
+                              if with_relevance else "")
+        
+        for start in range(0, len(indices), batch_size):
+            batch = indices[start:start + batch_size]
+            repo_list = "\n".join(f"{n}. {github_urls[i]}" for n, i in enumerate(batch, 1))
+            
+            prompt = _ASSESS_BATCH_PROMPT.substitute(
+                subject=subject, count=len(batch), repo_list=repo_list, query=query,
+                features=features_str, relevance_question=relevance_question,
+                relevance_field=relevance_field
+            )
+            
+            try:
+                response = cached_call_llm(prompt, temperature=0.3)
+                assessments = _extract_json(response, '[')
+                if assessments is None:
+                    continue
+            except Exception as e:
+                logger.warning("Batch repository assessment failed: %s", e)
+                continue
+            
+            for position, assessment in enumerate(assessments):
+                if not isinstance(assessment, dict):
+                    continue
+                if not all(field in assessment for field in required):
+                    continue
+                
+                # Prefer the echoed index, fall back to the position in the array
+                n = assessment.get("index", position + 1)
+                if not isinstance(n, int) or not 1 <= n <= len(batch):
+                    continue
+                i = batch[n - 1]
+                
+                result = {field: assessment[field] for field in required}
+                result["reasoning"] = assessment.get("reasoning", "")
+                _ASSESS_CACHE.set((github_urls[i], query, features_key, with_relevance), dict(result))
+                results[i] = _with_prior_relevance(result, priors[i])
+    
+    # Anything still unassessed (invalid URL, missing from the answer) uses the
+    # single path, run concurrently within the provider's rate limits
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        def assess(i: int) -> Dict[str, Any]:
+            return assess_repository_quality(github_urls[i], query, features, priors[i])
+        
+        with ThreadPoolExecutor(max_workers=min(_ASSESS_CONCURRENCY, len(missing))) as executor:
+            for i, result in zip(missing, executor.map(assess, missing)):
+                results[i] = result
+    
+    return results
+
+def _prewarm_scrape_pool() -> None:
+    """
+    Start the page-parsing worker processes in the background.
+    
+    Used while the user is still answering interactive prompts, so process
+    start-up is off the critical path once the search begins.
+    """
+    try:
+        _get_parse_pool().submit(int)
+    except Exception:
+        pass
+
+def load_search_config(path: str) -> Dict[str, Any]:
+    """
+    Load search_and_scrape parameters from a JSON or YAML file.
+    
+    Args:
+        path: Path to a .json, .yaml or .yml file whose keys are
+            search_and_scrape parameters ("relevance_threshold" is accepted
+            as an alias for "threshold")
+        
+    Returns:
+        Dictionary of search_and_scrape keyword arguments
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            config = yaml.safe_load(f) or {}
+        else:
+            config = json.load(f)
+    
+    if "relevance_threshold" in config:
+        config["threshold"] = config.pop("relevance_threshold")
+    return config
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {value}")
+    return number
+
+def _unit_interval(value: str) -> float:
+    """argparse type for scores between 0.0 and 1.0."""
+    number = float(value)
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0.0 and 1.0, got {value}")
+    return number
 
 if __name__ == "__main__":
     """
@@ -1341,105 +3520,83 @@ if __name__ == "__main__":
     Usage:
         python -m utils.search interactive
         python -m utils.search "query"
+        python -m utils.search --config search.json
         
     Options:
+        --config PATH           Read all search parameters from a JSON/YAML file
         --no-youtube            Disable YouTube search
         --no-web                Disable web search
         --no-llm                Disable LLM enhancement
         --youtube-count N       Set number of YouTube videos to search
         --web-count N           Set number of web pages to search
         --threshold N           Set relevance threshold (0.0-1.0)
+        --early-stop-urls N     Stop scraping after N GitHub URLs (0 = no limit)
     """
-    import sys
-    
-    # Default to interactive mode with no arguments
-    if len(sys.argv) == 1 or sys.argv[1] == "interactive":
-        results = interactive_search()
-        
-        # Print results
-        if results and results.get("github_urls"):
-            print("\n=== Found GitHub Repositories ===")
-            for i, url in enumerate(results["github_urls"][:10], 1):
-                print(f"{i}. {url}")
-            
-            if len(results["github_urls"]) > 10:
-                print(f"...and {len(results['github_urls']) - 10} more.")
-        else:
-            print("No GitHub repositories found.")
-    
-    # Process query from command line
-    elif len(sys.argv) > 1:
-        query = sys.argv[1]
-        print(f"Searching for: {query}")
-        
-        # Parse optional parameters
-        youtube_count = 5
-        web_count = 10
-        use_youtube = True
-        use_web = True
-        use_llm = True
-        threshold = 0.5
-        
-        for i, arg in enumerate(sys.argv[2:]):
-            if arg == "--no-youtube":
-                use_youtube = False
-            elif arg == "--no-web":
-                use_web = False
-            elif arg == "--no-llm":
-                use_llm = False
-            elif arg == "--youtube-count" and i+3 <= len(sys.argv):
-                try:
-                    youtube_count = int(sys.argv[i+3])
-                except ValueError:
-                    pass
-            elif arg == "--web-count" and i+3 <= len(sys.argv):
-                try:
-                    web_count = int(sys.argv[i+3])
-                except ValueError:
-                    pass
-            elif arg == "--threshold" and i+3 <= len(sys.argv):
-                try:
-                    threshold_val = float(sys.argv[i+3])
-                    if 0.0 <= threshold_val <= 1.0:
-                        threshold = threshold_val
-                    else:
-                        print("Threshold must be between 0.0 and 1.0. Using default: 0.5")
-                except ValueError:
-                    print("Invalid threshold format. Using default: 0.5")
-        
-        # Execute search
-        results = search_and_scrape(
-            query=query,
-            youtube_count=youtube_count,
-            web_count=web_count,
-            use_youtube=use_youtube,
-            use_web=use_web,
-            use_llm=use_llm,
-            threshold=threshold
-        )
-        
-        # Print results
-        if results and results.get("github_urls"):
-            print("\n=== Found GitHub Repositories ===")
-            for i, url in enumerate(results["github_urls"][:10], 1):
-                print(f"{i}. {url}")
-            
-            if len(results["github_urls"]) > 10:
-                print(f"...and {len(results['github_urls']) - 10} more.")
-        else:
-            print("No GitHub repositories found.")
-            
-        # Print search statistics
-        if "scrape_success_rate" in results:
-            success_rate = results["scrape_success_rate"] * 100
-            print(f"\nScraping success rate: {success_rate:.1f}%")
+    parser = argparse.ArgumentParser(description="Search and scrape GitHub repositories")
+    parser.add_argument('query', nargs='?', default='interactive',
+                        help='Search query, or "interactive" (default) to be prompted')
+    parser.add_argument('--config', type=str,
+                        help='JSON/YAML file with search_and_scrape parameters')
+    parser.add_argument('--no-youtube', dest='use_youtube', action='store_false',
+                        help='Disable YouTube search')
+    parser.add_argument('--no-web', dest='use_web', action='store_false', help='Disable web search')
+    parser.add_argument('--no-llm', dest='use_llm', action='store_false', help='Disable LLM enhancement')
+    parser.add_argument('--youtube-count', type=_non_negative_int, default=5,
+                        help='Number of YouTube videos to search')
+    parser.add_argument('--web-count', type=_non_negative_int, default=10,
+                        help='Number of web pages to search')
+    parser.add_argument('--threshold', type=_unit_interval, default=0.5,
+                        help='Relevance threshold (0.0-1.0)')
+    parser.add_argument('--early-stop-urls', type=_non_negative_int, default=25,
+                        help='Stop scraping after this many GitHub URLs (0 = no limit)')
+    args = parser.parse_args()
+    
+    # Show search progress on the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
+    if args.config:
+        # Every parameter comes from the file; no prompts
+        search_params = load_search_config(args.config)
+        print(f"Searching for: {search_params.get('query', '')}")
+    elif args.query == "interactive":
+        # Start parser processes while the user is still typing
+        threading.Thread(target=_prewarm_scrape_pool, daemon=True).start()
         
-        if "average_relevance" in results:
-            avg_relevance = results["average_relevance"] * 100
-            print(f"Average content relevance: {avg_relevance:.1f}%")
+        search_params = interactive_search()
+        if search_params:
+            search_params["threshold"] = search_params.pop("relevance_threshold")
+    else:
+        print(f"Searching for: {args.query}")
+        search_params = {
+            "query": args.query,
+            "youtube_count": args.youtube_count,
+            "web_count": args.web_count,
+            "use_youtube": args.use_youtube,
+            "use_web": args.use_web,
+            "use_llm": args.use_llm,
+            "threshold": args.threshold,
+            "early_stop_urls": args.early_stop_urls
+        }
+    
+    # Execute search
+    results = search_and_scrape(**search_params) if search_params else {}
     
+    # Print results
+    if results and results.get("github_urls"):
+        print("\n=== Found GitHub Repositories ===")
+        for i, url in enumerate(results["github_urls"][:10], 1):
+            print(f"{i}. {url}")
+        
+        if len(results["github_urls"]) > 10:
+            print(f"...and {len(results['github_urls']) - 10} more.")
     else:
-        print("Usage:")
-        print("  python -m utils.search interactive")
-        print("  python -m utils.search \"your search query\"")
-        print("  python -m utils.search \"your search query\" --no-youtube --no-web --youtube-count 3 --web-count 5") 
\ No newline at end of file
+        print("No GitHub repositories found.")
+        
+    # Print search statistics
+    if "scrape_success_rate" in results:
+        success_rate = results["scrape_success_rate"] * 100
+        print(f"\nScraping success rate: {success_rate:.1f}%")
+    
+    if "average_relevance" in results:
+        avg_relevance = results["average_relevance"] * 100
+        print(f"Average content relevance: {avg_relevance:.1f}%")
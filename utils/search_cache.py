@@ -0,0 +1,83 @@
+"""
+On-disk cache of search results for Repository Analysis to MCP Server system.
+
+Web and YouTube result lists are stored in SQLite keyed by source and
+normalized query, so a repeated search in a later run is a local read
+instead of a round of search engine or yt-dlp requests.
+"""
+
+import os
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+from .sqlite_cache import SQLiteCache, SharedCache
+
+# Default location, overridable with POCKETFLOW_SEARCH_CACHE
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pocketflow", "search_cache.sqlite3")
+
+# Search results are reused from disk for a day
+DEFAULT_TTL = 86400
+
+class SearchCache(SQLiteCache):
+    """
+    SQLite-backed cache of search result lists.
+
+    Each entry keeps the number of results that were asked for, so callers
+    can tell whether it also answers a request for more results.
+    """
+
+    label = "Search cache"
+    table = "searches"
+    key_columns = ("source", "query")
+    columns = "fetched INTEGER NOT NULL, results TEXT NOT NULL"
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays valid after it was stored
+        """
+        super().__init__(path, ttl)
+
+    def get(self, source: str, query: str) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Look up cached search results.
+
+        Args:
+            source: "web" or "yt"
+            query: Normalized search query
+
+        Returns:
+            Tuple of (number of results asked for, results), or None if
+            missing, expired or unreadable
+        """
+        return self._get((source, query), "fetched, results",
+                         lambda row: (row[0], json.loads(row[1])), query)
+
+    def set(self, source: str, query: str, fetched: int, results: List[Dict[str, Any]]) -> None:
+        """
+        Store search results.
+
+        Args:
+            source: "web" or "yt"
+            query: Normalized search query
+            fetched: Number of results that were asked for
+            results: Search result dictionaries
+        """
+        self._put((source, query), lambda: {"fetched": fetched, "results": json.dumps(results)}, query)
+
+_SEARCH_CACHE = SharedCache(SearchCache, "POCKETFLOW_SEARCH_CACHE", DEFAULT_CACHE_PATH)
+
+def get_search_cache() -> Optional[SearchCache]:
+    """
+    Get the shared search cache, opening it on first use.
+
+    Set POCKETFLOW_SEARCH_CACHE to a file path to relocate the cache, or to
+    an empty string to disable it.
+
+    Returns:
+        Shared SearchCache, or None if disabled or it could not be opened
+    """
+    return _SEARCH_CACHE.get()
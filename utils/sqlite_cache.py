@@ -0,0 +1,207 @@
+"""
+Shared SQLite plumbing for the on-disk caches of Repository Analysis to MCP Server system.
+
+The scrape, search and LLM caches differ only in their columns and payload
+encoding; connection handling, expiry and error handling live here.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Callable, Dict, Generic, Optional, Sequence, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+class SQLiteCache:
+    """
+    Base class of the on-disk caches: one SQLite table keyed by key_columns.
+
+    Uses WAL mode and one connection per thread, so concurrent workers can
+    read while another writes. Every failure is logged and treated as a miss
+    (reads) or a no-op (writes); an entry that cannot be decoded is deleted.
+    Subclasses set label, table, key_columns and columns, and keep only their
+    payload encoding.
+    """
+
+    # Name used in log messages
+    label = "Cache"
+    table = ""
+    key_columns: Tuple[str, ...] = ()
+    # Column definitions besides the key (and expires_at when a TTL is set)
+    columns = ""
+    # Raised when a stored entry cannot be decoded
+    decode_errors: Tuple[Type[Exception], ...] = (ValueError, TypeError, KeyError, IndexError)
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Open (and create if needed) the cache database, dropping expired entries.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays valid after it was stored, or None
+                if entries never expire
+        """
+        self.path = path
+        self.ttl = ttl
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        key_defs = ", ".join(f"{column} TEXT NOT NULL" for column in self.key_columns)
+        expiry = "expires_at REAL NOT NULL, " if ttl is not None else ""
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                     f"{key_defs}, {expiry}{self.columns}, "
+                     f"PRIMARY KEY ({', '.join(self.key_columns)}))")
+        if ttl is not None:
+            conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _key_clause(self) -> str:
+        """WHERE clause matching one entry by its key columns."""
+        return " AND ".join(f"{column} = ?" for column in self.key_columns)
+
+    def _write(self, sql: str, params: Sequence[Any], subject: str, action: str = "write") -> None:
+        """
+        Run and commit a statement, logging any database error.
+
+        Args:
+            sql: Statement to run
+            params: Statement parameters
+            subject: What the statement is about, for the log message
+            action: Kind of statement, for the log message
+        """
+        try:
+            conn = self._connect()
+            conn.execute(sql, params)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("%s %s failed for %s: %s", self.label, action, subject, e)
+
+    def _get(self, key: Tuple[Any, ...], columns: str, decode: Callable[[tuple], Any],
+             subject: str) -> Optional[Any]:
+        """
+        Look up and decode an unexpired entry.
+
+        Args:
+            key: Values of key_columns
+            columns: Columns to select, passed to decode as a row tuple
+            decode: Turns the row into the cached value
+            subject: What is looked up, for log messages
+
+        Returns:
+            The decoded value, or None if missing, expired or unreadable
+        """
+        sql = f"SELECT {columns} FROM {self.table} WHERE {self._key_clause()}"
+        params = tuple(key)
+        if self.ttl is not None:
+            sql += " AND expires_at > ?"
+            params += (time.time(),)
+        try:
+            row = self._connect().execute(sql, params).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("%s read failed for %s: %s", self.label, subject, e)
+            return None
+        if row is None:
+            return None
+
+        try:
+            return decode(row)
+        except self.decode_errors as e:
+            # A corrupt entry would fail on every lookup, so drop it and count a miss
+            logger.warning("%s entry for %s is corrupt, discarding it: %s", self.label, subject, e)
+            self._delete(key, subject)
+            return None
+
+    def _put(self, key: Tuple[Any, ...], encode: Callable[[], Dict[str, Any]], subject: str) -> None:
+        """
+        Encode and store an entry, replacing any previous one.
+
+        Args:
+            key: Values of key_columns
+            encode: Returns the column values to store; encoding errors are
+                logged like database errors
+            subject: What is stored, for log messages
+        """
+        try:
+            values = encode()
+        except (TypeError, ValueError) as e:
+            logger.warning("%s write failed for %s: %s", self.label, subject, e)
+            return
+        if self.ttl is not None:
+            values["expires_at"] = time.time() + self.ttl
+
+        names = list(self.key_columns) + list(values)
+        self._write(
+            f"INSERT OR REPLACE INTO {self.table} ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' * len(names))})",
+            tuple(key) + tuple(values.values()), subject
+        )
+
+    def _delete(self, key: Tuple[Any, ...], subject: str) -> None:
+        """Remove one entry."""
+        self._write(f"DELETE FROM {self.table} WHERE {self._key_clause()}", tuple(key), subject, "delete")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._write(f"DELETE FROM {self.table}", (), "all entries", "clear")
+
+CacheType = TypeVar("CacheType", bound=SQLiteCache)
+
+class SharedCache(Generic[CacheType]):
+    """
+    Process-wide cache instance, opened on first use.
+
+    The environment variable relocates the database, or disables the cache
+    when set to an empty string. A cache that cannot be opened is disabled
+    for the rest of the process.
+    """
+
+    def __init__(self, cache_class: Type[CacheType], env_var: str, default_path: str):
+        """
+        Args:
+            cache_class: SQLiteCache subclass to open, called with the path
+            env_var: Environment variable overriding the path
+            default_path: Path used when env_var is unset
+        """
+        self.cache_class = cache_class
+        self.env_var = env_var
+        self.default_path = default_path
+        self._cache: Optional[CacheType] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[CacheType]:
+        """
+        Get the shared cache, opening it on first use.
+
+        Returns:
+            The cache, or None if disabled or it could not be opened
+        """
+        if self._cache is None and not self._disabled:
+            with self._lock:
+                if self._cache is None and not self._disabled:
+                    path = os.environ.get(self.env_var, self.default_path)
+                    if not path:
+                        self._disabled = True
+                        return None
+                    try:
+                        self._cache = self.cache_class(path)
+                    except (sqlite3.Error, OSError) as e:
+                        logger.warning("%s unavailable, continuing without it: %s", self.cache_class.label, e)
+                        self._disabled = True
+        return self._cache